@@ -1,12 +1,22 @@
 """A CLI entry point for caic-python - meant for testing."""
 
 import asyncio
-from pprint import pprint
+import datetime
 import sys
 
 from . import __version__
+from . import models
 from ._args import MAIN_PARSER
+from ._writers import open_output, WRITERS
 from .client import CaicClient
+from .store import Store
+from .sync import sync, TARGETS
+
+
+MODELS = {
+    "avy-forecast": (models.AvalancheForecast, models.RegionalDiscussionForecast),
+}
+"""The models of commands that write more than one kind of record."""
 
 
 async def main():
@@ -18,45 +28,78 @@ async def main():
         print(f"caic-python v{__version__}")
         sys.exit(0)
 
+    if args.command is None:
+        MAIN_PARSER.print_help()
+        sys.exit(1)
+
     client = CaicClient()
 
-    match args.command:
-        case "avy-obs":
-            obs = await client.avy_obs(args.start.isoformat(), args.end.isoformat())
-            for ob in obs:
-                print()
-                pprint(ob.model_dump(exclude_none=True), indent=2)
-                print()
-        case "field-reports":
-            obs = await client.field_reports(args.start.isoformat(), args.end.isoformat())
-            for ob in obs:
-                print()
-                pprint(ob.model_dump(exclude_none=True), indent=2)
-                print()
-        case "field-report":
-            obs = await client.field_report(args.id)
-            pprint(obs.model_dump(exclude_none=True), indent=2)
-        case "snowpack-observation":
-            obs = await client.snowpack_observation(args.id)
-            pprint(obs.model_dump(exclude_none=True), indent=2)
-        case "avalanche-observation":
-            obs = await client.avy_observation(args.id)
-            pprint(obs.model_dump(exclude_none=True), indent=2)
-        case "weather-observation":
-            obs = await client.weather_observation(args.id)
-            pprint(obs.model_dump(exclude_none=True), indent=2)
-        case "bc-zone":
-            obs = await client.bc_zone(args.id)
-            pprint(obs.model_dump(exclude_none=True), indent=2)
-        case "highway-zone":
-            obs = await client.highway_zone(args.id)
-            pprint(obs.model_dump(exclude_none=True), indent=2)
-        case "avy-forecast":
-            obs = await client.avy_forecast(args.date)
-            for ob in obs:
-                pprint(ob.model_dump(exclude_none=True), indent=2)
-
-    await client.close()
+    if args.command == "sync":
+        with Store(args.db) as store:
+            try:
+                results = await sync(
+                    client,
+                    store,
+                    targets=args.target or tuple(TARGETS),
+                    overlap=datetime.timedelta(minutes=args.overlap),
+                    since=args.since,
+                )
+            finally:
+                await client.close()
+        for result in results:
+            print(
+                f"{result.target}: {result.fetched} fetched, {result.stored} stored, "
+                f"watermark {result.watermark}"
+                + ("" if result.complete else " (incomplete, see the log)")
+            )
+        return
+
+    writer = WRITERS[args.format](
+        open_output(args.output, args.gzip), MODELS.get(args.command, ())
+    )
+
+    try:
+        match args.command:
+            case "avy-obs":
+                async for ob in client.iter_avy_obs(
+                    args.start.isoformat(), args.end.isoformat()
+                ):
+                    writer.write(ob)
+            case "field-reports":
+                async for ob in client.iter_field_reports(
+                    args.start.isoformat(), args.end.isoformat()
+                ):
+                    writer.write(ob)
+            case "field-report":
+                obs = await client.field_report(args.id)
+                if obs is not None:
+                    writer.write(obs)
+            case "snowpack-observation":
+                obs = await client.snowpack_observation(args.id)
+                if obs is not None:
+                    writer.write(obs)
+            case "avalanche-observation":
+                obs = await client.avy_observation(args.id)
+                if obs is not None:
+                    writer.write(obs)
+            case "weather-observation":
+                obs = await client.weather_observation(args.id)
+                if obs is not None:
+                    writer.write(obs)
+            case "bc-zone":
+                obs = await client.bc_zone(args.id)
+                if obs is not None:
+                    writer.write(obs)
+            case "highway-zone":
+                obs = await client.highway_zone(args.id)
+                if obs is not None:
+                    writer.write(obs)
+            case "avy-forecast":
+                for ob in await client.avy_forecast(args.date):
+                    writer.write(ob)
+    finally:
+        writer.close()
+        await client.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -5,6 +5,8 @@ import datetime
 
 import dateutil.parser
 
+from ._writers import FORMATS
+
 
 TIME_PARSER = argparse.ArgumentParser(add_help=False)
 TIME_PARSER.add_argument(
@@ -29,6 +31,27 @@ TIME_PARSER.add_argument(
     default=None,
 )
 
+OUTPUT_PARSER = argparse.ArgumentParser(add_help=False)
+OUTPUT_PARSER.add_argument(
+    "-f",
+    "--format",
+    help="The output format (by default, pretty).",
+    choices=FORMATS,
+    default="pretty",
+)
+OUTPUT_PARSER.add_argument(
+    "-o",
+    "--output",
+    help="Write to this file instead of stdout ('-').",
+    default=None,
+)
+OUTPUT_PARSER.add_argument(
+    "-z",
+    "--gzip",
+    help="Gzip the output - always done for '--output' paths ending in '.gz'.",
+    action="store_true",
+)
+
 ID_PARSER = argparse.ArgumentParser(add_help=False)
 ID_PARSER.add_argument(
     "id", help="The ID (or slug if applicable) of the object to query for."
@@ -51,46 +74,49 @@ MAIN_PARSER.add_argument(
 SUBPARSER = MAIN_PARSER.add_subparsers(dest="command", title="Commands")
 
 AVY_OBS_PARSER = SUBPARSER.add_parser(
-    "avy-obs", description="Query avalanche observations.", parents=[TIME_PARSER]
+    "avy-obs",
+    description="Query avalanche observations.",
+    parents=[TIME_PARSER, OUTPUT_PARSER],
 )
 FIELD_REPORTS_PARSER = SUBPARSER.add_parser(
     "field-reports",
     description="Query field (or observation) report.",
-    parents=[TIME_PARSER],
+    parents=[TIME_PARSER, OUTPUT_PARSER],
 )
 FIELD_REPORT_PARSER = SUBPARSER.add_parser(
     "field-report",
     description="Query for a single field (or observation) report.",
-    parents=[ID_PARSER],
+    parents=[ID_PARSER, OUTPUT_PARSER],
 )
 SNOWPACK_PARSER = SUBPARSER.add_parser(
     "snowpack-observation",
     description="Query for a single Snowpack Observation.",
-    parents=[ID_PARSER],
+    parents=[ID_PARSER, OUTPUT_PARSER],
 )
 AVALANCHE_PARSER = SUBPARSER.add_parser(
     "avalanche-observation",
     description="Query for a single Avalanche Observation.",
-    parents=[ID_PARSER],
+    parents=[ID_PARSER, OUTPUT_PARSER],
 )
 WEATHER_PARSER = SUBPARSER.add_parser(
     "weather-observation",
     description="Query for a single Weather Observation.",
-    parents=[ID_PARSER],
+    parents=[ID_PARSER, OUTPUT_PARSER],
 )
 BZONE_PARSER = SUBPARSER.add_parser(
     "bc-zone",
     description="Query for a single Backcountry Zone.",
-    parents=[ID_PARSER],
+    parents=[ID_PARSER, OUTPUT_PARSER],
 )
 HZONE_PARSER = SUBPARSER.add_parser(
     "highway-zone",
     description="Query for a single Highway Zone.",
-    parents=[ID_PARSER],
+    parents=[ID_PARSER, OUTPUT_PARSER],
 )
 AVYFORECAST_PARSER = SUBPARSER.add_parser(
     "avy-forecast",
     description="Query for a the avalanche forecast on the given date.",
+    parents=[OUTPUT_PARSER],
 )
 AVYFORECAST_PARSER.add_argument(
     "-d",
@@ -99,3 +125,33 @@ AVYFORECAST_PARSER.add_argument(
     type=dateutil.parser.parse,
     default=datetime.datetime.now(),
 )
+SYNC_PARSER = SUBPARSER.add_parser(
+    "sync",
+    description="Sync a local copy of field reports and avalanche observations.",
+)
+SYNC_PARSER.add_argument(
+    "--db",
+    help="The SQLite database to sync to (by default, caic.db).",
+    default="caic.db",
+)
+SYNC_PARSER.add_argument(
+    "-t",
+    "--target",
+    help="A target to sync, may be given more than once (by default, all of them).",
+    choices=("field-reports",),
+    action="append",
+    default=None,
+)
+SYNC_PARSER.add_argument(
+    "--overlap",
+    help="Minutes before the last sync to start from (by default, 15).",
+    type=float,
+    default=15.0,
+)
+SYNC_PARSER.add_argument(
+    "-s",
+    "--since",
+    help="Where to start the first sync (by default, the start of the season).",
+    type=dateutil.parser.parse,
+    default=None,
+)
@@ -0,0 +1,179 @@
+"""Record writers for the output formats of ``__main__``."""
+
+import abc
+import csv
+import gzip
+import io
+import json
+from pprint import pprint
+import sys
+import typing
+
+import pydantic
+
+
+FORMATS = ("pretty", "ndjson", "csv", "json")
+"""The output formats of the CLI."""
+
+BUFFER_SIZE = 1 << 16
+"""The write buffer size of output files, in bytes."""
+
+
+def open_output(path: str | None, compress: bool = False) -> typing.TextIO:
+    """
+    Open a buffered text stream to write records to.
+
+    Parameters
+    ----------
+    path : str | None
+        The file to write to, None or ``-`` for stdout.
+    compress : bool, optional
+        Gzip the output, by default False. Always done for ``.gz`` paths.
+
+    Returns
+    -------
+    typing.TextIO
+        The stream, to be closed by the caller.
+    """
+
+    to_stdout = path in (None, "-")
+    compress = compress or (not to_stdout and path.endswith(".gz"))
+
+    if to_stdout:
+        if not compress:
+            return sys.stdout
+        raw = gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb")
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+
+    return open(path, "w", encoding="utf-8", newline="", buffering=BUFFER_SIZE)
+
+
+class RecordWriter(abc.ABC):
+    """Writes ``pydantic`` objects to a stream, one at a time.
+
+    Parameters
+    ----------
+    stream : typing.TextIO
+        The stream to write to.
+    models : typing.Sequence[type[pydantic.BaseModel]], optional
+        The models of the records to be written, if known up front.
+    """
+
+    def __init__(
+        self,
+        stream: typing.TextIO,
+        models: typing.Sequence[type[pydantic.BaseModel]] = (),
+    ) -> None:
+        self.stream = stream
+        self.models = tuple(models)
+
+    @abc.abstractmethod
+    def write(self, obj: pydantic.BaseModel) -> None:
+        """Write a single record."""
+
+    def close(self) -> None:
+        """Finish the output and close the stream (unless it is stdout)."""
+
+        if self.stream is sys.stdout:
+            self.stream.flush()
+        else:
+            self.stream.close()
+
+
+class PrettyWriter(RecordWriter):
+    """Pretty prints each record, separated by blank lines."""
+
+    def write(self, obj: pydantic.BaseModel) -> None:
+        self.stream.write("\n")
+        pprint(obj.model_dump(exclude_none=True), stream=self.stream, indent=2)
+        self.stream.write("\n")
+
+
+class NdjsonWriter(RecordWriter):
+    """Writes each record as a line of JSON."""
+
+    def write(self, obj: pydantic.BaseModel) -> None:
+        self.stream.write(obj.model_dump_json(exclude_none=True))
+        self.stream.write("\n")
+
+
+class JsonWriter(RecordWriter):
+    """Writes the records as a single JSON array."""
+
+    def __init__(
+        self,
+        stream: typing.TextIO,
+        models: typing.Sequence[type[pydantic.BaseModel]] = (),
+    ) -> None:
+        super().__init__(stream, models)
+        self.count = 0
+
+    def write(self, obj: pydantic.BaseModel) -> None:
+        self.stream.write(",\n" if self.count else "[\n")
+        self.stream.write(obj.model_dump_json(exclude_none=True))
+        self.count += 1
+
+    def close(self) -> None:
+        self.stream.write("\n]\n" if self.count else "[]\n")
+        super().close()
+
+
+class CsvWriter(RecordWriter):
+    """Writes the records as CSV rows, nested objects as JSON strings.
+
+    The columns are the union of the fields of ``models``, in order, or the
+    fields of the first record's model. A record missing a column leaves it
+    empty, and a record with a field that isn't a column is rejected.
+    """
+
+    def __init__(
+        self,
+        stream: typing.TextIO,
+        models: typing.Sequence[type[pydantic.BaseModel]] = (),
+    ) -> None:
+        super().__init__(stream, models)
+        self.writer: csv.DictWriter | None = None
+        self.checked: set[type[pydantic.BaseModel]] = set()
+
+    def write(self, obj: pydantic.BaseModel) -> None:
+        model = type(obj)
+
+        if self.writer is None:
+            fieldnames = dict.fromkeys(
+                field for each in self.models or (model,) for field in each.model_fields
+            )
+            self.writer = csv.DictWriter(
+                self.stream,
+                fieldnames=list(fieldnames),
+                restval="",
+                extrasaction="raise",
+            )
+            self.writer.writeheader()
+
+        if model not in self.checked:
+            extra = set(model.model_fields).difference(self.writer.fieldnames)
+            if extra:
+                raise ValueError(
+                    f"Can't write a {model.__name__} as CSV, the columns lack its "
+                    f"fields {sorted(extra)}."
+                )
+            self.checked.add(model)
+
+        row = obj.model_dump(mode="json")
+        for key, value in row.items():
+            if isinstance(value, (dict, list)):
+                row[key] = json.dumps(value)
+
+        self.writer.writerow(row)
+
+
+WRITERS: dict[str, type[RecordWriter]] = {
+    "pretty": PrettyWriter,
+    "ndjson": NdjsonWriter,
+    "csv": CsvWriter,
+    "json": JsonWriter,
+}
+"""The ``RecordWriter`` of each output format."""
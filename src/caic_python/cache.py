@@ -0,0 +1,453 @@
+"""Caches for CAIC API responses."""
+
+import asyncio
+import collections
+import datetime
+import os
+import sqlite3
+import threading
+import time
+import typing
+from urllib.parse import parse_qs, urlencode, urlsplit
+import zlib
+
+import dateutil.parser
+
+
+CACHE_BUSTING_PARAMS = ("t",)
+"""URL params that only exist to defeat caches, like the ``t`` timestamp that
+``avy_obs`` adds. They are left out of cache keys."""
+
+
+def cache_key(
+    url: str,
+    params: typing.Mapping | list | None = None,
+    ignore_params: typing.Iterable[str] = CACHE_BUSTING_PARAMS,
+) -> str:
+    """
+    Build a stable cache key from a URL and its params.
+
+    Params are sorted, so the same query always gets the same key,
+    and ``ignore_params`` are dropped.
+
+    Parameters
+    ----------
+    url : str
+        The full URL of the request.
+    params : typing.Mapping | list | None, optional
+        The URL params of the request, as a mapping or a list of pairs,
+        by default None.
+    ignore_params : typing.Iterable[str], optional
+        Params to leave out of the key, by default ``CACHE_BUSTING_PARAMS``.
+
+    Returns
+    -------
+    str
+        The URL, with the normalized params as its query string.
+    """
+
+    if not params:
+        return url
+
+    items = params.items() if isinstance(params, typing.Mapping) else params
+    ignore_params = set(ignore_params)
+    query = sorted(
+        (str(key), str(value)) for key, value in items if key not in ignore_params
+    )
+
+    return f"{url}?{urlencode(query)}" if query else url
+
+
+class CachedResponse(typing.NamedTuple):
+    """A cached response body and the validators it was served with."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """The headers that ask the server to only send the body if it changed."""
+
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class HttpCache:
+    """A bounded, in-memory cache of responses for conditional requests.
+
+    Responses with an ``ETag`` or ``Last-Modified`` header are kept. The next
+    request for the same key sends ``If-None-Match``/``If-Modified-Since``,
+    and a ``304 Not Modified`` is answered with the cached body. The least
+    recently used response is dropped once ``max_entries`` is reached.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        The maximum number of responses to keep, by default 512.
+    ignore_params : typing.Iterable[str], optional
+        URL params left out of cache keys, by default ``CACHE_BUSTING_PARAMS``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ignore_params: typing.Iterable[str] = CACHE_BUSTING_PARAMS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ignore_params = tuple(ignore_params)
+        self._entries: collections.OrderedDict[str, CachedResponse] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, url: str, params: typing.Mapping | list | None = None) -> str:
+        """The cache key of a request - see ``cache_key``."""
+
+        return cache_key(url, params, self.ignore_params)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response, marking it as recently used."""
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def store(
+        self, key: str, headers: typing.Mapping[str, str], body: bytes
+    ) -> CachedResponse | None:
+        """
+        Cache a response body if its headers include a validator.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the request.
+        headers : typing.Mapping[str, str]
+            The response headers.
+        body : bytes
+            The raw response body.
+
+        Returns
+        -------
+        CachedResponse | None
+            The cached response, or None if it had no validators.
+        """
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        if etag is None and last_modified is None:
+            self._entries.pop(key, None)
+            return None
+
+        entry = CachedResponse(body, etag, last_modified)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+
+        self._entries.clear()
+
+
+DEFAULT_TTLS = {"/api/v2/zones": 24 * 60 * 60.0}
+"""Per-endpoint TTLs, in seconds, that ``TTLCache`` uses by default.
+Zones hardly ever change, so they are kept for a day."""
+
+
+class TTLCache:
+    """A bounded, in-memory LRU cache whose entries expire.
+
+    Entries are grouped by a namespace - the API endpoint for
+    ``CaicClient`` - which decides their TTL. ``hits`` and ``misses``
+    count lookups since the cache was made.
+
+    Cached objects are shared between callers, so treat them as read-only.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        The maximum number of entries to keep, by default 4096.
+    ttl : float, optional
+        The seconds an entry is kept for, unless its namespace is in
+        ``ttls``. By default 300.
+    ttls : typing.Mapping[str, float] | None, optional
+        The TTL, in seconds, of specific namespaces. By default ``DEFAULT_TTLS``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl: float = 300.0,
+        ttls: typing.Mapping[str, float] | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[
+            tuple[str, typing.Hashable], tuple[float, typing.Any]
+        ] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, namespace: str, key: typing.Hashable) -> typing.Any | None:
+        """Get an unexpired entry, or None, marking it as recently used."""
+
+        entry = self._entries.get((namespace, key))
+
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[(namespace, key)]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end((namespace, key))
+        self.hits += 1
+
+        return entry[1]
+
+    def store(self, namespace: str, key: typing.Hashable, value: typing.Any) -> None:
+        """Cache ``value`` for its namespace's TTL, dropping the LRU entry if full."""
+
+        expires = time.monotonic() + self.ttls.get(namespace, self.ttl)
+        self._entries[(namespace, key)] = (expires, value)
+        self._entries.move_to_end((namespace, key))
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self, namespace: str | None = None, key: typing.Hashable | None = None
+    ) -> int:
+        """
+        Drop cached entries.
+
+        Parameters
+        ----------
+        namespace : str | None, optional
+            Only drop entries in this namespace, by default None (all of them).
+        key : typing.Hashable | None, optional
+            Only drop entries with this key, by default None (all of them).
+
+        Returns
+        -------
+        int
+            The number of entries dropped.
+        """
+
+        dropped = [
+            cached
+            for cached in self._entries
+            if (namespace is None or cached[0] == namespace)
+            and (key is None or cached[1] == key)
+        ]
+
+        for cached in dropped:
+            del self._entries[cached]
+
+        return len(dropped)
+
+
+RANGE_END_PARAMS = ("observed_before", "r[observed_at_lteq]")
+"""URL params that hold the end of a query's time range."""
+
+FORECAST_DAYS = datetime.timedelta(days=3)
+"""How long after its date a forecast covers - the date + the following two days."""
+
+
+class SqliteCache:
+    """A persistent cache of historical responses, backed by SQLite.
+
+    Only queries whose time range closed more than ``grace`` ago are cached,
+    as their results can no longer change: searches whose end param (see
+    ``RANGE_END_PARAMS``) is in the past, and forecasts for past dates.
+    Everything else always goes to the network. Bodies are stored
+    zlib-compressed, keyed by ``cache_key``. Clients ``evict`` a body that
+    fails validation, so it is requested again next time.
+
+    The same file may be used by ``CaicClient`` and ``SyncCaicClient``.
+    ``CaicClient`` uses the ``a*`` methods, which run the blocking SQLite
+    calls in a worker thread rather than in the event loop.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The SQLite database file, created if needed.
+    grace : datetime.timedelta, optional
+        How long after a range closes its results may still change,
+        by default 2 days.
+    ignore_params : typing.Iterable[str], optional
+        URL params left out of cache keys, by default ``CACHE_BUSTING_PARAMS``.
+    max_age : datetime.timedelta | None, optional
+        Ignore bodies stored longer ago than this, None to keep them until
+        evicted. By default None.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        grace: datetime.timedelta = datetime.timedelta(days=2),
+        ignore_params: typing.Iterable[str] = CACHE_BUSTING_PARAMS,
+        max_age: datetime.timedelta | None = None,
+    ) -> None:
+        self.grace = grace
+        self.ignore_params = tuple(ignore_params)
+        self.max_age = max_age
+        # Shared with worker threads (see the ``a*`` methods), one at a time.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, body BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def key(self, url: str, params: typing.Mapping | list | None = None) -> str:
+        """The cache key of a request - see ``cache_key``."""
+
+        return cache_key(url, params, self.ignore_params)
+
+    def is_immutable(
+        self,
+        params: typing.Mapping | list | None,
+        now: datetime.datetime | None = None,
+    ) -> bool:
+        """
+        Whether a request's results can no longer change.
+
+        Parameters
+        ----------
+        params : typing.Mapping | list | None
+            The URL params of the request.
+        now : datetime.datetime | None, optional
+            The current (aware) time, by default ``datetime.datetime.now``.
+
+        Returns
+        -------
+        bool
+            True if the request covers a time range that closed more than
+            ``grace`` ago.
+        """
+
+        if not params:
+            return False
+
+        items = dict(params.items() if isinstance(params, typing.Mapping) else params)
+        end = None
+
+        for param in RANGE_END_PARAMS:
+            if items.get(param):
+                end = _parse_utc(items[param])
+                break
+        else:
+            proxy_uri = str(items.get("_api_proxy_uri", ""))
+            proxy_params = parse_qs(urlsplit(proxy_uri).query)
+            if proxy_params.get("datetime"):
+                start = _parse_utc(proxy_params["datetime"][0])
+                end = start + FORECAST_DAYS if start is not None else None
+
+        if end is None:
+            return False
+
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        return end + self.grace < now
+
+    def get(self, key: str) -> bytes | None:
+        """Get a cached response body, or None if missing or older than ``max_age``."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        body, stored_at = row
+        if self.max_age is not None:
+            if time.time() - stored_at > self.max_age.total_seconds():
+                return None
+
+        return zlib.decompress(body)
+
+    def store(self, key: str, body: bytes) -> None:
+        """Cache a response body, replacing any older one."""
+
+        body = zlib.compress(body)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, body, time.time()),
+            )
+            self._conn.commit()
+
+    def evict(self, key: str) -> None:
+        """Drop a cached response body, eg. one that failed validation."""
+
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    async def aget(self, key: str) -> bytes | None:
+        """``get``, in a worker thread."""
+
+        return await asyncio.to_thread(self.get, key)
+
+    async def astore(self, key: str, body: bytes) -> None:
+        """``store``, in a worker thread."""
+
+        await asyncio.to_thread(self.store, key, body)
+
+    async def aevict(self, key: str) -> None:
+        """``evict``, in a worker thread."""
+
+        await asyncio.to_thread(self.evict, key)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._lock:
+            self._conn.close()
+
+
+def _parse_utc(value: str) -> datetime.datetime | None:
+    """Parse a date string, assuming UTC if it has no timezone."""
+
+    try:
+        parsed = dateutil.parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+
+    return parsed
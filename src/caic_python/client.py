@@ -53,19 +53,38 @@ Example Weather Station Tables - would require webpage scraping, but may be help
 
 """
 
-from json import JSONDecodeError
+import asyncio
+import contextlib
+import datetime
+import functools
+import json
 import time
 import typing
 
 import requests
 import aiohttp
 import aiohttp.http
+import dateutil.parser
 import pydantic
 
 from . import __version__
+from . import cache
 from . import errors
 from . import LOGGER
 from . import models
+from . import ratelimit
+from . import retry
+from . import utils
+
+
+SHARD_SIZES = {
+    "day": datetime.timedelta(days=1),
+    "week": datetime.timedelta(weeks=1),
+}
+"""The named window sizes that sharded queries can be split into."""
+
+MIN_ADAPTIVE_SHARD = datetime.timedelta(hours=6)
+"""Adaptive sharding will not split a window shorter than this."""
 
 
 def list_to_plus_args(argslist: list) -> str:
@@ -109,25 +128,348 @@ class ProxyEndpoints:
     DATA: str = "/api-proxy/caic_data_api"
 
 
+def _avy_obs_query(
+    start: str, end: str, ver1: bool, fields: typing.Iterable[str] | None = None
+) -> tuple[str, pydantic.BaseModel, dict]:
+    """Build the endpoint, response model and params of an avalanche obs query."""
+
+    model = models.AvalancheObservation
+    if fields is not None:
+        model = models.projection(model, fields)
+
+    if ver1:
+        endpoint = CaicApiEndpoints.V1_AVY_OBS
+        if fields is None:
+            model = models.V1AvyResponse
+        else:
+            model = models.v1_avy_response(model)
+    else:
+        endpoint = CaicApiEndpoints.AVY_OBS
+
+    params = {
+        "observed_after": start,
+        "observed_before": end,
+        "t": str(int(time.time())),
+    }
+
+    return endpoint, model, params
+
+
+CHANGES_ENDPOINTS = (CaicApiEndpoints.OBS_REPORT,)
+"""The endpoints that take ransack ``updated_at`` filters, see ``iter_changes``.
+
+``AVY_OBS`` only filters by ``observed_after``/``observed_before``. Its
+observations still change along with the field reports they're nested in.
+"""
+
+
+def _changes_query(since: str, until: str | None = None) -> dict:
+    """Build the params of a query for records changed in ``[since, until]``."""
+
+    params = {
+        "r[updated_at_gteq]": since,
+        "r[updated_at_lteq]": until,
+        "r[sorts][]": "updated_at+asc",
+        "t": str(int(time.time())),
+    }
+
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def _field_reports_model(
+    lazy: bool, fields: typing.Iterable[str] | None
+) -> pydantic.BaseModel:
+    """Pick the model of a field reports search, see ``field_reports``."""
+
+    if fields is not None:
+        return models.projection(models.FieldReport, fields)
+
+    return models.LazyFieldReport if lazy else models.FieldReport
+
+
+def _field_reports_query(  # pylint: disable=R0913
+    start: str,
+    end: str,
+    bc_zones: list[str],
+    cracking_obs: list[str],
+    collapsing_obs: list[str],
+    query: str,
+    avy_seen: bool | None,
+    page_limit: int,
+) -> dict:
+    """Build the params of a field reports search.
+
+    Raises
+    ------
+    ValueError
+        If ``page_limit`` is less than 1.
+    """
+
+    if page_limit <= 0:
+        raise ValueError("A page_limit MUST be set for field_reports!")
+
+    params = {
+        "r[backcountry_zone_title_in][]": list_to_plus_args(bc_zones),
+        "r[snowpack_observations_cracking_in]": list_to_plus_args(cracking_obs),
+        "r[snowpack_observations_collapsing_in][]": list_to_plus_args(
+            collapsing_obs
+        ),
+        "q": query,
+        "r[saw_avalanche_eq]": avy_seen,
+        "r[observed_at_gteq]": start,
+        "r[observed_at_lteq]": end,
+        "r[sorts][]": "observed_at+desc",  # We'll hard code this.
+    }
+
+    # Sanitize params
+    return {k: v for k, v in params.items() if v not in (None, "")}
+
+
+Loads = typing.Callable[[bytes], typing.Any]
+"""A JSON decoder that takes a raw response body, like ``json.loads`` or
+``orjson.loads``."""
+
+
+class InvalidItem(typing.NamedTuple):
+    """An item of a page that failed validation, see ``on_invalid``."""
+
+    endpoint: str
+    page: int
+    raw: typing.Any
+    error: pydantic.ValidationError
+
+
+OnInvalid = typing.Callable[[InvalidItem], None]
+"""A callback that receives each ``InvalidItem`` of a tolerant pagination."""
+
+
+@functools.cache
+def _type_adapter(type_: typing.Any) -> pydantic.TypeAdapter:
+    """A ``pydantic.TypeAdapter`` for ``type_``, built once and reused."""
+
+    return pydantic.TypeAdapter(type_)
+
+
+def _validate_forecasts(data: typing.Any) -> tuple[list[models.Forecast], bool]:
+    """
+    Validate the forecasts of a decoded ``avy_forecast`` response one by one.
+
+    Returns
+    -------
+    tuple[list[models.Forecast], bool]
+        The valid forecasts, and whether every item was valid. Invalid items
+        are logged and skipped.
+    """
+
+    if not isinstance(data, list):
+        LOGGER.error("Unexpected forecast response: %s", str(data)[:200])
+        return [], False
+
+    adapter = _type_adapter(models.Forecast)
+    forecasts = []
+    valid = True
+
+    for item in data:
+        try:
+            forecasts.append(adapter.validate_python(item))
+        except pydantic.ValidationError as err:
+            LOGGER.error("Skipping an invalid forecast: %s", str(err))
+            valid = False
+
+    return forecasts, valid
+
+
+def _page_params(page: int, per: int, params: typing.Mapping | None) -> dict:
+    """The params of a single page of a paginated query.
+
+    A copy, so that concurrent pages never share (and overwrite) a params dict.
+    """
+
+    params = dict(params) if params else {}
+    params["per"] = per
+    params["page"] = page
+
+    return params
+
+
+def _proxy_params(proxy_uri: str, proxy_params: typing.Mapping) -> dict:
+    """The params of a request to the API proxy for ``proxy_uri``."""
+
+    proxy_params_str = "&".join([f"{k}={v}" for k, v in proxy_params.items()])
+
+    return {"_api_proxy_uri": f"{proxy_uri}?{proxy_params_str}"}
+
+
+class _Page(typing.NamedTuple):
+    """A single validated page from a paginated CAIC API endpoint."""
+
+    number: int
+    items: list[pydantic.BaseModel]
+    count: int
+    total_pages: int | None
+
+
+class _RetryBudget:
+    """The retries left for a single pagination, shared by all of its pages."""
+
+    def __init__(self, total: int) -> None:
+        self.remaining = total
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether there are no retries left."""
+        return self.remaining <= 0
+
+    def spend(self) -> bool:
+        """Use up one retry, returning False if that exhausted the budget."""
+        self.remaining -= 1
+        return not self.exhausted
+
+
 class CaicClient:
-    """An async HTTP client for the CAIC API(s)."""
+    """An async HTTP client for the CAIC API(s).
+
+    The connection pool and timeouts are configurable. When fanning out
+    requests (see ``concurrency``, ``read_ahead`` and ``shard_concurrency``),
+    size ``limit_per_host`` to at least the number of requests in flight so
+    they don't queue behind each other or open new connections.
+
+    Parameters
+    ----------
+    limit : int, optional
+        The total number of connections in the pool, 0 for no limit.
+        By default 100.
+    limit_per_host : int, optional
+        The number of connections to a single host, 0 for no limit.
+        By default 0.
+    keepalive_timeout : float, optional
+        Seconds to keep an idle connection open for reuse, by default 15.
+    ttl_dns_cache : int | None, optional
+        Seconds to cache DNS lookups for, None to cache them forever.
+        By default 10.
+    total_timeout : float | None, optional
+        Seconds a whole request (including reading the body) may take,
+        None to disable. By default 300.
+    connect_timeout : float | None, optional
+        Seconds that opening a new connection may take, None to disable.
+        By default 30.
+    read_timeout : float | None, optional
+        Seconds to wait for data between reads, None to disable.
+        By default None.
+    rate_limiter : ratelimit.RateLimiter | None, optional
+        Limits the rate and concurrency of every request this client makes,
+        and may be shared between clients. By default None, no limits.
+    retry_policy : retry.RetryPolicy | None, optional
+        How failed requests are retried, by default ``retry.RetryPolicy()``.
+    http_cache : cache.HttpCache | None, optional
+        Cache responses and revalidate them with conditional requests,
+        by default None.
+    id_cache : cache.TTLCache | None, optional
+        Cache the objects looked up by ID or slug (``field_report``,
+        ``bc_zone``, etc.) with per-endpoint TTLs. Use
+        ``id_cache.invalidate`` to drop entries early. By default None.
+    persistent_cache : cache.SqliteCache | None, optional
+        Keep the responses of historical queries on disk, across runs,
+        by default None.
+    coalesce : bool, optional
+        Have concurrent requests for the same URL and params share one
+        in-flight request, by default True.
+    loads : Loads, optional
+        Decodes response bodies, eg. ``orjson.loads`` for speed.
+        By default ``json.loads``.
+    validate_json : bool, optional
+        Validate API responses straight from their raw bytes, which is faster
+        and bypasses ``loads``. By default True.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: int | None = 10,
+        total_timeout: float | None = 300,
+        connect_timeout: float | None = 30,
+        read_timeout: float | None = None,
+        rate_limiter: ratelimit.RateLimiter | None = None,
+        retry_policy: retry.RetryPolicy | None = None,
+        http_cache: cache.HttpCache | None = None,
+        id_cache: cache.TTLCache | None = None,
+        persistent_cache: cache.SqliteCache | None = None,
+        coalesce: bool = True,
+        loads: Loads = json.loads,
+        validate_json: bool = True,
+    ) -> None:
+        self.loads = loads
+        self.validate_json = validate_json
+        self.rate_limiter = rate_limiter or ratelimit.RateLimiter()
+        self.retry_policy = retry_policy or retry.RetryPolicy()
+        self.http_cache = http_cache
+        self.id_cache = id_cache
+        self.persistent_cache = persistent_cache
+        self.coalesce = coalesce
+        self._in_flight: dict[str, asyncio.Future] = {}
         self.headers = {
             "User-Agent": f"{aiohttp.http.SERVER_SOFTWARE} caic-python/{__version__}"
         }
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=ttl_dns_cache,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                total=total_timeout,
+                sock_connect=connect_timeout,
+                sock_read=read_timeout,
+            ),
+        )
 
     async def close(self) -> None:
         """Close the underlying session."""
         await self.session.close()
 
+    async def warm_up(
+        self,
+        urls: typing.Iterable[str] = (CaicURLs.API, CaicURLs.HOME, CaicURLs.CLSC),
+        connections: int = 1,
+    ) -> None:
+        """Open pooled connections ahead of time, so later requests skip the handshakes.
+
+        Failures are logged and otherwise ignored, the connection will
+        just be opened by the first real request instead.
+
+        Parameters
+        ----------
+        urls : typing.Iterable[str], optional
+            The hosts to connect to, by default ``CaicURLs.API``,
+            ``CaicURLs.HOME`` and ``CaicURLs.CLSC``.
+        connections : int, optional
+            The number of connections to open to each host, by default 1.
+            Keep this within ``limit_per_host``.
+        """
+
+        async def connect(url: str) -> None:
+            try:
+                async with self.session.head(url) as resp:
+                    await resp.release()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                LOGGER.debug("Unable to warm up a connection to %s: %s", url, err)
+
+        await asyncio.gather(
+            *(connect(url) for url in urls for _ in range(connections))
+        )
+
     async def _get(self, url: str, params: dict | list | None = None) -> dict:
         """
         Get a URL using this client.
 
         Meant to be ``CaicURLs`` agnostic, so pass in a full URL.
 
+        Failed requests are retried according to ``self.retry_policy``.
+
         Parameters
         ----------
         url : str
@@ -139,56 +481,336 @@ class CaicClient:
         Returns
         -------
         dict
-            The return from ``aiohttp.ClientResponse.json`` if, this call, or
-            the HTTP request itself, did not throw an error.
+            The decoded JSON body (or the cached body, if the server says it
+            has not changed) if the HTTP request did not throw an error.
 
         Raises
         ------
         errors.CaicRequestException
             For common HTTP errors, a >400 response status,
-            an ``aiohttp.ClientError``, or a ``JSONDecodeError``.
+            an ``aiohttp.ClientError``, a timeout, or an error from ``self.loads``,
+            once the retry policy gives up.
         """
 
-        data = {}
+        return self._decode(await self._get_raw(url, params))
+
+    def _decode(self, body: bytes) -> typing.Any:
+        """Decode a response body with ``self.loads``.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If ``self.loads`` raises.
+        """
 
         try:
-            resp = await self.session.get(url, params=params)
-            if resp.status >= 400:
-                error = await resp.text()
+            return self.loads(body)
+        except Exception as err:  # pylint: disable=W0718
+            raise errors.CaicRequestException(
+                f"Error decoding CAIC response: {err}"
+            ) from err
+
+    def _validate(self, type_: typing.Any, body: bytes) -> typing.Any:
+        """
+        Validate a raw response body as ``type_``.
+
+        With ``self.validate_json``, the bytes are validated directly by a
+        cached ``pydantic.TypeAdapter``, skipping the intermediate dicts.
+        Otherwise the body is decoded with ``self.loads`` first.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If the body is not valid JSON.
+        pydantic.ValidationError
+            If the body doesn't validate as ``type_``.
+        """
+
+        adapter = _type_adapter(type_)
+
+        if not self.validate_json:
+            return adapter.validate_python(self._decode(body))
+
+        try:
+            return adapter.validate_json(body)
+        except pydantic.ValidationError as err:
+            if any(error["type"] == "json_invalid" for error in err.errors()):
                 raise errors.CaicRequestException(
-                    f"Error status from CAIC: {resp.status} - {error}"
+                    f"Error decoding CAIC response: {err}"
+                ) from err
+            raise
+
+    async def _get_raw(self, url: str, params: dict | list | None = None) -> bytes:
+        """
+        Get the raw body of a URL, see ``_get``.
+
+        With ``self.coalesce``, concurrent calls for the same URL and params
+        share a single in-flight request, and its result or exception.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If raised by ``_fetch_raw``.
+        """
+
+        if not self.coalesce:
+            return await self._fetch_raw(url, params)
+
+        key = cache.cache_key(url, params)
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_raw(url, params))
+            self._in_flight[key] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+                # Retrieve the exception in case every caller was cancelled.
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(forget)
+
+        # Shielded, so a cancelled caller doesn't cancel the request for the others.
+        return await asyncio.shield(task)
+
+    async def _fetch_raw(self, url: str, params: dict | list | None = None) -> bytes:
+        """
+        Request the raw body of a URL, see ``_get``.
+
+        Historical responses are served from, and saved to,
+        ``self.persistent_cache`` when there is one.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            For common HTTP errors, a >400 response status,
+            an ``aiohttp.ClientError``, or a timeout, once the
+            retry policy gives up.
+        """
+
+        key = None
+        persistent = self.persistent_cache
+        if persistent is not None and persistent.is_immutable(params):
+            key = persistent.key(url, params)
+            body = await persistent.aget(key)
+            if body is not None:
+                return body
+
+        attempt = 0
+
+        while True:
+            try:
+                body = await self._get_once(url, params)
+                break
+            except errors.CaicRequestException as err:
+                if not self.retry_policy.should_retry(attempt, err):
+                    raise
+
+                wait = self.retry_policy.backoff(attempt, err.retry_after)
+                LOGGER.warning(
+                    "Retrying '%s' in %.2f seconds (attempt %s): %s",
+                    url,
+                    wait,
+                    attempt + 1,
+                    err,
                 )
+                await asyncio.sleep(wait)
+                attempt += 1
 
-            data = await resp.json()
+        if key is not None:
+            await persistent.astore(key, body)
+
+        return body
+
+    async def _evict(self, url: str, params: dict | list | None = None) -> None:
+        """Drop a response that failed validation from ``self.persistent_cache``."""
+
+        persistent = self.persistent_cache
+        if persistent is not None and persistent.is_immutable(params):
+            await persistent.aevict(persistent.key(url, params))
+
+    async def _get_once(self, url: str, params: dict | list | None = None) -> bytes:
+        """A single attempt of ``_fetch_raw``, without retries or persistent caching."""
+
+        cached = None
+        headers = {}
+
+        if self.http_cache is not None:
+            key = self.http_cache.key(url, params)
+            cached = self.http_cache.get(key)
+            if cached is not None:
+                headers = cached.conditional_headers()
+
+        try:
+            async with self.rate_limiter.request(url) as outcome:
+                resp = await self.session.get(url, params=params, headers=headers)
+                outcome.status = resp.status
+                if resp.status == 304 and cached is not None:
+                    resp.release()
+                    return cached.body
+
+                if resp.status >= 400:
+                    error = await resp.text()
+                    raise errors.CaicRequestException(
+                        f"Error status from CAIC: {resp.status} - {error}",
+                        status=resp.status,
+                        retry_after=resp.headers.get("Retry-After"),
+                    )
+
+                body = await resp.read()
+                if self.http_cache is not None:
+                    self.http_cache.store(key, resp.headers, body)
 
         except aiohttp.ClientError as err:
             raise errors.CaicRequestException(
                 f"Error connecting to CAIC: {err}"
             ) from err
-        except JSONDecodeError as err:
+        except asyncio.TimeoutError as err:
             raise errors.CaicRequestException(
-                f"Error decoding CAIC response: {err}"
+                f"Timed out connecting to CAIC: {err}"
             ) from err
 
         else:
-            return data
+            return body
 
     async def _api_id_get(
         self, obj_id: str, endpoint: str, resp_model: pydantic.BaseModel
     ) -> models.FieldReport | None:
-        resp_data = await self._get(f"{CaicURLs.API}/{endpoint}/{obj_id}.json")
-
         try:
-            return resp_model(**resp_data)
+            return await self._api_id_fetch(obj_id, endpoint, resp_model)
         except pydantic.ValidationError as err:
             LOGGER.warning(
                 "Error parsing '%s' response (ID: %s): %s", endpoint, obj_id, str(err)
             )
             return None
 
+    async def _api_id_fetch(
+        self, obj_id: str, endpoint: str, resp_model: pydantic.BaseModel
+    ) -> pydantic.BaseModel:
+        """
+        Get a single object by ID (or slug), using ``self.id_cache`` if set.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If raised by ``_get``.
+        pydantic.ValidationError
+            If the response doesn't validate as ``resp_model``.
+        """
+
+        if self.id_cache is not None:
+            cached = self.id_cache.get(endpoint, (obj_id, resp_model))
+            if cached is not None:
+                return cached
+
+        body = await self._get_raw(f"{CaicURLs.API}/{endpoint}/{obj_id}.json")
+        obj = self._validate(resp_model, body)
+
+        if self.id_cache is not None:
+            self.id_cache.store(endpoint, (obj_id, resp_model), obj)
+
+        return obj
+
+    async def iter_by_ids(
+        self,
+        obj_ids: typing.Iterable[str],
+        endpoint: str,
+        resp_model: pydantic.BaseModel,
+        concurrency: int = 10,
+    ) -> typing.AsyncIterator[
+        tuple[str, pydantic.BaseModel | None, Exception | None]
+    ]:
+        """
+        Stream many objects by ID (or slug), in the order they finish.
+
+        IDs are deduplicated and at most ``concurrency`` are requested at once.
+        The ``*_by_ids`` methods wrap this for each kind of object.
+
+        Parameters
+        ----------
+        obj_ids : typing.Iterable[str]
+            The IDs (or slugs) to get.
+        endpoint : str
+            The ``CaicApiEndpoints`` endpoint of the objects.
+        resp_model : pydantic.BaseModel
+            The model to validate each object as.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Yields
+        ------
+        tuple[str, pydantic.BaseModel | None, Exception | None]
+            The ID, and either the object or the ``errors.CaicRequestException``
+            or ``pydantic.ValidationError`` that prevented getting it.
+        """
+
+        queue = iter(dict.fromkeys(obj_ids))
+        pending: dict[asyncio.Task, str] = {}
+
+        def refill() -> None:
+            while len(pending) < max(concurrency, 1):
+                obj_id = next(queue, None)
+                if obj_id is None:
+                    return
+                task = asyncio.ensure_future(
+                    self._api_id_fetch(obj_id, endpoint, resp_model)
+                )
+                pending[task] = obj_id
+
+        try:
+            refill()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    obj_id = pending.pop(task)
+                    err = task.exception()
+                    if err is None:
+                        yield obj_id, task.result(), None
+                    elif isinstance(
+                        err, (errors.CaicRequestException, pydantic.ValidationError)
+                    ):
+                        yield obj_id, None, err
+                    else:
+                        raise err
+                refill()
+
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _api_ids_get(
+        self,
+        obj_ids: typing.Iterable[str],
+        endpoint: str,
+        resp_model: pydantic.BaseModel,
+        concurrency: int,
+    ) -> tuple[dict[str, pydantic.BaseModel], dict[str, Exception]]:
+        """Collect ``iter_by_ids`` into a map of results and a map of errors."""
+
+        results = {}
+        failures = {}
+
+        async for obj_id, obj, err in self.iter_by_ids(
+            obj_ids, endpoint, resp_model, concurrency
+        ):
+            if err is None:
+                results[obj_id] = obj
+            else:
+                LOGGER.warning(
+                    "Unable to get '%s' object (ID: %s): %s", endpoint, obj_id, err
+                )
+                failures[obj_id] = err
+
+        return results, failures
+
     async def _api_paginate_get(
         self, page: int, per: int, uri: str, params: typing.Mapping | None = None
-    ) -> dict:
+    ) -> bytes:
         """
         A paginated get request to the CAIC API.
 
@@ -210,24 +832,340 @@ class CaicClient:
 
         Returns
         -------
-        dict | None
-            The API's JSON response as a dict.
+        bytes
+            The API's raw JSON response.
 
         Raises
         ------
         errors.CaicRequestException
-            If raised by ``_get``,
+            If raised by ``_get_raw``,
         """
 
-        if params is None:
-            params = {}
+        return await self._get_raw(
+            CaicURLs.API + uri, params=_page_params(page, per, params)
+        )
 
-        params["per"] = per
-        params["page"] = page
+    async def _api_page(
+        self,
+        page: int,
+        per: int,
+        endpoint: str,
+        resp_model: pydantic.BaseModel,
+        params: dict | None,
+        retries: int,
+        budget: "_RetryBudget",
+        on_invalid: OnInvalid | None = None,
+    ) -> "_Page | None":
+        """
+        Get and validate a single page.
 
-        data = await self._get(CaicURLs.API + uri, params=params)
+        Failed requests are not retried here: ``_get_raw`` already retried
+        them as far as ``self.retry_policy`` allows, and fatal statuses like a
+        404 would fail again. A page that fails validation is requested again,
+        up to ``retries`` times.
 
-        return data
+        Parameters
+        ----------
+        page : int
+            The page number to get from the API.
+        per : int
+            The number of items to get per page.
+        endpoint : str
+            The API endpoint to request.
+        resp_model : pydantic.BaseModel
+            The model used to cast the JSON body of the response to an object.
+        params : dict | None
+            Optional parameters for the request.
+        retries : int
+            The number of times to request the page again if it fails
+            validation, before giving up on it.
+        budget : _RetryBudget
+            The retries left for the whole pagination, shared between pages.
+        on_invalid : OnInvalid | None, optional
+            Validate the items of a page that fails validation one by one,
+            see ``_validate_page``. By default None.
+
+        Returns
+        -------
+        _Page | None
+            The validated page, or None if every attempt failed or the
+            retry budget ran out.
+        """
+
+        for _ in range(retries + 1):
+            try:
+                resp = await self._api_paginate_get(page, per, endpoint, params)
+            except errors.CaicRequestException as err:
+                LOGGER.error(
+                    "Failed to request the CAIC endpoint '%s' (Page# %s): %s",
+                    endpoint,
+                    page,
+                    err,
+                )
+                budget.spend()
+                return None
+
+            try:
+                fetched = self._validate_page(
+                    page, endpoint, resp_model, resp, on_invalid
+                )
+            except (errors.CaicRequestException, pydantic.ValidationError) as err:
+                await self._evict(
+                    CaicURLs.API + endpoint, _page_params(page, per, params)
+                )
+                LOGGER.warning(
+                    "Unable to validate response from the '%s' endpoint "
+                    "(Page# %s - Query (%s)): %s",
+                    endpoint,
+                    page,
+                    str(params),
+                    str(err),
+                )
+            else:
+                if fetched.count > len(fetched.items):
+                    # Some items were invalid, don't keep serving them from disk.
+                    await self._evict(
+                        CaicURLs.API + endpoint, _page_params(page, per, params)
+                    )
+                return fetched
+
+            if not budget.spend():
+                LOGGER.error("Reached the maximum number of query retries.")
+                return None
+
+        LOGGER.error("Giving up on page %s of the '%s' endpoint.", page, endpoint)
+        return None
+
+    def _validate_page(
+        self,
+        page: int,
+        endpoint: str,
+        resp_model: pydantic.BaseModel,
+        body: bytes,
+        on_invalid: OnInvalid | None = None,
+    ) -> _Page:
+        """
+        Validate the raw body of a page.
+
+        The whole page is validated at once. If that fails and ``on_invalid``
+        is set, the items are validated one by one instead: the valid ones are
+        kept and each invalid one is passed to ``on_invalid``. An invalid item
+        fails the same way on every retry, so this keeps the rest of the page
+        without downloading it again.
+
+        Parameters
+        ----------
+        page : int
+            The page number of the body.
+        endpoint : str
+            The API endpoint the body came from.
+        resp_model : pydantic.BaseModel
+            The model used to cast the JSON body of the response to an object.
+        body : bytes
+            The raw response body.
+        on_invalid : OnInvalid | None, optional
+            Receives each item that fails validation, by default None.
+
+        Returns
+        -------
+        _Page
+            The validated page. ``count`` is the number of items in the
+            response, including invalid ones.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If the body is not valid JSON.
+        pydantic.ValidationError
+            If the page fails validation and ``on_invalid`` is None, or if
+            anything other than its items (like the page metadata) is invalid.
+        """
+
+        has_meta = issubclass(resp_model, models.V1AvyResponse)
+
+        try:
+            if has_meta:
+                obj = self._validate(resp_model, body)
+                return _Page(page, obj.data, len(obj.data), obj.meta.total_pages)
+
+            items = self._validate(list[resp_model], body)
+            return _Page(page, items, len(items), None)
+        except pydantic.ValidationError:
+            if on_invalid is None:
+                raise
+            data = self._decode(body)
+            raw_items = data
+            if has_meta:
+                raw_items = data.get("data") if isinstance(data, dict) else None
+            if not isinstance(raw_items, list):
+                raise
+
+        total_pages = None
+        item_type = resp_model
+        if has_meta:
+            envelope = _type_adapter(resp_model).validate_python({**data, "data": []})
+            total_pages = envelope.meta.total_pages
+            item_type = typing.get_args(resp_model.model_fields["data"].annotation)[0]
+
+        adapter = _type_adapter(item_type)
+        items = []
+        for raw in raw_items:
+            try:
+                items.append(adapter.validate_python(raw))
+            except pydantic.ValidationError as err:
+                LOGGER.warning(
+                    "Skipping an invalid item from the '%s' endpoint (Page# %s): %s",
+                    endpoint,
+                    page,
+                    str(err),
+                )
+                on_invalid(InvalidItem(endpoint, page, raw, err))
+
+        return _Page(page, items, len(raw_items), total_pages)
+
+    async def _api_pages(
+        self,
+        endpoint: str,
+        resp_model: pydantic.BaseModel,
+        params: dict | None,
+        per: int = 1000,
+        page_limit: int = 100,
+        retries: int = 2,
+        total_retries: int = 10,
+        concurrency: int = 1,
+        read_ahead: int = 1,
+        on_invalid: OnInvalid | None = None,
+        strict: bool = False,
+        first: _Page | None = None,
+    ) -> typing.AsyncIterator[_Page]:
+        """
+        Yield the validated pages of a paginated query, in page order.
+
+        The next page(s) are already requested while a page is being
+        processed by the caller. See ``_api_paginator`` for the other
+        arguments and the exit conditions.
+
+        Parameters
+        ----------
+        strict : bool, optional
+            Raise instead of skipping a failed page or stopping quietly at
+            ``page_limit``, by default False. For callers that must not miss
+            a page.
+        first : _Page | None, optional
+            Page 1, if the caller already has it, to continue from rather
+            than request again. By default None.
+
+        Yields
+        ------
+        _Page
+            Each page that was retrieved. Pages that failed are skipped.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If ``strict`` and a page failed, or ``page_limit`` was reached
+            before the last page.
+        """
+
+        page = 1
+        total_pages = None
+        got_results = False
+        budget = _RetryBudget(total_retries)
+
+        # Pages requested ahead of the one being processed. Responses with page
+        # metadata get a single page in flight until the first one says how
+        # many pages there are, then ``concurrency`` pages.
+        pending: dict[int, asyncio.Future] = {}
+        next_page = 1
+        has_meta = issubclass(resp_model, models.V1AvyResponse)
+        window = 1 if has_meta else max(read_ahead, 1)
+
+        if first is not None:
+            pending[1] = asyncio.get_running_loop().create_future()
+            pending[1].set_result(first)
+            next_page = 2
+
+        def within_limit(number: int) -> bool:
+            if total_pages is not None and number > total_pages:
+                return False
+            return page_limit < 0 or number <= page_limit
+
+        def refill() -> None:
+            nonlocal next_page
+            while len(pending) < window and within_limit(next_page):
+                pending[next_page] = asyncio.create_task(
+                    self._api_page(
+                        next_page,
+                        per,
+                        endpoint,
+                        resp_model,
+                        params,
+                        retries,
+                        budget,
+                        on_invalid,
+                    )
+                )
+                next_page += 1
+
+        try:
+            while True:
+                refill()
+
+                if page not in pending:
+                    if total_pages is None or page <= total_pages:
+                        LOGGER.warning(
+                            "Reached the page limit before all pages downloaded."
+                        )
+                        if strict:
+                            raise errors.CaicRequestException(
+                                f"Reached the page limit of {page_limit} before "
+                                f"all pages of the '{endpoint}' endpoint downloaded."
+                            )
+                    break
+
+                fetched = await pending.pop(page)
+
+                if fetched is None:
+                    if strict:
+                        raise errors.CaicRequestException(
+                            f"Unable to get page {page} of the '{endpoint}' endpoint."
+                        )
+                    if budget.exhausted:
+                        if not got_results:
+                            LOGGER.critical("All queries failed!")
+                        break
+                    page += 1
+                    continue
+
+                got_results = True
+
+                # Special handling for responses with page metadata (V1AvyObsResponse).
+                if fetched.total_pages is not None:
+                    total_pages = fetched.total_pages
+                    window = max(concurrency, 1)
+                    done = page >= total_pages
+                elif fetched.count < per:
+                    LOGGER.info("Got all the results for the query: %s", str(params))
+                    done = True
+                else:
+                    done = False
+
+                # Get the next page(s) going before handing this one over.
+                if not done:
+                    refill()
+
+                yield fetched
+
+                if done:
+                    break
+
+                page += 1
+
+        finally:
+            # Anything still in flight is past the last page - throw it away.
+            for task in pending.values():
+                task.cancel()
+            await asyncio.gather(*pending.values(), return_exceptions=True)
 
     async def _api_paginator(
         self,
@@ -238,6 +1176,10 @@ class CaicClient:
         page_limit: int = 100,
         retries: int = 2,
         total_retries: int = 10,
+        concurrency: int = 1,
+        read_ahead: int = 1,
+        on_invalid: OnInvalid | None = None,
+        first: _Page | None = None,
     ) -> list[pydantic.BaseModel]:
         """
         Loop over ``_api_paginate_get`` until done, or conditions are met.
@@ -262,6 +1204,18 @@ class CaicClient:
                 limit when calling this method on the ``api/avalanche_observations``
                 endpoint.
 
+        When page metadata is available and ``concurrency`` is greater than 1,
+        up to ``concurrency`` of the remaining pages are requested at once after
+        the first page tells us how many there are. Results are still returned
+        in page order.
+
+        Without page metadata, ``read_ahead`` pages are kept in flight ahead of
+        the page being processed. Requests past the first short page are
+        cancelled and their results thrown away. With more than one page in
+        flight, the page after a full page is already requested by the time
+        the full page arrives, so a result count that is an exact multiple of
+        ``per`` doesn't cost an extra serial round trip at the end.
+
         Parameters
         ----------
         endpoint : str
@@ -281,6 +1235,18 @@ class CaicClient:
             by default 2.
         total_retries : int, optional
             The total number of retries before this method quits, by default 10.
+        concurrency : int, optional
+            The maximum number of pages to request at once when the total
+            number of pages is known, by default 1.
+        read_ahead : int, optional
+            The number of pages to keep in flight when the total number of
+            pages is not known, by default 1.
+        on_invalid : OnInvalid | None, optional
+            Keep the valid items of a page that fails validation, passing each
+            invalid one to this callback, instead of retrying and then skipping
+            the whole page. By default None.
+        first : _Page | None, optional
+            Page 1, if already fetched, to continue from. By default None.
 
         Returns
         -------
@@ -290,83 +1256,155 @@ class CaicClient:
             failed.
         """
 
-        page = 1
-        paginating = True
         results = []
-        retry_count = 0
-        page_retries = 0
 
-        while paginating:
-            if retry_count == total_retries:
-                if not results:
-                    LOGGER.critical("All queries failed!")
-                LOGGER.error("Reached the maximum number of query retries.")
-                break
+        async for page in self._api_pages(
+            endpoint,
+            resp_model,
+            params,
+            per=per,
+            page_limit=page_limit,
+            retries=retries,
+            total_retries=total_retries,
+            concurrency=concurrency,
+            read_ahead=read_ahead,
+            on_invalid=on_invalid,
+            first=first,
+        ):
+            results.extend(page.items)
 
-            try:
-                resp = await self._api_paginate_get(page, per, endpoint, params)
-            except Exception as err:  # pylint: disable=W0718
-                LOGGER.error(
-                    "Failed to request the CAIC endpoint '%s': %s", endpoint, err
-                )
-                if page_retries == retries:
-                    page += 1
-                    retry_count += 1
-                    page_retries = 0
-                else:
-                    page_retries += 1
-                    retry_count += 1
-                continue
+        return results
 
-            if len(resp) < per:
-                LOGGER.info("Got all the results for the query: %s", str(params))
-                paginating = False
+    async def _api_sharded(
+        self,
+        endpoint: str,
+        resp_model: pydantic.BaseModel,
+        window_params: typing.Callable[[str, str], dict],
+        start: str,
+        end: str,
+        shard: str | datetime.timedelta,
+        shard_concurrency: int = 4,
+        per: int = 1000,
+        retries: int = 2,
+        total_retries: int = 10,
+        on_invalid: OnInvalid | None = None,
+        **kwargs,
+    ) -> list[pydantic.BaseModel]:
+        """
+        Split a query's time range into windows and paginate them concurrently.
 
-            try:
-                if resp_model == models.V1AvyResponse:
-                    obj = resp_model(**resp)
-                else:
-                    obj = [resp_model(**item) for item in resp]
-            except pydantic.ValidationError as err:
-                LOGGER.warning(
-                    "Unable to validate response from the '%s' endpoint "
-                    "(Page# %s - Query (%s)): %s",
+        Fixed windows (``"day"``, ``"week"`` or a ``datetime.timedelta``) are all
+        paginated at once, at most ``shard_concurrency`` at a time. With
+        ``"adaptive"``, the first page of a window decides whether it is
+        dense enough to be split in half, recursively, down to
+        ``MIN_ADAPTIVE_SHARD``, where pagination carries on from that first
+        page. Windows are merged newest first and
+        deduplicated by ``id``, as neighbouring windows share their boundary.
+
+        Parameters
+        ----------
+        endpoint : str
+            The API endpoint to request.
+        resp_model : pydantic.BaseModel
+            The model used to cast the JSON body of each response to an object.
+        window_params : typing.Callable[[str, str], dict]
+            Builds the query params for a window from its start and end.
+        start : str
+            The start of the whole query.
+        end : str
+            The end of the whole query.
+        shard : str | datetime.timedelta
+            One of ``SHARD_SIZES``, ``"adaptive"``, or a window length.
+        shard_concurrency : int, optional
+            The maximum number of windows to request at once, by default 4.
+        per, retries, total_retries, on_invalid, kwargs
+            Passed to ``_api_paginator`` for each window.
+
+        Returns
+        -------
+        list[pydantic.BaseModel]
+            The unique objects from every window.
+
+        Raises
+        ------
+        ValueError
+            If ``shard`` is not a known window size.
+        """
+
+        semaphore = asyncio.Semaphore(shard_concurrency)
+
+        async def paginate(
+            window_start: datetime.datetime,
+            window_end: datetime.datetime,
+            first: _Page | None = None,
+        ) -> list[pydantic.BaseModel]:
+            async with semaphore:
+                return await self._api_paginator(
                     endpoint,
-                    page,
-                    str(params),
-                    str(err),
+                    resp_model,
+                    window_params(window_start.isoformat(), window_end.isoformat()),
+                    per=per,
+                    retries=retries,
+                    total_retries=total_retries,
+                    on_invalid=on_invalid,
+                    first=first,
+                    **kwargs,
                 )
-                # Can't find a way around the duplicate code here.
-                if page_retries == retries:
-                    page += 1
-                    retry_count += 1
-                    page_retries = 0
-                else:
-                    page_retries += 1
-                    retry_count += 1
-                continue
 
-            if page == page_limit:
-                LOGGER.warning("Reached the page limit before all pages downloaded.")
-                paginating = False
+        async def adaptive(
+            window_start: datetime.datetime, window_end: datetime.datetime
+        ) -> list[list[pydantic.BaseModel]]:
+            params = window_params(window_start.isoformat(), window_end.isoformat())
+            async with semaphore:
+                first = await self._api_page(
+                    1,
+                    per,
+                    endpoint,
+                    resp_model,
+                    params,
+                    retries,
+                    _RetryBudget(total_retries),
+                    on_invalid,
+                )
 
-            # Special handling for V1AvyObsResponse objects.
-            if resp_model == models.V1AvyResponse:
-                if obj.meta.current_page == obj.meta.total_pages:
-                    paginating = False
-                # Just a sanity check to avoid infinite looping
-                elif page >= obj.meta.total_pages:
-                    LOGGER.debug("Paginating mismatch")
-                    paginating = False
+            if first is not None:
+                if first.total_pages is not None:
+                    more = first.total_pages > 1
+                else:
+                    more = first.count >= per
 
-                results.extend(obj.data)
+                if not more:
+                    return [first.items]
 
-            else:
-                results.extend(obj)
+            if window_end - window_start <= MIN_ADAPTIVE_SHARD:
+                # Too short to split - carry on from the first page.
+                return [await paginate(window_start, window_end, first)]
 
-            page += 1
+            middle = window_start + (window_end - window_start) / 2
+            newer, older = await asyncio.gather(
+                adaptive(middle, window_end), adaptive(window_start, middle)
+            )
+            return newer + older
 
-        return results
+        if shard == "adaptive":
+            windows = await adaptive(
+                dateutil.parser.parse(start), dateutil.parser.parse(end)
+            )
+        else:
+            step = SHARD_SIZES.get(shard, shard)
+            if not isinstance(step, datetime.timedelta):
+                raise ValueError(f"Unknown shard size: {shard}")
+
+            windows = await asyncio.gather(
+                *(
+                    paginate(window_start, window_end)
+                    for window_start, window_end in reversed(
+                        utils.split_time_range(start, end, step)
+                    )
+                )
+            )
+
+        return utils.dedupe_by_id(item for window in windows for item in window)
 
     async def _proxy_get(
         self, proxy_endpoint: str, proxy_uri: str, proxy_params: dict
@@ -390,12 +1428,32 @@ class CaicClient:
         dict | list
             The response raw response, or None
         """
-        proxy_params_str = "&".join([f"{k}={v}" for k, v in proxy_params.items()])
-        params = {"_api_proxy_uri": f"{proxy_uri}?{proxy_params_str}"}
-        return await self._get(CaicURLs.HOME + proxy_endpoint, params=params)
+        return self._decode(
+            await self._proxy_get_raw(proxy_endpoint, proxy_uri, proxy_params)
+        )
+
+    async def _proxy_get_raw(
+        self, proxy_endpoint: str, proxy_uri: str, proxy_params: dict
+    ) -> bytes:
+        """Get the raw body of a URL from the API proxy, see ``_proxy_get``."""
+
+        return await self._get_raw(
+            CaicURLs.HOME + proxy_endpoint,
+            params=_proxy_params(proxy_uri, proxy_params),
+        )
 
     async def avy_obs(
-        self, start: str, end: str, page_limit: int = 1000, ver1: bool = False
+        self,
+        start: str,
+        end: str,
+        page_limit: int = 1000,
+        ver1: bool = False,
+        concurrency: int = 1,
+        read_ahead: int = 1,
+        shard: str | datetime.timedelta | None = None,
+        shard_concurrency: int = 4,
+        on_invalid: OnInvalid | None = None,
+        fields: typing.Iterable[str] | None = None,
     ) -> list[models.AvalancheObservation]:
         """Query for avalanche observations on the CAIC website.
 
@@ -417,34 +1475,124 @@ class CaicClient:
             Limit per page results to this amount, by default 1000.
         ver1 : bool, optional
             Use the v1 endpoint instead, not recommended, by default False.
+        concurrency : int, optional
+            The maximum number of pages to request at once. Only used with
+            ``ver1``, whose responses say how many pages there are. By default 1.
+        read_ahead : int, optional
+            The number of pages to keep in flight with the v2 endpoint, which
+            doesn't say how many pages there are. By default 1.
+        shard : str | datetime.timedelta | None, optional
+            Split ``[start, end]`` into windows that are queried concurrently -
+            ``"day"``, ``"week"``, ``"adaptive"`` (split by result density), or
+            any ``datetime.timedelta``. ``page_limit`` applies to each window.
+            By default None, a single query.
+        shard_concurrency : int, optional
+            The maximum number of windows to query at once, by default 4.
+        on_invalid : OnInvalid | None, optional
+            Keep the valid observations of a page that fails validation, and
+            pass each invalid one to this callback as an ``InvalidItem``,
+            instead of retrying and then skipping the whole page.
+            By default None.
+        fields : typing.Iterable[str] | None, optional
+            Only validate and keep these ``models.AvalancheObservation``
+            fields (and ``id``), returning ``models.projection`` objects.
+            By default None, all of them.
 
         Returns
         -------
         list[models.AvalancheObservation]
             A list of all avalanche observations returned by the query.
+
+        Raises
+        ------
+        ValueError
+            If ``fields`` has an unknown field.
         """
 
-        if ver1:
-            endpoint = "/api/avalanche_observations"
-            model = models.V1AvyResponse
-        else:
-            endpoint = "/api/v2/avalanche_observations"
-            model = models.AvalancheObservation
+        endpoint, model, params = _avy_obs_query(start, end, ver1, fields)
+
+        if shard is not None:
+            return await self._api_sharded(
+                endpoint,
+                model,
+                lambda start, end: _avy_obs_query(start, end, ver1)[2],
+                start,
+                end,
+                shard,
+                shard_concurrency,
+                page_limit=page_limit,
+                concurrency=concurrency,
+                read_ahead=read_ahead,
+                on_invalid=on_invalid,
+            )
 
-        params = {
-            "observed_after": start,
-            "observed_before": end,
-            "t": str(int(time.time())),
-        }
+        obs = await self._api_paginator(
+            endpoint,
+            model,
+            params=params,
+            page_limit=page_limit,
+            concurrency=concurrency,
+            read_ahead=read_ahead,
+            on_invalid=on_invalid,
+        )
+
+        return obs
+
+    async def iter_avy_obs(
+        self,
+        start: str,
+        end: str,
+        page_limit: int = 1000,
+        ver1: bool = False,
+        concurrency: int = 1,
+        read_ahead: int = 1,
+        pages: bool = False,
+        on_invalid: OnInvalid | None = None,
+        fields: typing.Iterable[str] | None = None,
+    ) -> typing.AsyncIterator[
+        models.AvalancheObservation | list[models.AvalancheObservation]
+    ]:
+        """Stream avalanche observations from the CAIC website.
+
+        The streaming version of ``avy_obs`` - takes the same arguments. Results
+        are yielded as each page arrives, while the next page downloads, rather
+        than after the whole query is done. Wrap the iterator in
+        ``contextlib.aclosing`` to cancel in-flight requests right away when
+        breaking out early.
+
+        Parameters
+        ----------
+        pages : bool, optional
+            Yield a list of observations per page instead of single
+            observations, by default False.
 
-        obs = await self._api_paginator(
-            endpoint,
-            model,
-            params=params,
-            page_limit=page_limit,
-        )
+        Yields
+        ------
+        models.AvalancheObservation | list[models.AvalancheObservation]
+            Each avalanche observation returned by the query, or each page
+            of them if ``pages`` is True.
+        """
 
-        return obs
+        endpoint, model, params = _avy_obs_query(start, end, ver1, fields)
+
+        # Close the pages along with this iterator, cancelling any in flight.
+        async with contextlib.aclosing(
+            self._api_pages(
+                endpoint,
+                model,
+                params=params,
+                page_limit=page_limit,
+                concurrency=concurrency,
+                read_ahead=read_ahead,
+                on_invalid=on_invalid,
+            )
+        ) as api_pages:
+            async for page in api_pages:
+                if pages:
+                    yield page.items
+                else:
+                    for item in page.items:
+                        yield item
 
     async def field_reports(  # pylint: disable=W0102
         self,
@@ -456,7 +1604,13 @@ class CaicClient:
         query: str = "",
         avy_seen: bool | None = None,
         page_limit: int = 100,
-    ) -> list[models.FieldReport]:
+        read_ahead: int = 1,
+        shard: str | datetime.timedelta | None = None,
+        shard_concurrency: int = 4,
+        on_invalid: OnInvalid | None = None,
+        lazy: bool = False,
+        fields: typing.Iterable[str] | None = None,
+    ) -> list[models.FieldReport | models.LazyFieldReport]:
         """
         Search CAIC field reports.
 
@@ -485,47 +1639,234 @@ class CaicClient:
         page_limit : int, optional
             Limit the number of pages returned by the API. Must be at least 1
             or a value error is raised. By default 100.
+        read_ahead : int, optional
+            The number of pages to keep in flight at once, by default 1.
+        shard : str | datetime.timedelta | None, optional
+            Split ``[start, end]`` into windows that are searched concurrently -
+            ``"day"``, ``"week"``, ``"adaptive"`` (split by result density), or
+            any ``datetime.timedelta``. ``page_limit`` applies to each window.
+            By default None, a single search.
+        shard_concurrency : int, optional
+            The maximum number of windows to search at once, by default 4.
+        on_invalid : OnInvalid | None, optional
+            Keep the valid reports of a page that fails validation, and
+            pass each invalid one to this callback as an ``InvalidItem``,
+            instead of retrying and then skipping the whole page.
+            By default None.
+        lazy : bool, optional
+            Return ``models.LazyFieldReport`` objects, whose nested
+            observations and assets are only validated when first accessed.
+            Much faster when only the report-level fields are needed.
+            By default False.
+        fields : typing.Iterable[str] | None, optional
+            Only validate and keep these ``models.FieldReport`` fields
+            (and ``id``), returning ``models.projection`` objects. Overrides
+            ``lazy``. By default None, all of them.
 
         Returns
         -------
-        list[models.FieldReport]
+        list[models.FieldReport | models.LazyFieldReport]
             All field reports returned by the search.
 
         Raises
         ------
         ValueError
-            If ``page_limit`` is less than 1.
+            If ``page_limit`` is less than 1, or ``fields`` has an unknown field.
 
         """
 
-        if page_limit <= 0:
-            raise ValueError("A page_limit MUST be set for field_reports!")
-
-        params = {
-            "r[backcountry_zone_title_in][]": list_to_plus_args(bc_zones),
-            "r[snowpack_observations_cracking_in]": list_to_plus_args(cracking_obs),
-            "r[snowpack_observations_collapsing_in][]": list_to_plus_args(
-                collapsing_obs
-            ),
-            "q": query,
-            "r[saw_avalanche_eq]": avy_seen,
-            "r[observed_at_gteq]": start,
-            "r[observed_at_lteq]": end,
-            "r[sorts][]": "observed_at+desc",  # We'll hard code this.
-        }
+        params = _field_reports_query(
+            start,
+            end,
+            bc_zones,
+            cracking_obs,
+            collapsing_obs,
+            query,
+            avy_seen,
+            page_limit,
+        )
 
-        # Sanitize params
-        params = {k: v for k, v in params.items() if v not in (None, "")}
+        model = _field_reports_model(lazy, fields)
+
+        if shard is not None:
+            return await self._api_sharded(
+                CaicApiEndpoints.OBS_REPORT,
+                model,
+                lambda start, end: _field_reports_query(
+                    start,
+                    end,
+                    bc_zones,
+                    cracking_obs,
+                    collapsing_obs,
+                    query,
+                    avy_seen,
+                    page_limit,
+                ),
+                start,
+                end,
+                shard,
+                shard_concurrency,
+                page_limit=page_limit,
+                read_ahead=read_ahead,
+                on_invalid=on_invalid,
+            )
 
         obs = await self._api_paginator(
-            "/api/v2/observation_reports",
-            models.FieldReport,
+            CaicApiEndpoints.OBS_REPORT,
+            model,
             params=params,
             page_limit=page_limit,
+            read_ahead=read_ahead,
+            on_invalid=on_invalid,
         )
 
         return obs
 
+    async def iter_field_reports(  # pylint: disable=W0102
+        self,
+        start: str,
+        end: str,
+        bc_zones: list[str] = [],
+        cracking_obs: list[str] = [],
+        collapsing_obs: list[str] = [],
+        query: str = "",
+        avy_seen: bool | None = None,
+        page_limit: int = 100,
+        read_ahead: int = 1,
+        pages: bool = False,
+        on_invalid: OnInvalid | None = None,
+        lazy: bool = False,
+        fields: typing.Iterable[str] | None = None,
+    ) -> typing.AsyncIterator[
+        models.FieldReport
+        | models.LazyFieldReport
+        | list[models.FieldReport | models.LazyFieldReport]
+    ]:
+        """
+        Stream CAIC field reports.
+
+        The streaming version of ``field_reports`` - takes the same arguments.
+        Results are yielded as each page arrives, while the next page downloads,
+        rather than after the whole search is done. Wrap the iterator in
+        ``contextlib.aclosing`` to cancel in-flight requests right away when
+        breaking out early.
+
+        Parameters
+        ----------
+        pages : bool, optional
+            Yield a list of field reports per page instead of single
+            field reports, by default False.
+
+        Yields
+        ------
+        models.FieldReport | models.LazyFieldReport | list
+            Each field report returned by the search, or each page of them
+            if ``pages`` is True.
+
+        Raises
+        ------
+        ValueError
+            If ``page_limit`` is less than 1, or ``fields`` has an unknown field.
+        """
+
+        params = _field_reports_query(
+            start,
+            end,
+            bc_zones,
+            cracking_obs,
+            collapsing_obs,
+            query,
+            avy_seen,
+            page_limit,
+        )
+
+        # Close the pages along with this iterator, cancelling any in flight.
+        async with contextlib.aclosing(
+            self._api_pages(
+                CaicApiEndpoints.OBS_REPORT,
+                _field_reports_model(lazy, fields),
+                params=params,
+                page_limit=page_limit,
+                read_ahead=read_ahead,
+                on_invalid=on_invalid,
+            )
+        ) as api_pages:
+            async for page in api_pages:
+                if pages:
+                    yield page.items
+                else:
+                    for item in page.items:
+                        yield item
+
+    async def iter_changes(
+        self,
+        endpoint: str,
+        resp_model: pydantic.BaseModel,
+        since: str,
+        until: str | None = None,
+        page_limit: int = 100,
+        read_ahead: int = 1,
+        pages: bool = False,
+    ) -> typing.AsyncIterator[pydantic.BaseModel | list[pydantic.BaseModel]]:
+        """
+        Stream the records of an endpoint that changed since a point in time.
+
+        Filters by ``updated_at`` rather than ``observed_at``, so old records
+        that were edited are included. Used by ``caic_python.sync``.
+
+        Parameters
+        ----------
+        endpoint : str
+            The ``CaicApiEndpoints`` endpoint, one of ``CHANGES_ENDPOINTS``.
+        resp_model : pydantic.BaseModel
+            The model of the endpoint's records.
+        since : str
+            Records changed at or after this date (and time).
+        until : str | None, optional
+            Records changed at or before this date (and time), by default None.
+        page_limit : int, optional
+            The maximum number of pages to get, by default 100.
+        read_ahead : int, optional
+            The number of pages to keep in flight at once, by default 1.
+        pages : bool, optional
+            Yield a list of records per page instead of single records,
+            by default False.
+
+        Yields
+        ------
+        pydantic.BaseModel | list[pydantic.BaseModel]
+            Each changed record, oldest change first, or each page of them
+            if ``pages`` is True.
+
+        Raises
+        ------
+        ValueError
+            If ``endpoint`` is not one of ``CHANGES_ENDPOINTS``.
+        errors.CaicRequestException
+            If a page failed after its retries, or ``page_limit`` was reached
+            before the last page. Unlike the searches, no page is skipped.
+        """
+
+        if endpoint not in CHANGES_ENDPOINTS:
+            raise ValueError(f"The '{endpoint}' endpoint can't be filtered by changes.")
+
+        async with contextlib.aclosing(
+            self._api_pages(
+                endpoint,
+                resp_model,
+                params=_changes_query(since, until),
+                page_limit=page_limit,
+                read_ahead=read_ahead,
+                strict=True,
+            )
+        ) as api_pages:
+            async for page in api_pages:
+                if pages:
+                    yield page.items
+                else:
+                    for item in page.items:
+                        yield item
+
     async def field_report(self, report_id: str) -> models.FieldReport | None:
         """Get a single CAIC Feild Report (aka Observation Report) by UUID.
 
@@ -655,6 +1996,248 @@ class CaicClient:
 
         return report
 
+    async def zones_map(self) -> typing.Any:
+        """Get the map of every zone, as GeoJSON.
+
+        See ``zones.ZoneIndex.fetch`` to turn it into a point-in-zone index.
+
+        Returns
+        -------
+        typing.Any
+            The decoded GeoJSON, normally a ``FeatureCollection``.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If raised by ``_get``.
+        """
+
+        return await self._get(f"{CaicURLs.API}{CaicApiEndpoints.ZONES_MAP}")
+
+    async def zone_geojson(self, geojson_url: str) -> typing.Any:
+        """Get the geometry of a single zone, from its ``geojson_url``.
+
+        Parameters
+        ----------
+        geojson_url : str
+            The ``geojson_url`` of a ``models.BackcountryZone`` or
+            ``models.HighwayZone``, absolute or relative to the API.
+
+        Returns
+        -------
+        typing.Any
+            The decoded GeoJSON.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If raised by ``_get``.
+        """
+
+        if geojson_url.startswith("/"):
+            geojson_url = f"{CaicURLs.API}{geojson_url}"
+
+        return await self._get(geojson_url)
+
+    async def field_reports_by_ids(
+        self, report_ids: typing.Iterable[str], concurrency: int = 10
+    ) -> tuple[dict[str, models.FieldReport], dict[str, Exception]]:
+        """Get many field reports at once, at most ``concurrency`` at a time.
+
+        Duplicate IDs are only requested once. Use ``iter_by_ids`` to handle
+        each result as soon as it arrives instead.
+
+        Parameters
+        ----------
+        report_ids : typing.Iterable[str]
+            The UUIDs of the field reports to retrieve.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Returns
+        -------
+        tuple[dict[str, models.FieldReport], dict[str, Exception]]
+            The retrieved field reports by ID, and the error by ID for
+            each one that could not be retrieved.
+        """
+
+        return await self._api_ids_get(
+            report_ids, CaicApiEndpoints.OBS_REPORT, models.FieldReport, concurrency
+        )
+
+    async def snowpack_observations_by_ids(
+        self, obs_ids: typing.Iterable[str], concurrency: int = 10
+    ) -> tuple[dict[str, models.SnowpackObservation], dict[str, Exception]]:
+        """Get many snowpack observations at once, at most ``concurrency`` at a time.
+
+        Duplicate IDs are only requested once. Use ``iter_by_ids`` to handle
+        each result as soon as it arrives instead.
+
+        Parameters
+        ----------
+        obs_ids : typing.Iterable[str]
+            The UUIDs of the snowpack observations to retrieve.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Returns
+        -------
+        tuple[dict[str, models.SnowpackObservation], dict[str, Exception]]
+            The retrieved snowpack observations by ID, and the error by ID for
+            each one that could not be retrieved.
+        """
+
+        return await self._api_ids_get(
+            obs_ids,
+            CaicApiEndpoints.SNOWPACK_OBS,
+            models.SnowpackObservation,
+            concurrency,
+        )
+
+    async def avy_observations_by_ids(
+        self, obs_ids: typing.Iterable[str], concurrency: int = 10
+    ) -> tuple[dict[str, models.AvalancheObservation], dict[str, Exception]]:
+        """Get many avalanche observations at once, at most ``concurrency`` at a time.
+
+        Duplicate IDs are only requested once. Use ``iter_by_ids`` to handle
+        each result as soon as it arrives instead.
+
+        Parameters
+        ----------
+        obs_ids : typing.Iterable[str]
+            The UUIDs of the avalanche observations to retrieve.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Returns
+        -------
+        tuple[dict[str, models.AvalancheObservation], dict[str, Exception]]
+            The retrieved avalanche observations by ID, and the error by ID for
+            each one that could not be retrieved.
+        """
+
+        return await self._api_ids_get(
+            obs_ids, CaicApiEndpoints.AVY_OBS, models.AvalancheObservation, concurrency
+        )
+
+    async def weather_observations_by_ids(
+        self, obs_ids: typing.Iterable[str], concurrency: int = 10
+    ) -> tuple[dict[str, models.WeatherObservation], dict[str, Exception]]:
+        """Get many weather observations at once, at most ``concurrency`` at a time.
+
+        Duplicate IDs are only requested once. Use ``iter_by_ids`` to handle
+        each result as soon as it arrives instead.
+
+        Parameters
+        ----------
+        obs_ids : typing.Iterable[str]
+            The UUIDs of the weather observations to retrieve.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Returns
+        -------
+        tuple[dict[str, models.WeatherObservation], dict[str, Exception]]
+            The retrieved weather observations by ID, and the error by ID for
+            each one that could not be retrieved.
+        """
+
+        return await self._api_ids_get(
+            obs_ids,
+            CaicApiEndpoints.WEATHER_OBS,
+            models.WeatherObservation,
+            concurrency,
+        )
+
+    async def bc_zones_by_ids(
+        self, zone_slugs: typing.Iterable[str], concurrency: int = 10
+    ) -> tuple[dict[str, models.BackcountryZone], dict[str, Exception]]:
+        """Get many backcountry zones at once, at most ``concurrency`` at a time.
+
+        Duplicate IDs are only requested once. Use ``iter_by_ids`` to handle
+        each result as soon as it arrives instead.
+
+        Parameters
+        ----------
+        zone_slugs : typing.Iterable[str]
+            The slug names of the zones to retrieve.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Returns
+        -------
+        tuple[dict[str, models.BackcountryZone], dict[str, Exception]]
+            The retrieved backcountry zones by ID, and the error by ID for
+            each one that could not be retrieved.
+        """
+
+        return await self._api_ids_get(
+            zone_slugs, CaicApiEndpoints.ZONES, models.BackcountryZone, concurrency
+        )
+
+    async def highway_zones_by_ids(
+        self, zone_slugs: typing.Iterable[str], concurrency: int = 10
+    ) -> tuple[dict[str, models.HighwayZone], dict[str, Exception]]:
+        """Get many highway zones at once, at most ``concurrency`` at a time.
+
+        Duplicate IDs are only requested once. Use ``iter_by_ids`` to handle
+        each result as soon as it arrives instead.
+
+        Parameters
+        ----------
+        zone_slugs : typing.Iterable[str]
+            The slug names of the zones to retrieve.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Returns
+        -------
+        tuple[dict[str, models.HighwayZone], dict[str, Exception]]
+            The retrieved highway zones by ID, and the error by ID for
+            each one that could not be retrieved.
+        """
+
+        return await self._api_ids_get(
+            zone_slugs, CaicApiEndpoints.ZONES, models.HighwayZone, concurrency
+        )
+
+    async def hydrate_field_reports(
+        self,
+        observations: typing.Iterable[models.AvalancheObservation],
+        concurrency: int = 10,
+    ) -> tuple[dict[str, models.FieldReport], dict[str, Exception]]:
+        """Get the parent field report of many avalanche observations at once.
+
+        Each distinct parent report is requested once, at most ``concurrency``
+        at a time, and attached to its observations - see
+        ``models.AvalancheObservation.field_report``. Observations whose
+        report could not be retrieved are left without one.
+
+        Parameters
+        ----------
+        observations : typing.Iterable[models.AvalancheObservation]
+            The avalanche observations to hydrate, eg. from ``avy_obs``.
+        concurrency : int, optional
+            The maximum number of requests at once, by default 10.
+
+        Returns
+        -------
+        tuple[dict[str, models.FieldReport], dict[str, Exception]]
+            The retrieved field reports by ID, and the error by ID for
+            each one that could not be retrieved.
+        """
+
+        observations = [ob for ob in observations if ob.field_report_id is not None]
+
+        reports, failures = await self.field_reports_by_ids(
+            (ob.field_report_id for ob in observations), concurrency
+        )
+
+        for ob in observations:
+            ob.attach_field_report(reports.get(ob.field_report_id))
+
+        return reports, failures
+
     async def avy_forecast(
         self, date: str
     ) -> list[models.AvalancheForecast | models.RegionalDiscussionForecast]:
@@ -673,40 +2256,59 @@ class CaicClient:
             A list of returned forecasts. The list should contain two types.
             The localized forecast for detailed areas of CO, and the regional
             discussion pieces that cover broader portions of the state.
+            Invalid forecasts are logged and left out.
         """
 
         params = {"datetime": date, "includeExpired": "true"}
-        resp = await self._proxy_get(
+        body = await self._proxy_get_raw(
             proxy_endpoint=ProxyEndpoints.AVID,
             proxy_uri="/products/all",
             proxy_params=params,
         )
 
-        ret = []
-
-        if resp:
-            try:
-                for item in resp:
-                    if (
-                        isinstance(item, dict)
-                        and item.get("type") == "avalancheforecast"
-                    ):
-                        ret.append(models.AvalancheForecast(**item))
-                    else:
-                        ret.append(models.RegionalDiscussionForecast(**item))
-            except pydantic.ValidationError as err:
-                LOGGER.error("Unable to decode forecast response: %s", str(err))
+        forecasts, valid = _validate_forecasts(self._decode(body))
+        if not valid:
+            await self._evict(
+                CaicURLs.HOME + ProxyEndpoints.AVID,
+                _proxy_params("/products/all", params),
+            )
 
-        return ret
+        return forecasts
 
 class SyncCaicClient:
-    """A syncronous HTTP client for the CAIC API(s)."""
+    """A syncronous HTTP client for the CAIC API(s).
+
+    Parameters
+    ----------
+    retry_policy : retry.RetryPolicy | None, optional
+        How failed requests are retried, by default ``retry.RetryPolicy()``.
+    persistent_cache : cache.SqliteCache | None, optional
+        Keep the responses of historical queries on disk, across runs,
+        by default None.
+    loads : Loads, optional
+        Decodes response bodies, eg. ``orjson.loads`` for speed.
+        By default ``json.loads``.
+    validate_json : bool, optional
+        Validate API responses straight from their raw bytes, which is faster
+        and bypasses ``loads``. By default True.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        retry_policy: retry.RetryPolicy | None = None,
+        persistent_cache: cache.SqliteCache | None = None,
+        loads: Loads = json.loads,
+        validate_json: bool = True,
+    ) -> None:
+        self.loads = loads
+        self.validate_json = validate_json
+        self.retry_policy = retry_policy or retry.RetryPolicy()
+        self.persistent_cache = persistent_cache
         self.headers = {
             "User-Agent": f"caic-python/{__version__}"
         }
         self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     def close(self) -> None:
         """Close the underlying session."""
@@ -718,6 +2320,8 @@ class SyncCaicClient:
 
         Meant to be ``CaicURLs`` agnostic, so pass in a full URL.
 
+        Failed requests are retried according to ``self.retry_policy``.
+
         Parameters
         ----------
         url : str
@@ -729,49 +2333,128 @@ class SyncCaicClient:
         Returns
         -------
         dict
-            The return from ``requests.Response.json`` if, this call, or
-            the HTTP request itself, did not throw an error.
+            The decoded JSON body if the HTTP request did not throw an error.
 
         Raises
         ------
         errors.CaicRequestException
             For common HTTP errors, a >400 response status,
-            a ``requests.RequestException``, or a ``JSONDecodeError``.
+            a ``requests.RequestException``, or an error from ``self.loads``,
+            once the retry policy gives up.
+        """
+
+        return self._decode(self._get_raw(url, params))
+
+    def _decode(self, body: bytes) -> typing.Any:
+        """Decode a response body with ``self.loads``, see ``CaicClient._decode``."""
+
+        try:
+            return self.loads(body)
+        except Exception as err:  # pylint: disable=W0718
+            raise errors.CaicRequestException(
+                f"Error decoding CAIC response: {err}"
+            ) from err
+
+    def _validate(self, type_: typing.Any, body: bytes) -> typing.Any:
+        """Validate a raw response body as ``type_``, see ``CaicClient._validate``."""
+
+        adapter = _type_adapter(type_)
+
+        if not self.validate_json:
+            return adapter.validate_python(self._decode(body))
+
+        try:
+            return adapter.validate_json(body)
+        except pydantic.ValidationError as err:
+            if any(error["type"] == "json_invalid" for error in err.errors()):
+                raise errors.CaicRequestException(
+                    f"Error decoding CAIC response: {err}"
+                ) from err
+            raise
+
+    def _get_raw(self, url: str, params: dict | list | None = None) -> bytes:
+        """
+        Get the raw body of a URL, see ``_get``.
+
+        Historical responses are served from, and saved to,
+        ``self.persistent_cache`` when there is one.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            For common HTTP errors, a >400 response status, or a
+            ``requests.RequestException``, once the retry policy gives up.
         """
 
-        data = {}
+        key = None
+        persistent = self.persistent_cache
+        if persistent is not None and persistent.is_immutable(params):
+            key = persistent.key(url, params)
+            body = persistent.get(key)
+            if body is not None:
+                return body
+
+        attempt = 0
+
+        while True:
+            try:
+                body = self._get_once(url, params)
+                break
+            except errors.CaicRequestException as err:
+                if not self.retry_policy.should_retry(attempt, err):
+                    raise
+
+                wait = self.retry_policy.backoff(attempt, err.retry_after)
+                LOGGER.warning(
+                    "Retrying '%s' in %.2f seconds (attempt %s): %s",
+                    url,
+                    wait,
+                    attempt + 1,
+                    err,
+                )
+                time.sleep(wait)
+                attempt += 1
+
+        if key is not None:
+            persistent.store(key, body)
+
+        return body
+
+    def _evict(self, url: str, params: dict | list | None = None) -> None:
+        """Drop a response that failed validation from ``self.persistent_cache``."""
+
+        persistent = self.persistent_cache
+        if persistent is not None and persistent.is_immutable(params):
+            persistent.evict(persistent.key(url, params))
+
+    def _get_once(self, url: str, params: dict | list | None = None) -> bytes:
+        """A single attempt of ``_get_raw``, without retries or the persistent cache."""
 
         try:
             resp = self.session.get(url, params=params)
-            print("Response status:", resp.status_code)
             if resp.status_code >= 400:
                 error = resp.text
                 raise errors.CaicRequestException(
-                    f"Error status from CAIC: {resp.status_code} - {error}"
+                    f"Error status from CAIC: {resp.status_code} - {error}",
+                    status=resp.status_code,
+                    retry_after=resp.headers.get("Retry-After"),
                 )
-        
-            # print("Response JSON:", resp.json())  # Debugging
-            data = resp.json()
 
         except requests.RequestException as err:
             raise errors.CaicRequestException(
                 f"Error connecting to CAIC: {err}"
             ) from err
-        except JSONDecodeError as err:
-            raise errors.CaicRequestException(
-                f"Error decoding CAIC response: {err}"
-            ) from err
 
         else:
-            return data
+            return resp.content
 
     def _api_id_get(
         self, obj_id: str, endpoint: str, resp_model: pydantic.BaseModel
     ) -> models.FieldReport | None:
-        resp_data = self._get(f"{CaicURLs.API}/{endpoint}/{obj_id}.json")
+        body = self._get_raw(f"{CaicURLs.API}/{endpoint}/{obj_id}.json")
 
         try:
-            return resp_model(**resp_data)
+            return self._validate(resp_model, body)
         except pydantic.ValidationError as err:
             LOGGER.warning(
                 "Error parsing '%s' response (ID: %s): %s", endpoint, obj_id, str(err)
@@ -780,7 +2463,7 @@ class SyncCaicClient:
 
     def _api_paginate_get(
         self, page: int, per: int, uri: str, params: typing.Mapping | None = None
-    ) -> dict:
+    ) -> bytes:
         """
         A paginated get request to the CAIC API.
 
@@ -802,25 +2485,18 @@ class SyncCaicClient:
 
         Returns
         -------
-        dict | None
-            The API's JSON response as a dict.
+        bytes
+            The API's raw JSON response.
 
         Raises
         ------
         errors.CaicRequestException
-            If raised by ``_get``,
+            If raised by ``_get_raw``,
         """
 
-        if params is None:
-            params = {}
+        LOGGER.debug("Requesting page %s of '%s'.", page, uri)
 
-        params["per"] = per
-        params["page"] = page
-
-        print(CaicURLs.API + uri)
-        data = self._get(CaicURLs.API + uri, params=params)
-
-        return data
+        return self._get_raw(CaicURLs.API + uri, params=_page_params(page, per, params))
 
     def _api_paginator(
         self,
@@ -911,16 +2587,14 @@ class SyncCaicClient:
                     retry_count += 1
                 continue
 
-            if len(resp) < per:
-                LOGGER.info("Got all the results for the query: %s", str(params))
-                paginating = False
-
             try:
                 if resp_model == models.V1AvyResponse:
-                    obj = resp_model(**resp)
+                    obj = self._validate(resp_model, resp)
+                    count = len(obj.data)
                 else:
-                    obj = [resp_model(**item) for item in resp]
-            except pydantic.ValidationError as err:
+                    obj = self._validate(list[resp_model], resp)
+                    count = len(obj)
+            except (errors.CaicRequestException, pydantic.ValidationError) as err:
                 LOGGER.warning(
                     "Unable to validate response from the '%s' endpoint "
                     "(Page# %s - Query (%s)): %s",
@@ -929,6 +2603,7 @@ class SyncCaicClient:
                     str(params),
                     str(err),
                 )
+                self._evict(CaicURLs.API + endpoint, _page_params(page, per, params))
                 # Can't find a way around the duplicate code here.
                 if page_retries == retries:
                     page += 1
@@ -939,6 +2614,10 @@ class SyncCaicClient:
                     retry_count += 1
                 continue
 
+            if count < per:
+                LOGGER.info("Got all the results for the query: %s", str(params))
+                paginating = False
+
             if page == page_limit:
                 LOGGER.warning("Reached the page limit before all pages downloaded.")
                 paginating = False
@@ -983,9 +2662,10 @@ class SyncCaicClient:
         dict | list
             The response raw response, or None
         """
-        proxy_params_str = "&".join([f"{k}={v}" for k, v in proxy_params.items()])
-        params = {"_api_proxy_uri": f"{proxy_uri}?{proxy_params_str}"}
-        return self._get(CaicURLs.HOME + proxy_endpoint, params=params)
+        return self._get(
+            CaicURLs.HOME + proxy_endpoint,
+            params=_proxy_params(proxy_uri, proxy_params),
+        )
 
     def avy_obs(
         self, start: str, end: str, page_limit: int = 1000, ver1: bool = False
@@ -1266,6 +2946,7 @@ class SyncCaicClient:
             A list of returned forecasts. The list should contain two types.
             The localized forecast for detailed areas of CO, and the regional
             discussion pieces that cover broader portions of the state.
+            Invalid forecasts are logged and left out.
         """
 
         params = {"datetime": date, "includeExpired": "true"}
@@ -1275,19 +2956,11 @@ class SyncCaicClient:
             proxy_params=params,
         )
 
-        ret = []
-
-        if resp:
-            try:
-                for item in resp:
-                    if (
-                        isinstance(item, dict)
-                        and item.get("type") == "avalancheforecast"
-                    ):
-                        ret.append(models.AvalancheForecast(**item))
-                    else:
-                        ret.append(models.RegionalDiscussionForecast(**item))
-            except pydantic.ValidationError as err:
-                LOGGER.error("Unable to decode forecast response: %s", str(err))
+        forecasts, valid = _validate_forecasts(resp)
+        if not valid:
+            self._evict(
+                CaicURLs.HOME + ProxyEndpoints.AVID,
+                _proxy_params("/products/all", params),
+            )
 
-        return ret
\ No newline at end of file
+        return forecasts
\ No newline at end of file
@@ -1,4 +1,16 @@
 """caic-python errors."""
 
 class CaicRequestException(Exception):
-    """An exception that ocurred during a request to the CAIC website."""
+    """An exception that ocurred during a request to the CAIC website.
+
+    ``status`` is the HTTP status of the response, or None if no response
+    was received. ``retry_after`` is the response's ``Retry-After`` header,
+    if it had one.
+    """
+
+    def __init__(
+        self, *args, status: int | None = None, retry_after: str | None = None
+    ) -> None:
+        super().__init__(*args)
+        self.status = status
+        self.retry_after = retry_after
@@ -0,0 +1,368 @@
+"""Export observations, field reports and forecasts to Arrow and Parquet.
+
+Objects are converted to Arrow record batches a batch at a time, so results
+can be streamed straight from ``CaicClient.iter_avy_obs``,
+``CaicClient.iter_field_reports`` or ``CaicClient.avy_forecast`` to Parquet
+without holding every object in memory::
+
+    files = await export.write_parquet(
+        client.iter_avy_obs(start, end), "avalanches/"
+    )
+
+The Arrow schema comes from the model's annotations: numbers, booleans and
+strings keep their type, datetimes become UTC timestamps, enums become
+dictionary-encoded strings, and nested objects become JSON strings.
+
+Requires ``pyarrow`` - ``pip install caic_python[parquet]``.
+"""
+
+import collections
+import datetime
+import enum
+import os
+import pathlib
+import re
+import typing
+import uuid
+
+import pydantic
+import pydantic_core
+
+from . import utils
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as err:
+    raise ImportError(
+        "caic_python.export requires pyarrow - pip install caic_python[parquet]"
+    ) from err
+
+
+DEFAULT_BATCH_SIZE = 10_000
+"""The number of objects in each record batch (and Parquet row group)."""
+
+UNKNOWN_PARTITION = "unknown"
+"""The partition of objects without a date or zone."""
+
+DEFAULT_MAX_OPEN_FILES = 64
+"""The most Parquet files ``write_parquet`` keeps open at once."""
+
+
+def _field_type(
+    annotation: typing.Any,
+) -> tuple[pa.DataType, typing.Callable | None]:
+    """The Arrow type of a field, and how to convert its values, if needed."""
+
+    args = [arg for arg in utils.union_args(annotation) if arg is not type(None)]
+
+    if args and all(arg is int for arg in args):
+        return pa.int64(), None
+    if args and all(arg in (int, float) for arg in args):
+        return pa.float64(), None
+    if args == [bool]:
+        return pa.bool_(), None
+    if args == [datetime.datetime]:
+        return pa.timestamp("us", tz="UTC"), _to_utc
+    if len(args) == 1 and isinstance(args[0], type) and issubclass(args[0], enum.Enum):
+        return pa.dictionary(pa.int32(), pa.string()), _enum_value
+    if args == [str]:
+        return pa.string(), None
+    if args and all(arg in (int, float, str) for arg in args):
+        return pa.string(), str
+
+    return pa.string(), _to_json
+
+
+def _to_utc(value: datetime.datetime) -> datetime.datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+
+    return value
+
+
+def _enum_value(value: enum.Enum | str) -> str:
+    return str(value.value if isinstance(value, enum.Enum) else value)
+
+
+def _to_json(value: typing.Any) -> str:
+    return pydantic_core.to_json(value).decode()
+
+
+def arrow_schema(model: type[pydantic.BaseModel]) -> pa.Schema:
+    """
+    Get the Arrow schema of a model.
+
+    Parameters
+    ----------
+    model : type[pydantic.BaseModel]
+        The model, eg. ``models.AvalancheObservation``.
+
+    Returns
+    -------
+    pa.Schema
+        One nullable Arrow field per model field, in order.
+    """
+
+    return pa.schema(
+        [
+            pa.field(name, _field_type(field.annotation)[0])
+            for name, field in model.model_fields.items()
+        ]
+    )
+
+
+def to_record_batch(
+    objs: typing.Sequence[pydantic.BaseModel],
+    model: type[pydantic.BaseModel] | None = None,
+) -> pa.RecordBatch:
+    """
+    Convert objects of a single model to an Arrow record batch.
+
+    Parameters
+    ----------
+    objs : typing.Sequence[pydantic.BaseModel]
+        The objects to convert.
+    model : type[pydantic.BaseModel] | None, optional
+        The model of the objects, by default the type of the first one.
+
+    Returns
+    -------
+    pa.RecordBatch
+        The objects, with the schema of ``arrow_schema(model)``.
+    """
+
+    if model is None:
+        model = type(objs[0])
+
+    schema = arrow_schema(model)
+    arrays = []
+
+    for name, field in model.model_fields.items():
+        convert = _field_type(field.annotation)[1]
+        values = [getattr(obj, name, None) for obj in objs]
+        if convert is not None:
+            values = [None if value is None else convert(value) for value in values]
+
+        arrow_type = schema.field(name).type
+        if pa.types.is_dictionary(arrow_type):
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, arrow_type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_record_batches(
+    objs: typing.Iterable[pydantic.BaseModel],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> typing.Iterator[pa.RecordBatch]:
+    """
+    Stream objects into Arrow record batches of at most ``batch_size`` rows.
+
+    A new batch is started whenever the model changes, as with the two kinds
+    of forecast returned by ``CaicClient.avy_forecast``.
+
+    Parameters
+    ----------
+    objs : typing.Iterable[pydantic.BaseModel]
+        The objects to convert.
+    batch_size : int, optional
+        The maximum rows per batch, by default ``DEFAULT_BATCH_SIZE``.
+
+    Yields
+    ------
+    pa.RecordBatch
+        Each batch, as soon as it is full.
+    """
+
+    batch = []
+    for obj in objs:
+        if batch and (len(batch) >= batch_size or type(obj) is not type(batch[0])):
+            yield to_record_batch(batch)
+            batch = []
+        batch.append(obj)
+
+    if batch:
+        yield to_record_batch(batch)
+
+
+def partition_of(obj: pydantic.BaseModel) -> tuple[str, str]:
+    """
+    Get the season and zone partition of an object.
+
+    The season comes from ``observed_at`` (or a forecast's ``issueDateTime``),
+    see ``utils.avalanche_season``. The zone is the ID of the object's
+    backcountry zone - from ``backcountry_zone`` or ``backcountry_zone_id``,
+    so field reports and observations of a zone share a partition - or a
+    forecast's ``areaId``.
+
+    Parameters
+    ----------
+    obj : pydantic.BaseModel
+        An observation, field report or forecast.
+
+    Returns
+    -------
+    tuple[str, str]
+        The season and zone, ``UNKNOWN_PARTITION`` for either if not known.
+    """
+
+    when = getattr(obj, "observed_at", None) or getattr(obj, "issueDateTime", None)
+
+    zone = (
+        getattr(getattr(obj, "backcountry_zone", None), "id", None)
+        or getattr(obj, "backcountry_zone_id", None)
+        or getattr(obj, "areaId", None)
+    )
+
+    return (
+        utils.avalanche_season(when) or UNKNOWN_PARTITION,
+        _safe_name(zone) if zone else UNKNOWN_PARTITION,
+    )
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^\w.-]+", "-", str(value)).strip("-") or UNKNOWN_PARTITION
+
+
+class _PartitionedWriter:
+    """Buffers objects per partition and writes full batches to Parquet.
+
+    File names are unique to each run, so exports into the same root add
+    files rather than overwrite them. When ``max_open_files`` writers are
+    open, the least recently used one is closed, and its partition gets a
+    new file if it needs writing again.
+    """
+
+    def __init__(
+        self,
+        root: pathlib.Path,
+        batch_size: int,
+        partition: bool,
+        max_open_files: int,
+        **writer_kwargs,
+    ) -> None:
+        self.root = root
+        self.batch_size = batch_size
+        self.partition = partition
+        self.max_open_files = max(max_open_files, 1)
+        self.writer_kwargs = writer_kwargs
+        self.run = uuid.uuid4().hex
+        self.buffers: dict[tuple, list[pydantic.BaseModel]] = {}
+        self.writers: collections.OrderedDict[tuple, pq.ParquetWriter] = (
+            collections.OrderedDict()
+        )
+        self.parts: dict[tuple, int] = {}
+        self.paths: list[pathlib.Path] = []
+
+    def add(self, obj: pydantic.BaseModel) -> None:
+        """Buffer ``obj`` in its partition, flushing the buffer once it's full."""
+
+        key = (type(obj),) + (partition_of(obj) if self.partition else ())
+        buffer = self.buffers.setdefault(key, [])
+        buffer.append(obj)
+        if len(buffer) >= self.batch_size:
+            self.flush(key)
+
+    def flush(self, key: tuple) -> None:
+        """Write the buffer of ``key`` as one batch, opening a writer if needed."""
+
+        buffer = self.buffers.pop(key, None)
+        if not buffer:
+            return
+
+        if key in self.writers:
+            self.writers.move_to_end(key)
+        else:
+            while len(self.writers) >= self.max_open_files:
+                self.writers.popitem(last=False)[1].close()
+
+            model, *partitions = key
+            path = self.root / model.__name__
+            if partitions:
+                season, zone = partitions
+                path = path / f"season={season}" / f"zone={zone}"
+            path.mkdir(parents=True, exist_ok=True)
+
+            part = self.parts.get(key, 0)
+            self.parts[key] = part + 1
+            path = path / f"part-{self.run}-{part}.parquet"
+
+            self.writers[key] = pq.ParquetWriter(
+                path, arrow_schema(model), **self.writer_kwargs
+            )
+            self.paths.append(path)
+
+        self.writers[key].write_batch(to_record_batch(buffer, key[0]))
+
+    def close(self) -> None:
+        """Flush every buffer and close all open writers."""
+
+        try:
+            for key in list(self.buffers):
+                self.flush(key)
+        finally:
+            while self.writers:
+                self.writers.popitem(last=False)[1].close()
+
+
+async def write_parquet(
+    objs: (
+        typing.Iterable[pydantic.BaseModel] | typing.AsyncIterable[pydantic.BaseModel]
+    ),
+    root: str | os.PathLike,
+    partition: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+    **writer_kwargs,
+) -> list[pathlib.Path]:
+    """
+    Stream objects to Parquet files, partitioned by season and zone.
+
+    Files are laid out as ``<root>/<model>/season=<season>/zone=<zone>/``
+    ``part-<run>-<n>.parquet`` (Hive partitioning), see ``partition_of``.
+    Each model gets its own directory, as their schemas differ. Every call
+    writes new files, so several exports can share a root. At most
+    ``batch_size`` objects per partition are held in memory at once.
+
+    Parameters
+    ----------
+    objs : typing.Iterable | typing.AsyncIterable
+        The objects to write, eg. ``client.iter_field_reports(start, end)``
+        or the list returned by ``client.avy_forecast(date)``.
+    root : str | os.PathLike
+        The directory to write to.
+    partition : bool, optional
+        Partition by season and zone, by default True. Otherwise each model
+        is written straight to ``<root>/<model>/``.
+    batch_size : int, optional
+        The rows per Parquet row group, by default ``DEFAULT_BATCH_SIZE``.
+    max_open_files : int, optional
+        The most files to keep open at once, by default
+        ``DEFAULT_MAX_OPEN_FILES``. Partitions whose file was closed to stay
+        under this get another file.
+    writer_kwargs
+        Passed to each ``pyarrow.parquet.ParquetWriter``, eg. ``compression``.
+
+    Returns
+    -------
+    list[pathlib.Path]
+        The files written.
+    """
+
+    writer = _PartitionedWriter(
+        pathlib.Path(root), batch_size, partition, max_open_files, **writer_kwargs
+    )
+
+    try:
+        if hasattr(objs, "__aiter__"):
+            async for obj in objs:
+                writer.add(obj)
+        else:
+            for obj in objs:
+                writer.add(obj)
+    finally:
+        writer.close()
+
+    return writer.paths
@@ -0,0 +1,320 @@
+"""Columnar containers for observations, backed by NumPy arrays.
+
+An ``ObservationFrame`` holds a set of observations as one array per field,
+rather than as a list of ``pydantic`` objects. Numeric fields become
+``float64`` arrays (NaN when missing), datetimes ``datetime64[us]`` arrays in
+UTC (NaT when missing), and enums and booleans categorical codes (-1 when
+missing). Other scalar fields are kept as object arrays, and nested objects
+are left out.
+
+Requires ``numpy`` - ``pip install caic_python[frame]``. ``to_pandas`` also
+requires ``pandas``.
+"""
+
+import datetime
+import enum
+import json
+import typing
+
+import dateutil.parser
+import pydantic
+
+from . import utils
+from .client import Loads
+
+try:
+    import numpy as np
+except ImportError as err:
+    raise ImportError(
+        "caic_python.frame requires numpy - pip install caic_python[frame]"
+    ) from err
+
+
+FLOAT = "float"
+DATETIME = "datetime"
+CATEGORY = "category"
+OBJECT = "object"
+
+
+class Column(typing.NamedTuple):
+    """How a model field is stored in an ``ObservationFrame``."""
+
+    name: str
+    kind: str
+    categories: tuple = ()
+
+
+def _column(name: str, annotation: typing.Any) -> Column | None:
+    """Pick the storage of a field from its annotation, None to leave it out."""
+
+    args = [arg for arg in utils.union_args(annotation) if arg is not type(None)]
+
+    if not args:
+        return None
+    if all(arg in (int, float) for arg in args):
+        return Column(name, FLOAT)
+    if args == [datetime.datetime]:
+        return Column(name, DATETIME)
+    if args == [bool]:
+        return Column(name, CATEGORY, (False, True))
+    if len(args) == 1 and isinstance(args[0], type) and issubclass(args[0], enum.Enum):
+        return Column(name, CATEGORY, tuple(member.value for member in args[0]))
+    if all(arg in (int, float, str) for arg in args):
+        return Column(name, OBJECT)
+
+    return None
+
+
+def columns_of(
+    model: type[pydantic.BaseModel], fields: typing.Iterable[str] | None = None
+) -> list[Column]:
+    """
+    Get the columns an ``ObservationFrame`` keeps for a model.
+
+    Parameters
+    ----------
+    model : type[pydantic.BaseModel]
+        The model of the observations, eg. ``models.AvalancheObservation``.
+    fields : typing.Iterable[str] | None, optional
+        Only keep these fields, by default None (every scalar field).
+
+    Returns
+    -------
+    list[Column]
+        The columns, in the model's field order.
+    """
+
+    wanted = None if fields is None else set(fields)
+    columns = []
+
+    for name, field in model.model_fields.items():
+        if wanted is not None and name not in wanted:
+            continue
+        column = _column(name, field.annotation)
+        if column is not None:
+            columns.append(column)
+
+    return columns
+
+
+def _to_datetime64(value: typing.Any) -> np.datetime64:
+    if value is None:
+        return np.datetime64("NaT", "us")
+    if isinstance(value, str):
+        value = dateutil.parser.isoparse(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    return np.datetime64(value, "us")
+
+
+def _build(column: Column, values: list) -> np.ndarray:
+    """Convert the raw values of a column to its array."""
+
+    if column.kind == FLOAT:
+        return np.fromiter(
+            (np.nan if value is None else value for value in values),
+            dtype=np.float64,
+            count=len(values),
+        )
+
+    if column.kind == DATETIME:
+        return np.fromiter(
+            (_to_datetime64(value) for value in values),
+            dtype="datetime64[us]",
+            count=len(values),
+        )
+
+    if column.kind == CATEGORY:
+        codes = {category: code for code, category in enumerate(column.categories)}
+        return np.fromiter(
+            (
+                codes.get(value.value if isinstance(value, enum.Enum) else value, -1)
+                for value in values
+            ),
+            dtype=np.int16,
+            count=len(values),
+        )
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+class ObservationFrame:
+    """A columnar set of observations, one NumPy array per field.
+
+    Build one with ``from_models`` or ``from_records``. Index a frame with a
+    field name to get its array, or with a boolean mask, slice or index
+    array to get a new frame with just those rows::
+
+        frame = ObservationFrame.from_models(await client.avy_obs(start, end))
+        high = frame[frame["elevation_feet"] > 11000]
+        print(np.nanmean(high["crown_average"]))
+
+    Parameters
+    ----------
+    columns : list[Column]
+        The columns of the frame.
+    arrays : dict[str, np.ndarray]
+        The array of each column, all of the same length.
+    """
+
+    def __init__(self, columns: list[Column], arrays: dict[str, np.ndarray]) -> None:
+        self.columns = {column.name: column for column in columns}
+        self.arrays = arrays
+
+    def __len__(self) -> int:
+        return len(next(iter(self.arrays.values()))) if self.arrays else 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays
+
+    def __getitem__(self, key: typing.Any) -> "np.ndarray | ObservationFrame":
+        if isinstance(key, str):
+            return self.arrays[key]
+
+        return ObservationFrame(
+            list(self.columns.values()),
+            {name: array[key] for name, array in self.arrays.items()},
+        )
+
+    @classmethod
+    def from_models(
+        cls,
+        objs: typing.Iterable[pydantic.BaseModel],
+        model: type[pydantic.BaseModel] | None = None,
+        fields: typing.Iterable[str] | None = None,
+    ) -> "ObservationFrame":
+        """
+        Build a frame from observation objects.
+
+        Parameters
+        ----------
+        objs : typing.Iterable[pydantic.BaseModel]
+            The observations, eg. from ``CaicClient.avy_obs``, or the pages
+            of ``CaicClient.iter_avy_obs(pages=True)`` chained together.
+        model : type[pydantic.BaseModel] | None, optional
+            The model of the observations, by default the type of the first.
+        fields : typing.Iterable[str] | None, optional
+            Only keep these fields, by default None (every scalar field).
+
+        Returns
+        -------
+        ObservationFrame
+            The observations, as columns.
+        """
+
+        objs = list(objs)
+        if model is None:
+            if not objs:
+                return cls([], {})
+            model = type(objs[0])
+
+        columns = columns_of(model, fields)
+
+        return cls(
+            columns,
+            {
+                column.name: _build(
+                    column, [getattr(obj, column.name, None) for obj in objs]
+                )
+                for column in columns
+            },
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        records: typing.Iterable[typing.Mapping | bytes | str],
+        model: type[pydantic.BaseModel],
+        fields: typing.Iterable[str] | None = None,
+        loads: Loads = json.loads,
+    ) -> "ObservationFrame":
+        """
+        Build a frame straight from raw API records, skipping ``pydantic``.
+
+        Values are converted according to ``model``'s annotations, but not
+        validated.
+
+        Parameters
+        ----------
+        records : typing.Iterable[typing.Mapping | bytes | str]
+            The decoded records, or raw JSON pages (lists of records)
+            to decode.
+        model : type[pydantic.BaseModel]
+            The model the records would be validated as, eg.
+            ``models.WeatherObservation``.
+        fields : typing.Iterable[str] | None, optional
+            Only keep these fields, by default None (every scalar field).
+        loads : Loads, optional
+            Decodes raw JSON pages, eg. the ``loads`` of the client they came
+            from. By default ``json.loads``.
+
+        Returns
+        -------
+        ObservationFrame
+            The records, as columns.
+        """
+
+        rows = []
+        for record in records:
+            if isinstance(record, (bytes, str)):
+                rows.extend(loads(record))
+            else:
+                rows.append(record)
+
+        columns = columns_of(model, fields)
+
+        return cls(
+            columns,
+            {
+                column.name: _build(column, [row.get(column.name) for row in rows])
+                for column in columns
+            },
+        )
+
+    def categories(self, name: str) -> tuple:
+        """The categories of a categorical column, indexed by its codes."""
+
+        return self.columns[name].categories
+
+    def decode(self, name: str) -> np.ndarray:
+        """The values of a categorical column, with None where missing."""
+
+        categories = np.empty(len(self.columns[name].categories) + 1, dtype=object)
+        categories[:-1] = self.columns[name].categories
+        categories[-1] = None
+
+        return categories[self.arrays[name]]
+
+    def to_pandas(self):
+        """
+        Get the frame as a ``pandas.DataFrame``, without copying numeric columns.
+
+        Categorical columns become ``pandas.Categorical`` columns built from
+        their codes.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The frame's columns, in order.
+
+        Raises
+        ------
+        ImportError
+            If ``pandas`` is not installed.
+        """
+
+        import pandas as pd  # pylint: disable=C0415
+
+        data = {}
+        for name, column in self.columns.items():
+            if column.kind == CATEGORY:
+                data[name] = pd.Categorical.from_codes(
+                    self.arrays[name], categories=list(column.categories)
+                )
+            else:
+                data[name] = self.arrays[name]
+
+        return pd.DataFrame(data, copy=False)
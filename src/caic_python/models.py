@@ -1,7 +1,8 @@
 """Pydantic models used by caic-python."""
 
 import datetime
-from typing import Literal, Optional, Union
+import functools
+from typing import Annotated, Any, ClassVar, Iterable, Literal, Optional, Union
 
 import pydantic
 
@@ -172,6 +173,23 @@ class RegionalDiscussionForecast(pydantic.BaseModel):
     media: ForecastMedia
 
 
+def _forecast_tag(item) -> str:
+    """Tell the two kinds of forecast apart by their ``type``."""
+
+    kind = item.get("type") if isinstance(item, dict) else getattr(item, "type", None)
+    return "avalanche" if kind == "avalancheforecast" else "regional"
+
+
+Forecast = Annotated[
+    Union[
+        Annotated[AvalancheForecast, pydantic.Tag("avalanche")],
+        Annotated[RegionalDiscussionForecast, pydantic.Tag("regional")],
+    ],
+    pydantic.Discriminator(_forecast_tag),
+]
+"""Either kind of forecast returned by ``CaicClient.avy_forecast``."""
+
+
 class V1AvalancheObservation(pydantic.BaseModel):
     """A single avalanche observation from the /api/avalanche_observations endpoint.
 
@@ -309,14 +327,42 @@ class AvalancheObservation(pydantic.BaseModel):
     observation_report: Optional[ObsReport] = None
     avalanche_detail: Optional[AvalancheDetail] = None
 
-    async def fieldobs(self, caic_client) -> Union["FieldReport", None]:
-        """Get the associated ``FieldReport`` using the provided ``CaicClient``."""
+    _field_report: Optional["FieldReport"] = pydantic.PrivateAttr(default=None)
+
+    @property
+    def field_report(self) -> Union["FieldReport", None]:
+        """The parent ``FieldReport``, once attached by ``fieldobs`` or
+        ``CaicClient.hydrate_field_reports``."""
 
-        if self.id is not None:
-            return await caic_client.field_report(self.id)
+        return self._field_report
+
+    @property
+    def field_report_id(self) -> str | None:
+        """The ID of the parent ``FieldReport``, if known."""
+
+        if self.observation_report is not None:
+            return self.observation_report.id
 
         return None
 
+    def attach_field_report(self, report: Union["FieldReport", None]) -> None:
+        """Attach the parent ``FieldReport``, see ``field_report``."""
+
+        self._field_report = report
+
+    async def fieldobs(self, caic_client) -> Union["FieldReport", None]:
+        """Get the associated ``FieldReport`` using the provided ``CaicClient``.
+
+        The report is attached to this observation, so later calls (and
+        observations hydrated by ``CaicClient.hydrate_field_reports``) don't
+        make a request.
+        """
+
+        if self._field_report is None and self.field_report_id is not None:
+            self._field_report = await caic_client.field_report(self.field_report_id)
+
+        return self._field_report
+
 
 class CaicResponseMeta(pydantic.BaseModel):
     """The ``meta`` portion of a ``V1AvyResponse``.
@@ -526,3 +572,161 @@ class FieldReport(pydantic.BaseModel):
     is_anonymous_location: Optional[bool] = None
     latitude: Optional[float] = None
     longitude: Optional[float] = None
+
+
+class _LazyFieldReportBase(pydantic.BaseModel):
+    """The nested collections of a ``LazyFieldReport``, validated on first access."""
+
+    lazy_types: ClassVar[dict[str, pydantic.TypeAdapter]] = {
+        name: pydantic.TypeAdapter(FieldReport.model_fields[name].annotation)
+        for name in (
+            "avalanche_observations",
+            "weather_observations",
+            "snowpack_observations",
+            "assets",
+        )
+    }
+
+    _raw: dict[str, Any] = pydantic.PrivateAttr(default_factory=dict)
+    _validated: dict[str, Any] = pydantic.PrivateAttr(default_factory=dict)
+
+    @pydantic.model_validator(mode="wrap")
+    @classmethod
+    def _keep_raw(cls, data: Any, handler: pydantic.ValidatorFunctionWrapHandler):
+        """Keep the raw collections, which the fields leave out, for later."""
+
+        report = handler(data)
+        if isinstance(data, dict):
+            report._raw = {name: data[name] for name in cls.lazy_types if name in data}
+
+        return report
+
+    def _lazy(self, name: str) -> Any:
+        if name not in self._validated:
+            self._validated[name] = self.lazy_types[name].validate_python(
+                self._raw.get(name, [])
+            )
+
+        return self._validated[name]
+
+    @property
+    def avalanche_observations(self) -> Optional[list[AvalancheObservation]]:
+        """The report's avalanche observations, validated on first access."""
+
+        return self._lazy("avalanche_observations")
+
+    @property
+    def weather_observations(self) -> Optional[list[WeatherObservation]]:
+        """The report's weather observations, validated on first access."""
+
+        return self._lazy("weather_observations")
+
+    @property
+    def snowpack_observations(self) -> Optional[list[SnowpackObservation]]:
+        """The report's snowpack observations, validated on first access."""
+
+        return self._lazy("snowpack_observations")
+
+    @property
+    def assets(self) -> Optional[list[ObservationAsset]]:
+        """The report's assets, validated on first access."""
+
+        return self._lazy("assets")
+
+
+LazyFieldReport = pydantic.create_model(
+    "LazyFieldReport",
+    __base__=_LazyFieldReportBase,
+    __module__=__name__,
+    __doc__="""A ``FieldReport`` that validates its nested collections lazily.
+
+    ``avalanche_observations``, ``weather_observations``,
+    ``snowpack_observations`` and ``assets`` are kept raw until they are first
+    accessed, so reports that are only used for their top-level fields
+    validate much faster. An invalid collection raises a
+    ``pydantic.ValidationError`` on access instead. As with ``FieldReport``,
+    a missing collection is ``[]`` and a null one ``None``. The collections
+    are left out of ``model_dump``.
+    """,
+    **{
+        name: (field.annotation, field)
+        for name, field in FieldReport.model_fields.items()
+        if name not in _LazyFieldReportBase.lazy_types
+    },
+)
+
+
+def projection(
+    model: type[pydantic.BaseModel], fields: Iterable[str]
+) -> type[pydantic.BaseModel]:
+    """
+    Get a slim version of ``model`` with only some of its fields.
+
+    Only the projected fields are validated and stored, which saves time and
+    memory when just a few of a wide model's fields are needed. ``id`` is
+    always included if ``model`` has one. Projections are built once and
+    reused.
+
+    Parameters
+    ----------
+    model : type[pydantic.BaseModel]
+        The model to project, eg. ``AvalancheObservation``.
+    fields : Iterable[str]
+        The names of the fields to keep.
+
+    Returns
+    -------
+    type[pydantic.BaseModel]
+        A model with only the requested fields.
+
+    Raises
+    ------
+    ValueError
+        If ``model`` has no field by one of the given names.
+    """
+
+    fields = frozenset(fields) | ({"id"} & model.model_fields.keys())
+
+    unknown = fields - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown {model.__name__} fields: {sorted(unknown)}")
+
+    return _projection(model, fields)
+
+
+class _Projection(pydantic.BaseModel):
+    """The base of ``projection`` models, which know the model they project."""
+
+    projected_from: ClassVar[type[pydantic.BaseModel]]
+
+
+@functools.cache
+def _projection(
+    model: type[pydantic.BaseModel], fields: frozenset[str]
+) -> type[pydantic.BaseModel]:
+    projected = pydantic.create_model(
+        f"{model.__name__}Projection",
+        __base__=_Projection,
+        __module__=__name__,
+        **{
+            name: (field.annotation, field)
+            for name, field in model.model_fields.items()
+            if name in fields
+        },
+    )
+    projected.projected_from = model
+
+    return projected
+
+
+@functools.cache
+def v1_avy_response(item_model: type[pydantic.BaseModel]) -> type[V1AvyResponse]:
+    """A ``V1AvyResponse`` whose ``data`` is made of ``item_model`` objects,
+    eg. a ``projection`` of ``AvalancheObservation``."""
+
+    return pydantic.create_model(
+        f"V1AvyResponse{item_model.__name__}",
+        __base__=V1AvyResponse,
+        __module__=__name__,
+        data=(list[item_model], ...),
+    )
@@ -0,0 +1,337 @@
+"""Client-side rate limiting for requests to the CAIC APIs.
+
+A ``RateLimiter`` is shared by every request a ``CaicClient`` makes. For each
+host it combines a ``TokenBucket``, which caps the request rate, with an
+``AIMDController``, which finds the highest sustainable concurrency on its own:
+the limit grows additively while requests succeed, and shrinks multiplicatively
+on 429s, 5xx responses, connection errors, or latency rising well above the
+recent best for the same endpoint.
+"""
+
+import asyncio
+import collections
+import contextlib
+import time
+import typing
+from urllib.parse import urlsplit
+
+from . import LOGGER
+
+
+THROTTLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""Response statuses that mean the CAIC servers want us to back off."""
+
+
+class TokenBucket:
+    """A token bucket that refills at ``rate`` tokens per second, up to ``burst``.
+
+    Parameters
+    ----------
+    rate : float
+        The number of tokens added per second.
+    burst : int, optional
+        The maximum number of tokens the bucket holds, by default 1.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("A token bucket's rate must be positive!")
+
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for, and take, a single token."""
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class LatencyBaseline:
+    """The smoothed latency of an endpoint, and its lowest over a time window.
+
+    The minimum only covers the last ``window`` seconds, so a lucky fast
+    response can't set a baseline that later requests are judged by forever.
+
+    Parameters
+    ----------
+    window : float
+        How long a sample counts towards the minimum, in seconds.
+    smoothing : float
+        The weight of each new sample in the smoothed latency.
+    """
+
+    def __init__(self, window: float, smoothing: float) -> None:
+        self.window = window
+        self.smoothing = smoothing
+        self.latency: float | None = None
+        # Increasing latencies, so the minimum of the window is the first.
+        self._samples: collections.deque[tuple[float, float]] = collections.deque()
+
+    @property
+    def minimum(self) -> float | None:
+        """The lowest latency of the window, or None without samples."""
+
+        return self._samples[0][1] if self._samples else None
+
+    def add(self, latency: float, now: float | None = None) -> None:
+        """Record a latency sample, in seconds."""
+
+        now = time.monotonic() if now is None else now
+
+        while self._samples and self._samples[-1][1] >= latency:
+            self._samples.pop()
+        self._samples.append((now, latency))
+        while self._samples[0][0] < now - self.window:
+            self._samples.popleft()
+
+        self.latency = (
+            latency
+            if self.latency is None
+            else self.smoothing * latency + (1 - self.smoothing) * self.latency
+        )
+
+
+class AIMDController:
+    """An adaptive concurrency limit using additive increase, multiplicative decrease.
+
+    Every successful request raises the limit by ``increase / limit``, so
+    roughly ``increase`` per round of ``limit`` requests. A throttled request
+    multiplies it by ``decrease``, at most once per smoothed round trip so a
+    burst of errors from the same round only counts once.
+
+    Latency is compared per endpoint, since a small lookup and a page of 1000
+    records take very different times, see ``LatencyBaseline``.
+
+    Parameters
+    ----------
+    initial : int, optional
+        The starting concurrency limit, by default 4.
+    minimum : int, optional
+        The lowest the limit may go, by default 1.
+    maximum : int, optional
+        The highest the limit may go, by default 64.
+    increase : float, optional
+        The additive increase per round of successful requests, by default 1.
+    decrease : float, optional
+        The multiplicative decrease on throttling, by default 0.5.
+    latency_factor : float, optional
+        Treat a success as throttling when an endpoint's smoothed latency is
+        this many times its recent lowest, by default 2.
+    smoothing : float, optional
+        The weight of each new sample in the smoothed latency, by default 0.2.
+    baseline_window : float, optional
+        How long, in seconds, a latency counts towards an endpoint's lowest,
+        by default 60.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_factor: float = 2.0,
+        smoothing: float = 0.2,
+        baseline_window: float = 60.0,
+    ) -> None:
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+        self.baseline_window = baseline_window
+        self.in_flight = 0
+        self.latency: float | None = None
+        self.baselines: dict[str, LatencyBaseline] = {}
+        self._last_decrease = 0.0
+        self._waiters: list[asyncio.Future] = []
+
+    async def acquire(self) -> None:
+        """Wait until a request fits within the current limit, then count it."""
+
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Stop counting a finished request and let waiting requests through."""
+
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self, latency: float, endpoint: str = "") -> None:
+        """Record a successful request, growing the limit unless latency is rising.
+
+        Parameters
+        ----------
+        latency : float
+            The time until the response arrived, in seconds.
+        endpoint : str, optional
+            What was requested, eg. the URL path. Latency is only compared
+            with earlier requests of the same endpoint. By default "".
+        """
+
+        self.latency = (
+            latency
+            if self.latency is None
+            else self.smoothing * latency + (1 - self.smoothing) * self.latency
+        )
+
+        if endpoint not in self.baselines:
+            self.baselines[endpoint] = LatencyBaseline(
+                self.baseline_window, self.smoothing
+            )
+        baseline = self.baselines[endpoint]
+        baseline.add(latency)
+
+        if baseline.latency > self.latency_factor * baseline.minimum:
+            self.on_throttle()
+            return
+
+        self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+        self._wake()
+
+    def on_throttle(self) -> None:
+        """Record a throttled or failed request, shrinking the limit."""
+
+        now = time.monotonic()
+        if now - self._last_decrease < (self.latency or 0.0):
+            return
+
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        LOGGER.debug("Lowered the concurrency limit to %.1f", self.limit)
+
+    def _wake(self) -> None:
+        free = int(self.limit) - self.in_flight
+        for waiter in self._waiters[: max(free, 0)]:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class RequestOutcome:
+    """The result of a request, filled in by the caller of ``RateLimiter.request``.
+
+    Setting ``status`` also records when the response arrived, so reading the
+    body doesn't count towards the request's latency.
+    """
+
+    def __init__(self) -> None:
+        self._status: int | None = None
+        self.responded: float | None = None
+
+    @property
+    def status(self) -> int | None:
+        """The response status, None until a response arrives."""
+
+        return self._status
+
+    @status.setter
+    def status(self, status: int | None) -> None:
+        self._status = status
+        self.responded = time.monotonic()
+
+
+class RateLimiter:
+    """Per-host rate and concurrency limits shared by every request of a client.
+
+    With the defaults, nothing is limited. Share one instance between
+    clients to limit them together.
+
+    Parameters
+    ----------
+    rate : float | None, optional
+        The requests per second allowed to each host, None for no limit.
+        By default None.
+    burst : int, optional
+        The number of requests that may go out at once before ``rate``
+        applies, by default 1.
+    adaptive : bool, optional
+        Whether to adapt each host's concurrency with an ``AIMDController``,
+        by default False.
+    aimd_kwargs
+        Passed to each host's ``AIMDController``.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = 1,
+        adaptive: bool = False,
+        **aimd_kwargs,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.adaptive = adaptive
+        self.aimd_kwargs = aimd_kwargs
+        self.buckets: dict[str, TokenBucket] = {}
+        self.controllers: dict[str, AIMDController] = {}
+
+    @contextlib.asynccontextmanager
+    async def request(self, url: str) -> typing.AsyncIterator[RequestOutcome]:
+        """Hold a slot for a request to ``url`` for the duration of the block.
+
+        Set ``status`` on the yielded ``RequestOutcome`` once a response
+        arrives, so the limiter can tell throttling from success. An exception
+        before then counts as a failed connection. Other error statuses, like
+        a 404, neither grow nor shrink the limit.
+        """
+
+        parts = urlsplit(url)
+        host = parts.netloc
+        controller = None
+        if self.adaptive:
+            if host not in self.controllers:
+                self.controllers[host] = AIMDController(**self.aimd_kwargs)
+            controller = self.controllers[host]
+            await controller.acquire()
+
+        try:
+            if self.rate is not None:
+                if host not in self.buckets:
+                    self.buckets[host] = TokenBucket(self.rate, self.burst)
+                await self.buckets[host].acquire()
+
+            outcome = RequestOutcome()
+            start = time.monotonic()
+            try:
+                yield outcome
+            except Exception:
+                if controller and outcome.status is None:
+                    controller.on_throttle()
+                raise
+            finally:
+                if controller and outcome.status is not None:
+                    if outcome.status in THROTTLE_STATUSES:
+                        controller.on_throttle()
+                    elif outcome.status < 400:
+                        controller.on_success(outcome.responded - start, parts.path)
+
+        finally:
+            if controller:
+                controller.release()
@@ -0,0 +1,107 @@
+"""Retry policies for requests to the CAIC APIs."""
+
+import datetime
+import email.utils
+import random
+
+from . import errors
+
+
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+"""Response statuses that are worth retrying - any other error status is fatal."""
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter that honors ``Retry-After``.
+
+    Connection errors and timeouts (no response status) and the statuses in
+    ``retry_statuses`` are retried. Other error statuses are fatal and
+    raised right away.
+
+    Parameters
+    ----------
+    attempts : int, optional
+        The total number of attempts, including the first. Set to 1 to
+        disable retries. By default 3.
+    base : float, optional
+        The backoff in seconds before the first retry, doubled for each
+        retry after that, by default 0.5.
+    cap : float, optional
+        The longest backoff in seconds, by default 30.
+    retry_statuses : frozenset[int], optional
+        The response statuses to retry, by default ``RETRY_STATUSES``.
+    max_retry_after : float, optional
+        The longest ``Retry-After`` in seconds to honor. Longer waits are
+        cut down to this. By default 120.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base: float = 0.5,
+        cap: float = 30.0,
+        retry_statuses: frozenset[int] = RETRY_STATUSES,
+        max_retry_after: float = 120.0,
+    ) -> None:
+        self.attempts = max(attempts, 1)
+        self.base = base
+        self.cap = cap
+        self.retry_statuses = retry_statuses
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, attempt: int, err: errors.CaicRequestException) -> bool:
+        """Whether to retry after ``err`` ended the (zero-based) ``attempt``."""
+
+        if attempt + 1 >= self.attempts:
+            return False
+
+        return err.status is None or err.status in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """The seconds to wait before retrying after the (zero-based) ``attempt``.
+
+        A parsable ``retry_after`` (seconds, or an HTTP date) wins over the
+        jittered exponential backoff.
+        """
+
+        if retry_after is not None:
+            wait = parse_retry_after(retry_after)
+            if wait is not None:
+                return min(wait, self.max_retry_after)
+
+        return random.uniform(0, min(self.cap, self.base * 2**attempt))
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Parse a ``Retry-After`` header into seconds from now.
+
+    Parameters
+    ----------
+    value : str
+        The header's value - either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    float | None
+        The seconds to wait (never negative), or None if ``value``
+        could not be parsed.
+    """
+
+    value = value.strip()
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+
+    wait = when - datetime.datetime.now(datetime.timezone.utc)
+    return max(wait.total_seconds(), 0.0)
@@ -0,0 +1,292 @@
+"""A grid spatial index for bounding box, radius and nearest queries.
+
+A ``SpatialIndex`` buckets observations (or any objects with ``latitude`` and
+``longitude``) into a grid of ``cell_degrees`` square cells. Queries only
+look at the cells that can hold a match, rather than every object::
+
+    index = SpatialIndex(await client.avy_obs(start, end))
+    nearby = index.within_radius(39.62, -106.07, 10)
+    closest = index.nearest(39.62, -106.07, k=5)
+
+Distances are great-circle distances in kilometers, see ``haversine_km``.
+"""
+
+import heapq
+import math
+import typing
+
+
+EARTH_RADIUS_KM = 6371.0088
+"""The mean radius of the Earth, in kilometers."""
+
+DEFAULT_CELL_DEGREES = 0.05
+"""The default grid cell size, about 5.5 km north-south."""
+
+T = typing.TypeVar("T")
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """The great-circle distance between two points, in kilometers."""
+
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def radius_bbox(lat: float, lon: float, km: float) -> tuple[float, float, float, float]:
+    """
+    Get the smallest bounding box holding every point within ``km`` of a point.
+
+    Parameters
+    ----------
+    lat : float
+        The latitude of the center.
+    lon : float
+        The longitude of the center.
+    km : float
+        The radius, in kilometers.
+
+    Returns
+    -------
+    tuple[float, float, float, float]
+        ``(min_lat, min_lon, max_lat, max_lon)``, with the full range of
+        longitudes if the circle reaches a pole.
+    """
+
+    angle = km / EARTH_RADIUS_KM
+    dlat = math.degrees(angle)
+    min_lat = lat - dlat
+    max_lat = lat + dlat
+
+    if min_lat <= -90 or max_lat >= 90 or angle >= math.pi / 2:
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+
+    dlon = math.degrees(
+        math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(lat))))
+    )
+
+    return min_lat, lon - dlon, max_lat, lon + dlon
+
+
+class Neighbor(typing.NamedTuple):
+    """An object found by a radius or nearest query, and its distance."""
+
+    obj: typing.Any
+    km: float
+
+
+class SpatialIndex(typing.Generic[T]):
+    """A grid index of objects by their ``latitude`` and ``longitude``.
+
+    Objects without a location are left out, see ``skipped``.
+
+    Parameters
+    ----------
+    objs : typing.Iterable[T], optional
+        The objects to index, eg. ``models.AvalancheObservation`` objects,
+        by default ().
+    cell_degrees : float, optional
+        The size of each grid cell, in degrees, by default
+        ``DEFAULT_CELL_DEGREES``. Smaller cells suit dense data and small
+        queries.
+    """
+
+    def __init__(
+        self,
+        objs: typing.Iterable[T] = (),
+        cell_degrees: float = DEFAULT_CELL_DEGREES,
+    ) -> None:
+        if cell_degrees <= 0:
+            raise ValueError("cell_degrees must be positive.")
+
+        self.cell_degrees = cell_degrees
+        self.skipped = 0
+        self._objs: list[T] = []
+        self._points: list[tuple[float, float]] = []
+        self._cells: dict[tuple[int, int], list[int]] = {}
+
+        for obj in objs:
+            self.add(obj)
+
+    def __len__(self) -> int:
+        return len(self._objs)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return (
+            math.floor(lat / self.cell_degrees),
+            math.floor(lon / self.cell_degrees),
+        )
+
+    def add(self, obj: T) -> bool:
+        """Index an object, returning False if it has no location."""
+
+        lat = getattr(obj, "latitude", None)
+        lon = getattr(obj, "longitude", None)
+        if lat is None or lon is None:
+            self.skipped += 1
+            return False
+
+        self._cells.setdefault(self._cell(lat, lon), []).append(len(self._objs))
+        self._objs.append(obj)
+        self._points.append((lat, lon))
+
+        return True
+
+    def _candidates(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+    ) -> typing.Iterator[int]:
+        """The indexes of the objects in every cell overlapping a bounding box."""
+
+        min_row, min_col = self._cell(min_lat, min_lon)
+        max_row, max_col = self._cell(max_lat, max_lon)
+
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > len(self._cells):
+            # The box covers more cells than are occupied, so walk those.
+            for (row, col), members in self._cells.items():
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    yield from members
+            return
+
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                yield from self._cells.get((row, col), ())
+
+    def within_bbox(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+    ) -> list[T]:
+        """
+        Get the objects within a bounding box, edges included.
+
+        Parameters
+        ----------
+        min_lat, min_lon, max_lat, max_lon : float
+            The southwest and northeast corners of the box.
+
+        Returns
+        -------
+        list[T]
+            The objects in the box, in the order they were added.
+        """
+
+        found = []
+        for i in self._candidates(min_lat, min_lon, max_lat, max_lon):
+            lat, lon = self._points[i]
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
+                found.append(i)
+
+        return [self._objs[i] for i in sorted(found)]
+
+    def within_radius(self, lat: float, lon: float, km: float) -> list[Neighbor]:
+        """
+        Get the objects within a distance of a point.
+
+        Parameters
+        ----------
+        lat : float
+            The latitude of the point.
+        lon : float
+            The longitude of the point.
+        km : float
+            The maximum distance, in kilometers.
+
+        Returns
+        -------
+        list[Neighbor]
+            The objects and their distances, nearest first.
+        """
+
+        found = []
+        for i in self._candidates(*radius_bbox(lat, lon, km)):
+            distance = haversine_km(lat, lon, *self._points[i])
+            if distance <= km:
+                found.append((distance, i))
+
+        found.sort()
+
+        return [Neighbor(self._objs[i], distance) for distance, i in found]
+
+    def nearest(
+        self, lat: float, lon: float, k: int = 1, max_km: float | None = None
+    ) -> list[Neighbor]:
+        """
+        Get the ``k`` objects nearest to a point.
+
+        Cells are searched in growing rings around the point until ``k``
+        objects are found, then a radius query out to the farthest of those
+        makes the result exact. Once the rings cover more cells than are
+        occupied, the occupied cells are taken by ring instead, so queries far
+        from the data stay fast.
+
+        Parameters
+        ----------
+        lat : float
+            The latitude of the point.
+        lon : float
+            The longitude of the point.
+        k : int, optional
+            The number of objects to get, by default 1.
+        max_km : float | None, optional
+            Ignore objects farther than this, by default None.
+
+        Returns
+        -------
+        list[Neighbor]
+            Up to ``k`` objects and their distances, nearest first.
+        """
+
+        if k < 1 or not self._objs:
+            return []
+
+        if max_km is not None:
+            return self.within_radius(lat, lon, max_km)[:k]
+
+        row, col = self._cell(lat, lon)
+        candidates: list[int] = []
+        ring = 0
+        while len(candidates) < k:
+            if (2 * ring + 1) ** 2 > len(self._cells):
+                # The rings cover more cells than are occupied, so take the
+                # remaining occupied cells, nearest ring first, instead.
+                rest = sorted(
+                    (max(abs(cell_row - row), abs(cell_col - col)), cell_row, cell_col)
+                    for cell_row, cell_col in self._cells
+                )
+                for cell_ring, cell_row, cell_col in rest:
+                    if len(candidates) >= k:
+                        break
+                    if cell_ring >= ring:
+                        candidates.extend(self._cells[cell_row, cell_col])
+                break
+
+            for cell in _ring(row, col, ring):
+                candidates.extend(self._cells.get(cell, ()))
+            ring += 1
+
+        farthest = heapq.nsmallest(
+            k, (haversine_km(lat, lon, *self._points[i]) for i in candidates)
+        )[-1]
+
+        return self.within_radius(lat, lon, farthest)[:k]
+
+
+def _ring(row: int, col: int, ring: int) -> typing.Iterator[tuple[int, int]]:
+    """The cells exactly ``ring`` cells away from a cell."""
+
+    if ring == 0:
+        yield row, col
+        return
+
+    for cell_col in range(col - ring, col + ring + 1):
+        yield row - ring, cell_col
+        yield row + ring, cell_col
+    for cell_row in range(row - ring + 1, row + ring):
+        yield cell_row, col - ring
+        yield cell_row, col + ring
@@ -0,0 +1,566 @@
+"""A local, indexed SQLite copy of CAIC records, kept current by ``caic_python.sync``.
+
+Field reports, avalanche observations, weather observations and snowpack
+observations each get a table, with the fields they are usually filtered by
+in indexed columns and the whole record as JSON. The observations nested in
+a field report are stored along with it. The query methods mirror the
+filters of ``CaicClient.field_reports``, but run against local data.
+"""
+
+import datetime
+import enum
+import os
+import sqlite3
+import typing
+
+import dateutil.parser
+import pydantic
+
+from . import models
+
+
+def changed_at(obj: pydantic.BaseModel) -> datetime.datetime | None:
+    """When a record last changed - its ``updated_at``, else ``created_at``."""
+
+    return getattr(obj, "updated_at", None) or getattr(obj, "created_at", None)
+
+
+def _utc(value: datetime.datetime | str | None) -> str | None:
+    """Format a datetime as sortable UTC ISO 8601, assuming UTC if naive."""
+
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = dateutil.parser.parse(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+
+    return value.astimezone(datetime.timezone.utc).isoformat()
+
+
+def _value(value: typing.Any) -> typing.Any:
+    """The value stored for an enum, or the value itself."""
+
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _search_text(report: models.FieldReport) -> str:
+    """The free text of a report that ``Store.field_reports(query=...)`` searches."""
+
+    return " ".join(
+        text
+        for text in (
+            report.description,
+            report.area,
+            report.route,
+            report.landmark,
+            report.objective,
+        )
+        if text
+    )
+
+
+class _Table(typing.NamedTuple):
+    """How the records of a model are stored."""
+
+    name: str
+    model: type[pydantic.BaseModel]
+    columns: dict[str, typing.Callable[[pydantic.BaseModel], typing.Any]]
+    indexes: tuple[str, ...]
+
+
+_OBS_COLUMNS = {
+    "observed_at": lambda obj: _utc(obj.observed_at),
+    "backcountry_zone_id": lambda obj: obj.backcountry_zone_id,
+    "highway_zone_id": lambda obj: obj.highway_zone_id,
+    "latitude": lambda obj: obj.latitude,
+    "longitude": lambda obj: obj.longitude,
+}
+_OBS_INDEXES = (
+    "observed_at",
+    "backcountry_zone_id",
+    "highway_zone_id",
+    "latitude, longitude",
+    "report_id",
+)
+
+TABLES: dict[str, _Table] = {
+    "FieldReport": _Table(
+        "field_reports",
+        models.FieldReport,
+        {
+            "observed_at": lambda obj: _utc(obj.observed_at),
+            "backcountry_zone_id": lambda obj: getattr(
+                obj.backcountry_zone, "id", None
+            ),
+            "backcountry_zone_title": lambda obj: getattr(
+                obj.backcountry_zone, "title", None
+            ),
+            "highway_zone_id": lambda obj: obj.highway_zone_id,
+            "saw_avalanche": lambda obj: obj.saw_avalanche,
+            "search_text": _search_text,
+            "latitude": lambda obj: obj.latitude,
+            "longitude": lambda obj: obj.longitude,
+        },
+        (
+            "observed_at",
+            "backcountry_zone_id",
+            "backcountry_zone_title",
+            "highway_zone_id",
+            "latitude, longitude",
+        ),
+    ),
+    "AvalancheObservation": _Table(
+        "avalanche_observations",
+        models.AvalancheObservation,
+        {
+            **_OBS_COLUMNS,
+            "destructive_size": lambda obj: _value(obj.destructive_size),
+            "aspect": lambda obj: _value(obj.aspect),
+        },
+        _OBS_INDEXES + ("destructive_size", "aspect"),
+    ),
+    "WeatherObservation": _Table(
+        "weather_observations", models.WeatherObservation, _OBS_COLUMNS, _OBS_INDEXES
+    ),
+    "SnowpackObservation": _Table(
+        "snowpack_observations",
+        models.SnowpackObservation,
+        {
+            **_OBS_COLUMNS,
+            "cracking": lambda obj: obj.cracking,
+            "collapsing": lambda obj: obj.collapsing,
+        },
+        _OBS_INDEXES,
+    ),
+}
+"""The table of each model a ``Store`` keeps, by model name."""
+
+MODELS: dict[str, type[pydantic.BaseModel]] = {
+    kind: table.model for kind, table in TABLES.items()
+}
+"""The models a ``Store`` keeps, by the name their records are stored under."""
+
+_NESTED = {
+    "AvalancheObservation": "avalanche_observations",
+    "WeatherObservation": "weather_observations",
+    "SnowpackObservation": "snowpack_observations",
+}
+"""The ``FieldReport`` attr holding the nested records of each model."""
+
+
+def _storable(obj: pydantic.BaseModel) -> pydantic.BaseModel:
+    """The version of a record that a ``Store`` keeps, see ``Store.upsert``."""
+
+    model = type(obj)
+
+    if model is models.LazyFieldReport:
+        return models.FieldReport.model_validate(
+            {**dict(obj), **{name: getattr(obj, name) for name in obj.lazy_types}}
+        )
+
+    if model.__name__ not in TABLES:
+        projected_from = getattr(model, "projected_from", None)
+        if projected_from is not None:
+            raise TypeError(
+                f"A Store can't keep {model.__name__} objects, they lack fields "
+                f"of the full records - upsert {projected_from.__name__} objects."
+            )
+        raise TypeError(f"A Store can't keep {model.__name__} objects.")
+
+    return obj
+
+
+class _Row(typing.NamedTuple):
+    """A record to upsert, its parent report's ID and when it changed."""
+
+    obj: pydantic.BaseModel
+    report_id: str | None
+    changed: datetime.datetime | None
+
+
+class Store:
+    """Records and sync watermarks, kept in an indexed SQLite database.
+
+    Each of the ``TABLES`` keeps an ID, a ``report_id`` (for observations),
+    the indexed columns of its model, when the record changed, and the
+    record's JSON. A record is only replaced by a version that changed at the
+    same time or later, so overlapping syncs never go back in time.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The SQLite database file, created if needed.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._conn = sqlite3.connect(path)
+
+        script = [
+            "CREATE TABLE IF NOT EXISTS watermarks "
+            "(name TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        ]
+        for kind, table in TABLES.items():
+            report_id = "" if kind == "FieldReport" else "report_id TEXT, "
+            script.append(
+                f"CREATE TABLE IF NOT EXISTS {table.name} (id TEXT PRIMARY KEY, "
+                f"{report_id}{', '.join(table.columns)}, "
+                "changed_at TEXT, body TEXT NOT NULL);"
+            )
+            for index in table.indexes:
+                script.append(
+                    f"CREATE INDEX IF NOT EXISTS "
+                    f"{table.name}_{index.replace(', ', '_')} "
+                    f"ON {table.name} ({index});"
+                )
+
+        self._conn.executescript("\n".join(script))
+        self._conn.commit()
+
+    def __enter__(self) -> "Store":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _upsert_rows(self, kind: str, rows: list[_Row]) -> None:
+        table = TABLES[kind]
+        columns = list(table.columns)
+        if kind != "FieldReport":
+            columns.insert(0, "report_id")
+
+        values = []
+        for obj, report_id, changed in rows:
+            row = [obj.id]
+            if kind != "FieldReport":
+                row.append(report_id)
+            row.extend(getter(obj) for getter in table.columns.values())
+            row.extend((_utc(changed), obj.model_dump_json()))
+            values.append(row)
+
+        names = ["id"] + columns + ["changed_at", "body"]
+        updates = ", ".join(f"{name} = excluded.{name}" for name in names[1:])
+        self._conn.executemany(
+            f"INSERT INTO {table.name} ({', '.join(names)}) "
+            f"VALUES ({', '.join('?' for _ in names)}) "
+            f"ON CONFLICT (id) DO UPDATE SET {updates} "
+            f"WHERE excluded.changed_at >= {table.name}.changed_at "
+            f"OR {table.name}.changed_at IS NULL",
+            values,
+        )
+
+    def upsert(self, objs: typing.Iterable[pydantic.BaseModel]) -> int:
+        """
+        Insert or update records, keeping the newest version of each.
+
+        The observations nested in a ``FieldReport`` are stored as well,
+        changed when the report changed unless they say otherwise. A
+        ``LazyFieldReport`` is stored as a ``FieldReport``, validating its
+        nested collections.
+
+        Parameters
+        ----------
+        objs : typing.Iterable[pydantic.BaseModel]
+            Objects of one of the ``MODELS``, or ``LazyFieldReport`` objects.
+
+        Returns
+        -------
+        int
+            The number of records (including nested ones) inserted or updated.
+
+        Raises
+        ------
+        TypeError
+            If an object is not one of the ``MODELS``, eg. a ``projection``,
+            which would replace a whole record with a few of its fields.
+        pydantic.ValidationError
+            If a ``LazyFieldReport`` has an invalid nested collection.
+        """
+
+        rows: dict[str, list[_Row]] = {}
+
+        for obj in objs:
+            obj = _storable(obj)
+            kind = type(obj).__name__
+            changed = changed_at(obj)
+            rows.setdefault(kind, []).append(
+                _Row(obj, getattr(obj, "field_report_id", None), changed)
+            )
+
+            if kind == "FieldReport":
+                for nested_kind, attr in _NESTED.items():
+                    for nested in getattr(obj, attr) or []:
+                        rows.setdefault(nested_kind, []).append(
+                            _Row(nested, obj.id, changed_at(nested) or changed)
+                        )
+
+        before = self._conn.total_changes
+
+        with self._conn:
+            for kind, kind_rows in rows.items():
+                self._upsert_rows(kind, kind_rows)
+
+        return self._conn.total_changes - before
+
+    def get(self, kind: str, obj_id: str) -> pydantic.BaseModel | None:
+        """Get a stored record by model name (see ``MODELS``) and ID, or None."""
+
+        row = self._conn.execute(
+            f"SELECT body FROM {TABLES[kind].name} WHERE id = ?", (obj_id,)
+        ).fetchone()
+
+        return MODELS[kind].model_validate_json(row[0]) if row else None
+
+    def count(self, kind: str | None = None) -> int:
+        """The number of stored records, of one model name or all of them."""
+
+        kinds = TABLES if kind is None else (kind,)
+
+        return sum(
+            self._conn.execute(f"SELECT COUNT(*) FROM {TABLES[k].name}").fetchone()[0]
+            for k in kinds
+        )
+
+    def _query(
+        self,
+        kind: str,
+        where: list[str],
+        args: list,
+        limit: int | None,
+    ) -> list[pydantic.BaseModel]:
+        table = TABLES[kind]
+        sql = f"SELECT body FROM {table.name}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY observed_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args = args + [limit]
+
+        validate = table.model.model_validate_json
+
+        return [validate(row[0]) for row in self._conn.execute(sql, args)]
+
+    def field_reports(  # pylint: disable=R0913
+        self,
+        start: datetime.datetime | str | None = None,
+        end: datetime.datetime | str | None = None,
+        bc_zones: typing.Iterable[str] = (),
+        cracking_obs: typing.Iterable[str] = (),
+        collapsing_obs: typing.Iterable[str] = (),
+        query: str = "",
+        avy_seen: bool | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+        limit: int | None = None,
+    ) -> list[models.FieldReport]:
+        """
+        Search the stored field reports, like ``CaicClient.field_reports``.
+
+        Parameters
+        ----------
+        start : datetime.datetime | str | None, optional
+            Reports observed at or after this date (and time), by default None.
+        end : datetime.datetime | str | None, optional
+            Reports observed at or before this date (and time), by default None.
+        bc_zones : typing.Iterable[str], optional
+            Only reports in these Backcountry Zones, by title - see
+            ``enums.BCZoneTitles``. By default ().
+        cracking_obs : typing.Iterable[str], optional
+            Only reports with a snowpack observation of these crackings - see
+            ``enums.ReportsSearchCrackObs``. By default ().
+        collapsing_obs : typing.Iterable[str], optional
+            Only reports with a snowpack observation of these collapsings - see
+            ``enums.ReportsSearchCollapseObs``. By default ().
+        query : str, optional
+            Only reports whose description, area, route, landmark or
+            objective contain this text, by default "".
+        avy_seen : bool | None, optional
+            Only reports where an avalanche was (or wasn't) seen, or None to
+            disable this filter, by default None.
+        bbox : tuple[float, float, float, float] | None, optional
+            Only reports within ``(min_lat, min_lon, max_lat, max_lon)``,
+            by default None.
+        limit : int | None, optional
+            The maximum number of reports to return, by default None.
+
+        Returns
+        -------
+        list[models.FieldReport]
+            The matching reports, most recently observed first.
+        """
+
+        where, args = _common_filters(start, end, bbox)
+
+        if bc_zones := [_value(zone) for zone in bc_zones]:
+            where.append(f"backcountry_zone_title IN ({_marks(bc_zones)})")
+            args.extend(bc_zones)
+
+        snowpack = (("cracking", cracking_obs), ("collapsing", collapsing_obs))
+        for column, values in snowpack:
+            if values := [_value(value) for value in values]:
+                where.append(
+                    "id IN (SELECT report_id FROM snowpack_observations "
+                    f"WHERE {column} IN ({_marks(values)}))"
+                )
+                args.extend(values)
+
+        if query:
+            where.append("instr(lower(search_text), lower(?)) > 0")
+            args.append(query)
+
+        if avy_seen is not None:
+            where.append("saw_avalanche = ?")
+            args.append(avy_seen)
+
+        return self._query("FieldReport", where, args, limit)
+
+    def avalanche_observations(  # pylint: disable=R0913
+        self,
+        start: datetime.datetime | str | None = None,
+        end: datetime.datetime | str | None = None,
+        bc_zone_ids: typing.Iterable[str] = (),
+        highway_zone_ids: typing.Iterable[str] = (),
+        destructive_sizes: typing.Iterable[str] = (),
+        aspects: typing.Iterable[str] = (),
+        bbox: tuple[float, float, float, float] | None = None,
+        limit: int | None = None,
+    ) -> list[models.AvalancheObservation]:
+        """
+        Search the stored avalanche observations.
+
+        Parameters
+        ----------
+        start, end, bbox, limit
+            See ``field_reports``.
+        bc_zone_ids : typing.Iterable[str], optional
+            Only observations in these Backcountry Zones, by ID. By default ().
+        highway_zone_ids : typing.Iterable[str], optional
+            Only observations in these Highway Zones, by ID. By default ().
+        destructive_sizes : typing.Iterable[str], optional
+            Only observations of these sizes - see ``enums.DSize``.
+            By default ().
+        aspects : typing.Iterable[str], optional
+            Only observations on these aspects - see ``enums.Aspect``.
+            By default ().
+
+        Returns
+        -------
+        list[models.AvalancheObservation]
+            The matching observations, most recently observed first.
+        """
+
+        where, args = _common_filters(
+            start,
+            end,
+            bbox,
+            backcountry_zone_id=bc_zone_ids,
+            highway_zone_id=highway_zone_ids,
+            destructive_size=destructive_sizes,
+            aspect=aspects,
+        )
+
+        return self._query("AvalancheObservation", where, args, limit)
+
+    def weather_observations(
+        self,
+        start: datetime.datetime | str | None = None,
+        end: datetime.datetime | str | None = None,
+        bc_zone_ids: typing.Iterable[str] = (),
+        highway_zone_ids: typing.Iterable[str] = (),
+        bbox: tuple[float, float, float, float] | None = None,
+        limit: int | None = None,
+    ) -> list[models.WeatherObservation]:
+        """Search the stored weather observations, see ``avalanche_observations``."""
+
+        where, args = _common_filters(
+            start,
+            end,
+            bbox,
+            backcountry_zone_id=bc_zone_ids,
+            highway_zone_id=highway_zone_ids,
+        )
+
+        return self._query("WeatherObservation", where, args, limit)
+
+    def snowpack_observations(  # pylint: disable=R0913
+        self,
+        start: datetime.datetime | str | None = None,
+        end: datetime.datetime | str | None = None,
+        bc_zone_ids: typing.Iterable[str] = (),
+        highway_zone_ids: typing.Iterable[str] = (),
+        cracking_obs: typing.Iterable[str] = (),
+        collapsing_obs: typing.Iterable[str] = (),
+        bbox: tuple[float, float, float, float] | None = None,
+        limit: int | None = None,
+    ) -> list[models.SnowpackObservation]:
+        """Search the stored snowpack observations, see ``avalanche_observations``
+        and ``field_reports``."""
+
+        where, args = _common_filters(
+            start,
+            end,
+            bbox,
+            backcountry_zone_id=bc_zone_ids,
+            highway_zone_id=highway_zone_ids,
+            cracking=cracking_obs,
+            collapsing=collapsing_obs,
+        )
+
+        return self._query("SnowpackObservation", where, args, limit)
+
+    def watermark(self, name: str) -> datetime.datetime | None:
+        """The last change time synced for ``name``, or None if never synced."""
+
+        row = self._conn.execute(
+            "SELECT value FROM watermarks WHERE name = ?", (name,)
+        ).fetchone()
+
+        return datetime.datetime.fromisoformat(row[0]) if row else None
+
+    def set_watermark(self, name: str, value: datetime.datetime) -> None:
+        """Record the last change time synced for ``name``."""
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO watermarks (name, value) VALUES (?, ?)",
+            (name, _utc(value)),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        self._conn.close()
+
+
+def _marks(values: list) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _common_filters(
+    start: datetime.datetime | str | None,
+    end: datetime.datetime | str | None,
+    bbox: tuple[float, float, float, float] | None,
+    **in_filters: typing.Iterable,
+) -> tuple[list[str], list]:
+    """Build the WHERE clauses (and their args) shared by every query."""
+
+    where = []
+    args = []
+
+    if start is not None:
+        where.append("observed_at >= ?")
+        args.append(_utc(start))
+    if end is not None:
+        where.append("observed_at <= ?")
+        args.append(_utc(end))
+    if bbox is not None:
+        min_lat, min_lon, max_lat, max_lon = bbox
+        where.append("latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?")
+        args.extend((min_lat, max_lat, min_lon, max_lon))
+
+    for column, values in in_filters.items():
+        if values := [_value(value) for value in values]:
+            where.append(f"{column} IN ({_marks(values)})")
+            args.extend(values)
+
+    return where, args
@@ -0,0 +1,203 @@
+"""Keep a local ``store.Store`` current with incremental syncs.
+
+Each sync target (see ``TARGETS``) has a watermark: the latest ``updated_at``
+(or ``created_at``) it has synced. A sync only requests the records changed
+since the watermark, minus a small overlap to catch records whose change was
+committed late. The watermark only moves forward once a sync completes, so an
+interrupted sync is simply repeated from where the last complete one ended. A
+page that can't be fetched, or hitting the page limit, leaves a sync
+incomplete - the records already fetched are kept, the watermark is not.
+"""
+
+import datetime
+import typing
+
+import pydantic
+
+from . import errors
+from . import LOGGER
+from . import models
+from . import utils
+from .client import CaicApiEndpoints, CaicClient
+from .store import changed_at, Store
+
+
+class SyncTarget(typing.NamedTuple):
+    """An endpoint that can be synced, and the model of its records."""
+
+    name: str
+    endpoint: str
+    model: type[pydantic.BaseModel]
+
+
+TARGETS: dict[str, SyncTarget] = {
+    "field-reports": SyncTarget(
+        "field-reports", CaicApiEndpoints.OBS_REPORT, models.FieldReport
+    ),
+}
+"""The endpoints ``sync`` can keep a local copy of, by name.
+
+Only endpoints in ``client.CHANGES_ENDPOINTS`` can be synced. Avalanche,
+weather and snowpack observations are synced along with their field reports.
+"""
+
+DEFAULT_OVERLAP = datetime.timedelta(minutes=15)
+"""How far before the watermark each sync starts."""
+
+
+class SyncResult(typing.NamedTuple):
+    """The outcome of syncing a single target."""
+
+    target: str
+    since: datetime.datetime
+    watermark: datetime.datetime | None
+    fetched: int
+    stored: int
+    complete: bool = True
+    """False if a page failed or the page limit was reached, see ``sync_target``."""
+
+
+def initial_since(now: datetime.datetime | None = None) -> datetime.datetime:
+    """Where a target's first sync starts - the start of the current season."""
+
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    start = int(utils.avalanche_season(now).split("-")[0])
+
+    return datetime.datetime(start, 10, 1, tzinfo=datetime.timezone.utc)
+
+
+async def sync_target(
+    client: CaicClient,
+    store: Store,
+    target: SyncTarget,
+    overlap: datetime.timedelta = DEFAULT_OVERLAP,
+    since: datetime.datetime | None = None,
+    page_limit: int = 1000,
+    read_ahead: int = 1,
+) -> SyncResult:
+    """
+    Sync the records of a single target that changed since its watermark.
+
+    Parameters
+    ----------
+    client : CaicClient
+        The client to request records with.
+    store : Store
+        The store to keep records and watermarks in.
+    target : SyncTarget
+        The target to sync, one of ``TARGETS``.
+    overlap : datetime.timedelta, optional
+        How far before the watermark to start, by default ``DEFAULT_OVERLAP``.
+    since : datetime.datetime | None, optional
+        Where to start if the target was never synced, by default
+        ``initial_since()``.
+    page_limit : int, optional
+        The maximum number of pages to request, by default 1000.
+    read_ahead : int, optional
+        The number of pages to keep in flight at once, by default 1.
+
+    Returns
+    -------
+    SyncResult
+        What was synced. If a page failed, or ``page_limit`` pages weren't
+        enough, the records fetched are stored but the watermark is left
+        where it was and ``complete`` is False, so the next sync covers them
+        again.
+    """
+
+    previous = store.watermark(target.name)
+    if previous is not None:
+        since = previous - overlap
+    elif since is None:
+        since = initial_since()
+
+    watermark = previous
+    fetched = 0
+    stored = 0
+
+    try:
+        async for page in client.iter_changes(
+            target.endpoint,
+            target.model,
+            since.isoformat(),
+            page_limit=page_limit,
+            read_ahead=read_ahead,
+            pages=True,
+        ):
+            fetched += len(page)
+            stored += store.upsert(page)
+
+            for obj in page:
+                changed = changed_at(obj)
+                if changed is None:
+                    continue
+                if changed.tzinfo is None:
+                    changed = changed.replace(tzinfo=datetime.timezone.utc)
+                if watermark is None or changed > watermark:
+                    watermark = changed
+    except errors.CaicRequestException as err:
+        LOGGER.error(
+            "Sync of %s is incomplete, keeping its watermark: %s", target.name, err
+        )
+        return SyncResult(target.name, since, previous, fetched, stored, False)
+
+    if watermark is not None:
+        store.set_watermark(target.name, watermark)
+
+    LOGGER.info(
+        "Synced %s: %s fetched, %s stored since %s.",
+        target.name,
+        fetched,
+        stored,
+        since.isoformat(),
+    )
+
+    return SyncResult(target.name, since, watermark, fetched, stored)
+
+
+async def sync(
+    client: CaicClient,
+    store: Store,
+    targets: typing.Iterable[str] = tuple(TARGETS),
+    overlap: datetime.timedelta = DEFAULT_OVERLAP,
+    since: datetime.datetime | None = None,
+    page_limit: int = 1000,
+    read_ahead: int = 1,
+) -> list[SyncResult]:
+    """
+    Sync several targets, one after the other - see ``sync_target``.
+
+    Parameters
+    ----------
+    client : CaicClient
+        The client to request records with.
+    store : Store
+        The store to keep records and watermarks in.
+    targets : typing.Iterable[str], optional
+        The names of the ``TARGETS`` to sync, by default all of them.
+    overlap, since, page_limit, read_ahead
+        Passed to ``sync_target``.
+
+    Returns
+    -------
+    list[SyncResult]
+        What was synced, per target.
+
+    Raises
+    ------
+    KeyError
+        If a target is not one of ``TARGETS``.
+    """
+
+    return [
+        await sync_target(
+            client,
+            store,
+            TARGETS[name],
+            overlap=overlap,
+            since=since,
+            page_limit=page_limit,
+            read_ahead=read_ahead,
+        )
+        for name in targets
+    ]
@@ -1,5 +1,12 @@
 """Helpful methods."""
 
+import datetime
+import types
+import typing
+
+import dateutil.parser
+import pydantic
+
 from . import models
 
 
@@ -47,3 +54,128 @@ def find_classic_id(report: models.FieldReport) -> int | None:
                 return ob.classic_observation_report_id
 
     return None
+
+
+def split_time_range(
+    start: str | datetime.datetime,
+    end: str | datetime.datetime,
+    step: datetime.timedelta,
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """
+    Split ``[start, end]`` into consecutive windows no longer than ``step``.
+
+    Parameters
+    ----------
+    start : str | datetime.datetime
+        The start of the range - strings are parsed with ``dateutil``.
+    end : str | datetime.datetime
+        The end of the range - strings are parsed with ``dateutil``.
+    step : datetime.timedelta
+        The length of each window. The last window may be shorter.
+
+    Returns
+    -------
+    list[tuple[datetime.datetime, datetime.datetime]]
+        The ``(start, end)`` of each window, oldest first. Neighbouring windows
+        share their boundary, so inclusive queries may overlap by an instant.
+
+    Raises
+    ------
+    ValueError
+        If ``step`` is not positive.
+    """
+
+    if step <= datetime.timedelta(0):
+        raise ValueError("The step between windows must be positive!")
+
+    if isinstance(start, str):
+        start = dateutil.parser.parse(start)
+    if isinstance(end, str):
+        end = dateutil.parser.parse(end)
+
+    windows = []
+    while start < end:
+        windows.append((start, min(start + step, end)))
+        start += step
+
+    return windows
+
+
+def dedupe_by_id(
+    items: typing.Iterable[pydantic.BaseModel],
+) -> list[pydantic.BaseModel]:
+    """
+    Drop objects whose ``id`` was already seen, keeping the first one.
+
+    Parameters
+    ----------
+    items : typing.Iterable[pydantic.BaseModel]
+        Objects with an ``id`` attr, such as ``FieldReport`` objects.
+
+    Returns
+    -------
+    list[pydantic.BaseModel]
+        The unique objects, in their original order.
+    """
+
+    seen = set()
+    unique = []
+
+    for item in items:
+        if item.id in seen:
+            continue
+        seen.add(item.id)
+        unique.append(item)
+
+    return unique
+
+
+def union_args(annotation: typing.Any) -> list:
+    """
+    Flatten a (possibly nested) union annotation into its members.
+
+    Parameters
+    ----------
+    annotation : typing.Any
+        A type annotation, such as a ``pydantic`` field's.
+
+    Returns
+    -------
+    list
+        The members of the union, including ``NoneType`` for an ``Optional``,
+        or just ``annotation`` if it isn't a union.
+    """
+
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        return [
+            inner for arg in typing.get_args(annotation) for inner in union_args(arg)
+        ]
+
+    return [annotation]
+
+
+def avalanche_season(when: datetime.datetime | str | None) -> str | None:
+    """
+    Name the avalanche season a date falls in, eg. ``"2023-2024"``.
+
+    Seasons run from October 1st to September 30th.
+
+    Parameters
+    ----------
+    when : datetime.datetime | str | None
+        The date, or a string to parse as one.
+
+    Returns
+    -------
+    str | None
+        The season, or None if ``when`` is None.
+    """
+
+    if when is None:
+        return None
+    if isinstance(when, str):
+        when = dateutil.parser.parse(when)
+
+    start = when.year if when.month >= 10 else when.year - 1
+
+    return f"{start}-{start + 1}"
@@ -0,0 +1,422 @@
+"""Zone polygons, and vectorized assignment of points to zones.
+
+A ``ZoneIndex`` holds the polygon and bounding box of every backcountry and
+highway zone, fetched once from ``CaicApiEndpoints.ZONES_MAP`` (and any
+zone's ``geojson_url`` the map leaves out) and optionally kept on disk.
+It assigns zones to whole arrays of points at a time, for example to fill in
+the ``backcountry_zone_id`` of records that lack one::
+
+    index = await ZoneIndex.fetch(client, cache_path="zones.json")
+    index.fill_zone_ids(await client.avy_obs(start, end))
+
+Points are tested against a zone's bounding box first, then with an even-odd
+ray casting test against every edge of its polygon, in NumPy.
+
+Requires ``numpy`` - ``pip install caic_python[zones]``.
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import pathlib
+import time
+import typing
+
+import pydantic
+
+from . import enums
+from . import LOGGER
+
+try:
+    import numpy as np
+except ImportError as err:
+    raise ImportError(
+        "caic_python.zones requires numpy - pip install caic_python[zones]"
+    ) from err
+
+if typing.TYPE_CHECKING:
+    from .client import CaicClient
+
+
+BC_ZONE = enums.ObsTypes.BC_ZONE.value
+HWY_ZONE = enums.ObsTypes.HWY_ZONE.value
+
+MAX_CHUNK = 1 << 22
+"""The most point/edge pairs tested at once, to bound memory use."""
+
+DEFAULT_MAX_AGE = datetime.timedelta(days=7)
+"""How long ``ZoneIndex.fetch`` uses a saved GeoJSON file before refetching."""
+
+
+class Zone(typing.NamedTuple):
+    """The outline of a single zone."""
+
+    id: str | None
+    slug: str | None
+    title: str | None
+    type: str | None
+    bbox: tuple[float, float, float, float]
+    """``(min_lat, min_lon, max_lat, max_lon)``."""
+    rings: tuple[np.ndarray, ...]
+    """Every ring (outer or hole) of the zone, as ``(n, 2)`` lon/lat arrays."""
+
+
+def _rings(geometry: typing.Mapping) -> list[np.ndarray]:
+    """The rings of a ``Polygon`` or ``MultiPolygon`` geometry."""
+
+    kind = geometry.get("type")
+    coordinates = geometry.get("coordinates") or []
+
+    if kind == "Polygon":
+        polygons = [coordinates]
+    elif kind == "MultiPolygon":
+        polygons = coordinates
+    elif kind == "GeometryCollection":
+        return [
+            ring for part in geometry.get("geometries", []) for ring in _rings(part)
+        ]
+    else:
+        return []
+
+    return [
+        np.asarray(ring, dtype=np.float64)[:, :2]
+        for polygon in polygons
+        for ring in polygon
+        if len(ring) >= 3
+    ]
+
+
+def _features(data: typing.Any) -> list[typing.Mapping]:
+    """The features of a ``FeatureCollection``, ``Feature`` or list of them."""
+
+    if isinstance(data, list):
+        return [feature for item in data for feature in _features(item)]
+    if not isinstance(data, typing.Mapping):
+        return []
+    if data.get("type") == "FeatureCollection":
+        return _features(data.get("features", []))
+
+    return [data]
+
+
+def zone_of_feature(feature: typing.Mapping) -> Zone | None:
+    """
+    Build a zone from a GeoJSON feature.
+
+    The zone's ID, slug, title and type come from the feature's
+    ``properties`` (or its ``id``).
+
+    Parameters
+    ----------
+    feature : typing.Mapping
+        A GeoJSON ``Feature`` with a ``Polygon`` or ``MultiPolygon`` geometry.
+
+    Returns
+    -------
+    Zone | None
+        The zone, or None if the feature has no polygon.
+    """
+
+    properties = feature.get("properties") or {}
+    rings = _rings(feature.get("geometry") or {})
+    if not rings:
+        return None
+
+    points = np.concatenate(rings)
+    min_lon, min_lat = points.min(axis=0)
+    max_lon, max_lat = points.max(axis=0)
+
+    return Zone(
+        id=properties.get("id") or feature.get("id"),
+        slug=properties.get("slug"),
+        title=properties.get("title"),
+        type=properties.get("type"),
+        bbox=(float(min_lat), float(min_lon), float(max_lat), float(max_lon)),
+        rings=tuple(rings),
+    )
+
+
+def contains(zone: Zone, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Test which points are inside a zone.
+
+    Parameters
+    ----------
+    zone : Zone
+        The zone.
+    lats : np.ndarray
+        The latitudes of the points.
+    lons : np.ndarray
+        The longitudes of the points, the same length as ``lats``.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean mask, True for each point inside the zone. Points exactly
+        on an edge may fall either way.
+    """
+
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    min_lat, min_lon, max_lat, max_lon = zone.bbox
+    inside = (lats >= min_lat) & (lats <= max_lat)
+    inside &= (lons >= min_lon) & (lons <= max_lon)
+
+    candidates = np.flatnonzero(inside)
+    if not len(candidates):
+        return inside
+
+    # Even-odd rule over every ring, so holes and multiple parts just work.
+    crossings = np.zeros(len(candidates), dtype=bool)
+    for ring in zone.rings:
+        x1, y1 = ring[:, 0], ring[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        # Edges through the ring's closing point have zero length and never
+        # cross, so closed and open rings give the same answer.
+        slope = np.divide(x2 - x1, y2 - y1, out=np.zeros_like(x1), where=y2 != y1)
+
+        step = max(1, MAX_CHUNK // len(ring))
+        for start in range(0, len(candidates), step):
+            chunk = candidates[start : start + step]
+            px = lons[chunk, None]
+            py = lats[chunk, None]
+            crosses = ((y1 > py) != (y2 > py)) & (px < x1 + (py - y1) * slope)
+            crossings[start : start + step] ^= (
+                np.count_nonzero(crosses, axis=1) % 2
+            ).astype(bool)
+
+    inside[candidates] = crossings
+
+    return inside
+
+
+class ZoneIndex:
+    """The polygons of a set of zones, to assign zones to points.
+
+    Build one with ``fetch``, ``load`` or ``from_geojson``.
+
+    Parameters
+    ----------
+    zones : typing.Iterable[Zone]
+        The zones. Where zones of the same type overlap, the first wins.
+    """
+
+    def __init__(self, zones: typing.Iterable[Zone]) -> None:
+        self.zones = list(zones)
+        self._by_id = {zone.id: zone for zone in self.zones if zone.id}
+        self._types = {zone.type for zone in self.zones}
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def __iter__(self) -> typing.Iterator[Zone]:
+        return iter(self.zones)
+
+    def get(self, zone_id: str) -> Zone | None:
+        """Get a zone by ID, or None."""
+
+        return self._by_id.get(zone_id)
+
+    @classmethod
+    def from_geojson(cls, data: typing.Any) -> "ZoneIndex":
+        """Build an index from a GeoJSON ``FeatureCollection`` of zones."""
+
+        zones = []
+        for feature in _features(data):
+            zone = zone_of_feature(feature)
+            if zone is not None:
+                zones.append(zone)
+
+        return cls(zones)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "ZoneIndex":
+        """Build an index from a GeoJSON file, eg. one saved by ``fetch``."""
+
+        with open(path, encoding="utf-8") as file:
+            return cls.from_geojson(json.load(file))
+
+    @classmethod
+    async def fetch(
+        cls,
+        client: "CaicClient",
+        cache_path: str | os.PathLike | None = None,
+        max_age: datetime.timedelta | None = DEFAULT_MAX_AGE,
+    ) -> "ZoneIndex":
+        """
+        Fetch every zone polygon, or load them from ``cache_path`` if saved.
+
+        The zones come from ``CaicClient.zones_map``. Map features without a
+        geometry are completed from their ``geojson_url``, if they have one.
+
+        Parameters
+        ----------
+        client : CaicClient
+            The client to request zones with.
+        cache_path : str | os.PathLike | None, optional
+            A GeoJSON file to load the zones from if it exists, or to save
+            them to after fetching, by default None.
+        max_age : datetime.timedelta | None, optional
+            Refetch the zones if ``cache_path`` was saved longer ago than
+            this, by default ``DEFAULT_MAX_AGE``. None to always use it.
+
+        Returns
+        -------
+        ZoneIndex
+            The index of every zone.
+
+        Raises
+        ------
+        errors.CaicRequestException
+            If raised by ``CaicClient.zones_map``.
+        """
+
+        if cache_path is not None and pathlib.Path(cache_path).exists():
+            age = time.time() - pathlib.Path(cache_path).stat().st_mtime
+            if max_age is None or age <= max_age.total_seconds():
+                return cls.load(cache_path)
+            LOGGER.debug("Refetching zones, %s is out of date.", cache_path)
+
+        features = _features(await client.zones_map())
+        missing = [
+            (i, (feature.get("properties") or {}).get("geojson_url"))
+            for i, feature in enumerate(features)
+            if not feature.get("geometry")
+        ]
+        missing = [(i, url) for i, url in missing if url]
+
+        shapes = await asyncio.gather(
+            *(client.zone_geojson(url) for _, url in missing), return_exceptions=True
+        )
+        for (i, url), shape in zip(missing, shapes):
+            if isinstance(shape, Exception):
+                LOGGER.warning("Unable to get zone GeoJSON %s: %s", url, shape)
+                continue
+            geometry = next((part.get("geometry") for part in _features(shape)), None)
+            features[i] = {**features[i], "geometry": geometry}
+
+        data = {"type": "FeatureCollection", "features": features}
+
+        if cache_path is not None:
+            with open(cache_path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+
+        return cls.from_geojson(data)
+
+    def assign(
+        self,
+        lats: typing.Sequence[float | None] | np.ndarray,
+        lons: typing.Sequence[float | None] | np.ndarray,
+        zone_type: str | None = None,
+    ) -> np.ndarray:
+        """
+        Find the zone of every point.
+
+        Parameters
+        ----------
+        lats : typing.Sequence[float | None] | np.ndarray
+            The latitudes of the points, None or NaN where unknown.
+        lons : typing.Sequence[float | None] | np.ndarray
+            The longitudes of the points, the same length as ``lats``.
+        zone_type : str | None, optional
+            Only consider zones of this type - ``BC_ZONE`` or ``HWY_ZONE`` -
+            or None for any zone, by default None. Backcountry and highway
+            zones overlap, so pass a type to get one or the other.
+
+        Returns
+        -------
+        np.ndarray
+            An object array of the zone ID of each point, None where a point
+            is in no zone (or has no location).
+
+        Raises
+        ------
+        ValueError
+            If ``zone_type`` is given but no zone has that type, eg. because
+            the GeoJSON features lack a ``type`` property.
+        """
+
+        if zone_type is not None and zone_type not in self._types:
+            raise ValueError(
+                f"None of the {len(self.zones)} zones is a '{zone_type}' zone, "
+                "check the 'type' property of the GeoJSON features."
+            )
+
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+
+        ids = np.full(len(lats), None, dtype=object)
+        pending = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+
+        for zone in self.zones:
+            if not len(pending):
+                break
+            if zone_type is not None and zone.type != zone_type:
+                continue
+
+            found = contains(zone, lats[pending], lons[pending])
+            ids[pending[found]] = zone.id
+            pending = pending[~found]
+
+        return ids
+
+    def locate(
+        self, lat: float, lon: float, zone_type: str | None = None
+    ) -> Zone | None:
+        """Find the zone of a single point, see ``assign``."""
+
+        zone_id = self.assign([lat], [lon], zone_type)[0]
+
+        return None if zone_id is None else self.get(zone_id)
+
+    def fill_zone_ids(
+        self,
+        objs: typing.Iterable[pydantic.BaseModel],
+        attr: str = "backcountry_zone_id",
+        zone_type: str | None = BC_ZONE,
+    ) -> int:
+        """
+        Set the zone ID of every object that lacks one, from its location.
+
+        Parameters
+        ----------
+        objs : typing.Iterable[pydantic.BaseModel]
+            Objects with ``latitude``, ``longitude`` and ``attr``, eg.
+            ``models.AvalancheObservation`` objects.
+        attr : str, optional
+            The attr to fill in, by default "backcountry_zone_id". Use
+            "highway_zone_id" with ``zone_type=HWY_ZONE`` for highway zones.
+        zone_type : str | None, optional
+            The type of zone to assign, see ``assign``. By default ``BC_ZONE``,
+            to match ``attr``.
+
+        Returns
+        -------
+        int
+            The number of objects whose zone ID was filled in.
+
+        Raises
+        ------
+        ValueError
+            If no zone is of type ``zone_type``, see ``assign``.
+        """
+
+        missing = [obj for obj in objs if getattr(obj, attr, None) is None]
+        if not missing:
+            return 0
+
+        ids = self.assign(
+            [obj.latitude for obj in missing],
+            [obj.longitude for obj in missing],
+            zone_type,
+        )
+
+        filled = 0
+        for obj, zone_id in zip(missing, ids):
+            if zone_id is not None:
+                setattr(obj, attr, zone_id)
+                filled += 1
+
+        return filled
@@ -0,0 +1,274 @@
+"""Tests for caic_python.cache and its use by CaicClient."""
+
+import asyncio
+import datetime
+import json
+
+from caic_python import cache
+from caic_python import client as caic_client
+from caic_python import models
+
+
+PAST = {"r[observed_at_lteq]": "2020-01-31T00:00:00Z"}
+
+REPORT = {"id": "r1", "type": "observation_report"}
+
+
+def test_max_age(tmp_path):
+    store = cache.SqliteCache(
+        tmp_path / "cache.db", max_age=datetime.timedelta(minutes=30)
+    )
+    store.store("key", b"body")
+    assert store.get("key") == b"body"
+
+    # pylint: disable-next=W0212
+    store._conn.execute("UPDATE responses SET stored_at = stored_at - 3600")
+    assert store.get("key") is None
+
+    store.max_age = None
+    assert store.get("key") == b"body"
+
+
+def test_async_methods(tmp_path):
+    store = cache.SqliteCache(tmp_path / "cache.db")
+
+    async def run():
+        await store.astore("key", b"body")
+        first = await store.aget("key")
+        await store.aevict("key")
+        return first, await store.aget("key")
+
+    assert asyncio.run(run()) == (b"body", None)
+
+
+def test_invalid_page_is_evicted_and_fetched_again(tmp_path):
+    persistent = cache.SqliteCache(tmp_path / "cache.db")
+    bodies = [json.dumps([{"id": "r1"}]).encode(), json.dumps([REPORT]).encode()]
+    calls = []
+
+    async def run():
+        client = caic_client.CaicClient(persistent_cache=persistent)
+
+        async def get_once(url, params=None):
+            calls.append(url)
+            return bodies[len(calls) - 1]
+
+        client._get_once = get_once  # pylint: disable=W0212
+        try:
+            return await client._api_page(  # pylint: disable=W0212
+                1,
+                100,
+                caic_client.CaicApiEndpoints.OBS_REPORT,
+                models.FieldReport,
+                PAST,
+                retries=2,
+                budget=caic_client._RetryBudget(10),  # pylint: disable=W0212
+            )
+        finally:
+            await client.close()
+
+    page = asyncio.run(run())
+
+    assert len(calls) == 2
+    assert [report.id for report in page.items] == ["r1"]
+
+    key = persistent.key(
+        caic_client.CaicURLs.API + caic_client.CaicApiEndpoints.OBS_REPORT,
+        {**PAST, "per": 100, "page": 1},
+    )
+    assert persistent.get(key) == bodies[1]
+
+
+class _Response:
+    def __init__(self, status, body=b"", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self.body
+
+    async def text(self):
+        return self.body.decode()
+
+    def release(self):
+        pass
+
+
+class _Session:
+    """Answers each GET with the next response, recording the request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def get(self, url, params=None, headers=None):
+        self.requests.append((url, params, headers))
+        return self.responses.pop(0)
+
+    async def close(self):
+        pass
+
+
+def _get_twice(http_cache, *responses):
+    """Get the same URL twice, with different ``t`` params."""
+
+    async def run():
+        client = caic_client.CaicClient(http_cache=http_cache)
+        await client.session.close()
+        client.session = _Session(*responses)
+        try:
+            first = await client._get_raw(  # pylint: disable=W0212
+                "https://example.com/api", {"page": 1, "t": "1"}
+            )
+            second = await client._get_raw(  # pylint: disable=W0212
+                "https://example.com/api", {"page": 1, "t": "2"}
+            )
+            return first, second, client.session.requests
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_http_cache_key_drops_cache_busting_params():
+    http_cache = cache.HttpCache()
+
+    assert http_cache.key("u", {"t": "1", "b": 2, "a": 1}) == "u?a=1&b=2"
+    assert http_cache.key("u", {"t": "1"}) == http_cache.key("u", {"t": "2"})
+
+
+def test_not_modified_returns_the_cached_body():
+    validators = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    http_cache = cache.HttpCache()
+
+    first, second, requests = _get_twice(
+        http_cache, _Response(200, b"[1]", validators), _Response(304)
+    )
+
+    assert first == second == b"[1]"
+    assert not requests[0][2]
+    assert requests[1][2] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert len(http_cache) == 1
+
+
+def test_changed_response_replaces_the_cached_body():
+    http_cache = cache.HttpCache()
+
+    _, second, requests = _get_twice(
+        http_cache,
+        _Response(200, b"[1]", {"ETag": '"v1"'}),
+        _Response(200, b"[2]", {"ETag": '"v2"'}),
+    )
+
+    assert second == b"[2]"
+    assert requests[1][2] == {"If-None-Match": '"v1"'}
+    assert http_cache.get(http_cache.key("https://example.com/api", {"page": 1})) == (
+        cache.CachedResponse(b"[2]", '"v2"', None)
+    )
+
+
+def test_responses_without_validators_are_not_cached():
+    http_cache = cache.HttpCache()
+
+    _, _, requests = _get_twice(http_cache, _Response(200, b"[1]"), _Response(200))
+
+    assert not requests[1][2]
+    assert not http_cache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _ttl_cache(monkeypatch, **kwargs):
+    clock = _Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    return cache.TTLCache(**kwargs), clock
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    ttl_cache, clock = _ttl_cache(monkeypatch, ttl=10)
+    ttl_cache.store("/api/v2/observation_reports", "r1", "report")
+
+    clock.now += 9
+    assert ttl_cache.get("/api/v2/observation_reports", "r1") == "report"
+
+    clock.now += 1
+    assert ttl_cache.get("/api/v2/observation_reports", "r1") is None
+    assert not ttl_cache
+    assert (ttl_cache.hits, ttl_cache.misses) == (1, 1)
+
+
+def test_ttl_cache_default_ttls_keep_zones_longer(monkeypatch):
+    ttl_cache, clock = _ttl_cache(monkeypatch, ttl=10)
+    ttl_cache.store(caic_client.CaicApiEndpoints.ZONES, "aspen", "zone")
+    ttl_cache.store(caic_client.CaicApiEndpoints.OBS_REPORT, "r1", "report")
+
+    clock.now += 60 * 60
+    assert ttl_cache.get(caic_client.CaicApiEndpoints.ZONES, "aspen") == "zone"
+    assert ttl_cache.get(caic_client.CaicApiEndpoints.OBS_REPORT, "r1") is None
+
+    clock.now += cache.DEFAULT_TTLS[caic_client.CaicApiEndpoints.ZONES]
+    assert ttl_cache.get(caic_client.CaicApiEndpoints.ZONES, "aspen") is None
+
+
+def test_ttl_cache_drops_the_least_recently_used(monkeypatch):
+    ttl_cache, _ = _ttl_cache(monkeypatch, max_entries=2)
+    ttl_cache.store("ns", "a", 1)
+    ttl_cache.store("ns", "b", 2)
+    assert ttl_cache.get("ns", "a") == 1
+
+    ttl_cache.store("ns", "c", 3)
+
+    assert ttl_cache.get("ns", "b") is None
+    assert ttl_cache.get("ns", "a") == 1
+    assert ttl_cache.get("ns", "c") == 3
+
+
+def test_id_lookups_are_cached_by_id_and_model():
+    bodies = {
+        "r1": json.dumps(REPORT).encode(),
+        "r2": json.dumps({**REPORT, "id": "r2"}).encode(),
+    }
+    urls = []
+
+    async def run():
+        client = caic_client.CaicClient(id_cache=cache.TTLCache())
+
+        async def get_raw(url, params=None):
+            urls.append(url)
+            return bodies[url.rsplit("/", 1)[1].removesuffix(".json")]
+
+        client._get_raw = get_raw  # pylint: disable=W0212
+        try:
+            endpoint = caic_client.CaicApiEndpoints.OBS_REPORT
+            first = await client._api_id_fetch(  # pylint: disable=W0212
+                "r1", endpoint, models.FieldReport
+            )
+            again = await client._api_id_fetch(  # pylint: disable=W0212
+                "r1", endpoint, models.FieldReport
+            )
+            lazy = await client._api_id_fetch(  # pylint: disable=W0212
+                "r1", endpoint, models.LazyFieldReport
+            )
+            other = await client._api_id_fetch(  # pylint: disable=W0212
+                "r2", endpoint, models.FieldReport
+            )
+            return first, again, lazy, other
+        finally:
+            await client.close()
+
+    first, again, lazy, other = asyncio.run(run())
+
+    assert again is first
+    assert isinstance(lazy, models.LazyFieldReport)
+    assert other.id == "r2"
+    assert len(urls) == 3
@@ -0,0 +1,296 @@
+"""Tests for CaicClient."""
+
+# pylint: disable=W0212
+
+import asyncio
+import json
+
+import pydantic
+import pytest
+
+from caic_python import client as caic_client
+from caic_python import errors
+from caic_python import models
+
+URL = "https://example.com/api"
+
+
+class _SlowFetch:
+    """Stands in for ``CaicClient._fetch_raw``, answering once released."""
+
+    def __init__(self, result=b"[]"):
+        self.result = result
+        self.calls = []
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def __call__(self, url, params=None):
+        self.calls.append((url, params))
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def _run(test):
+    """Run ``test(client, fetch)`` with a faked ``_fetch_raw``."""
+
+    async def run():
+        client = caic_client.CaicClient()
+        fetch = _SlowFetch()
+        client._fetch_raw = fetch
+        try:
+            return await test(client, fetch)
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_concurrent_identical_gets_share_one_request():
+    async def test(client, fetch):
+        gets = [
+            asyncio.ensure_future(client._get_raw(URL, {"page": 1, "t": str(t)}))
+            for t in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        results = await asyncio.gather(*gets)
+        return results, fetch.calls, dict(client._in_flight)
+
+    results, calls, in_flight = _run(test)
+
+    assert results == [b"[]"] * 3
+    assert len(calls) == 1
+    assert not in_flight
+
+
+def test_different_params_are_not_shared():
+    async def test(client, fetch):
+        gets = [
+            asyncio.ensure_future(client._get_raw(URL, {"page": page}))
+            for page in (1, 2)
+        ]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        await asyncio.gather(*gets)
+        return fetch.calls
+
+    assert len(_run(test)) == 2
+
+
+def test_cancelling_one_waiter_keeps_the_shared_request():
+    async def test(client, fetch):
+        first = asyncio.ensure_future(client._get_raw(URL))
+        second = asyncio.ensure_future(client._get_raw(URL))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        fetch.release.set()
+
+        return first.cancelled(), await second, fetch.cancelled, fetch.calls
+
+    cancelled, result, fetch_cancelled, calls = _run(test)
+
+    assert cancelled
+    assert result == b"[]"
+    assert not fetch_cancelled
+    assert len(calls) == 1
+
+
+def test_errors_are_shared_and_not_kept():
+    async def test(client, fetch):
+        fetch.result = errors.CaicRequestException("boom", status=500)
+        gets = [asyncio.ensure_future(client._get_raw(URL)) for _ in range(2)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        results = await asyncio.gather(*gets, return_exceptions=True)
+        in_flight = dict(client._in_flight)
+
+        fetch.result = b"[1]"
+        return results, in_flight, await client._get_raw(URL), fetch.calls
+
+    results, in_flight, retried, calls = _run(test)
+
+    assert all(isinstance(result, errors.CaicRequestException) for result in results)
+    assert not in_flight
+    assert retried == b"[1]"
+    assert len(calls) == 2
+
+
+def test_coalescing_can_be_turned_off():
+    async def test(client, fetch):
+        client.coalesce = False
+        gets = [asyncio.ensure_future(client._get_raw(URL)) for _ in range(2)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        await asyncio.gather(*gets)
+        return fetch.calls
+
+    assert len(_run(test)) == 2
+
+
+class _IdFetch:
+    """Stands in for ``CaicClient._api_id_fetch``, tracking concurrency."""
+
+    def __init__(self, failures=()):
+        self.failures = dict(failures)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, obj_id, endpoint, resp_model):
+        self.calls.append(obj_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (len(self.calls) % 3))
+        finally:
+            self.in_flight -= 1
+        if obj_id in self.failures:
+            raise self.failures[obj_id]
+        return resp_model(id=obj_id, type="observation_report")
+
+
+def _by_ids(fetch, obj_ids, concurrency):
+    async def run():
+        client = caic_client.CaicClient()
+        client._api_id_fetch = fetch
+        try:
+            return await client.field_reports_by_ids(obj_ids, concurrency)
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_by_ids_dedupes_and_bounds_concurrency():
+    fetch = _IdFetch()
+    obj_ids = [f"r{i % 10}" for i in range(30)]
+
+    reports, failures = _by_ids(fetch, obj_ids, concurrency=3)
+
+    assert sorted(fetch.calls) == sorted(set(obj_ids))
+    assert fetch.max_in_flight == 3
+    assert sorted(reports) == sorted(set(obj_ids))
+    assert all(report.id == obj_id for obj_id, report in reports.items())
+    assert not failures
+
+
+def test_by_ids_splits_results_and_errors():
+    missing = errors.CaicRequestException("Not found", status=404)
+    fetch = _IdFetch({"r2": missing})
+
+    reports, failures = _by_ids(fetch, ["r1", "r2", "r3"], concurrency=10)
+
+    assert sorted(reports) == ["r1", "r3"]
+    assert failures == {"r2": missing}
+
+
+def test_by_ids_raises_unexpected_errors():
+    fetch = _IdFetch({"r2": RuntimeError("bug")})
+
+    with pytest.raises(RuntimeError, match="bug"):
+        _by_ids(fetch, ["r1", "r2", "r3"], concurrency=1)
+
+
+def _avy(obs_id, report_id):
+    return models.AvalancheObservation(
+        id=obs_id, observation_report={"id": report_id} if report_id else None
+    )
+
+
+def test_hydrate_field_reports_attaches_each_parent_once():
+    fetch = _IdFetch({"r3": errors.CaicRequestException("Not found", status=404)})
+    obs = [
+        _avy("a1", "r1"),
+        _avy("a2", "r2"),
+        _avy("a3", "r1"),
+        _avy("a4", "r3"),
+        _avy("a5", None),
+    ]
+
+    async def run():
+        client = caic_client.CaicClient()
+        client._api_id_fetch = fetch
+        try:
+            return await client.hydrate_field_reports(obs)
+        finally:
+            await client.close()
+
+    reports, failures = asyncio.run(run())
+
+    assert sorted(fetch.calls) == ["r1", "r2", "r3"]
+    assert sorted(reports) == ["r1", "r2"]
+    assert list(failures) == ["r3"]
+    assert [ob.field_report_id for ob in obs] == ["r1", "r2", "r1", "r3", None]
+    assert obs[0].field_report is obs[2].field_report is reports["r1"]
+    assert obs[1].field_report is reports["r2"]
+    assert obs[3].field_report is None
+    assert obs[4].field_report is None
+
+
+def test_fieldobs_gets_the_parent_report_once():
+    ob = _avy("a1", "r1")
+    calls = []
+
+    class _Client:
+        async def field_report(self, report_id):
+            calls.append(report_id)
+            return models.FieldReport(id=report_id, type="observation_report")
+
+    async def run():
+        return await ob.fieldobs(_Client()), await ob.fieldobs(_Client())
+
+    first, second = asyncio.run(run())
+
+    assert calls == ["r1"]
+    assert first.id == "r1"
+    assert second is first is ob.field_report
+
+
+def _validate_page(body, on_invalid=None):
+    async def run():
+        client = caic_client.CaicClient()
+        try:
+            return client._validate_page(
+                3,
+                caic_client.CaicApiEndpoints.OBS_REPORT,
+                models.FieldReport,
+                json.dumps(body).encode(),
+                on_invalid,
+            )
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_validate_page_passes_invalid_items_to_on_invalid():
+    valid = [{"id": f"r{i}", "type": "observation_report"} for i in range(3)]
+    invalid = [{"id": "bad1"}, {"id": "bad2", "type": "not_a_type"}]
+    invalid_items = []
+
+    page = _validate_page(
+        [valid[0], invalid[0], valid[1], invalid[1], valid[2]], invalid_items.append
+    )
+
+    assert [report.id for report in page.items] == ["r0", "r1", "r2"]
+    assert (page.number, page.count) == (3, 5)
+    assert [item.raw for item in invalid_items] == invalid
+    assert {(item.endpoint, item.page) for item in invalid_items} == {
+        (caic_client.CaicApiEndpoints.OBS_REPORT, 3)
+    }
+    assert all(
+        isinstance(item.error, pydantic.ValidationError) for item in invalid_items
+    )
+
+
+def test_validate_page_raises_without_on_invalid():
+    with pytest.raises(pydantic.ValidationError):
+        _validate_page([{"id": "r0", "type": "observation_report"}, {"id": "bad"}])
@@ -0,0 +1,76 @@
+"""Tests for caic_python.export."""
+
+import asyncio
+
+import pytest
+
+from caic_python import models
+
+pq = pytest.importorskip("pyarrow.parquet")
+export = pytest.importorskip("caic_python.export")
+
+
+def _avy(i, zone="z1", observed_at="2024-01-15T12:00:00Z"):
+    return models.AvalancheObservation(
+        id=f"a{i}",
+        backcountry_zone_id=zone,
+        observed_at=observed_at,
+        destructive_size="D2",
+    )
+
+
+def _rows(paths):
+    rows = []
+    for path in paths:
+        rows.extend(pq.read_table(path).to_pylist())
+    return sorted(rows, key=lambda row: row["id"])
+
+
+def test_write_parquet_round_trip(tmp_path):
+    objs = [_avy(i) for i in range(5)]
+
+    paths = asyncio.run(export.write_parquet(objs, tmp_path, batch_size=2))
+
+    assert len(paths) == 1
+    assert paths[0].parent == (
+        tmp_path / "AvalancheObservation" / "season=2023-2024" / "zone=z1"
+    )
+    rows = _rows(paths)
+    assert [row["id"] for row in rows] == [f"a{i}" for i in range(5)]
+    assert {row["destructive_size"] for row in rows} == {"D2"}
+    assert {row["backcountry_zone_id"] for row in rows} == {"z1"}
+
+
+def test_write_parquet_keeps_earlier_exports(tmp_path):
+    first = asyncio.run(export.write_parquet([_avy(1)], tmp_path))
+    second = asyncio.run(export.write_parquet([_avy(2)], tmp_path))
+
+    assert first != second
+    assert all(path.exists() for path in first + second)
+    assert [row["id"] for row in _rows(first + second)] == ["a1", "a2"]
+
+
+def test_write_parquet_limits_open_files(tmp_path):
+    zones = ["z1", "z2", "z3"]
+    objs = [_avy(f"{zone}-{i}", zone) for i in range(2) for zone in zones]
+
+    paths = asyncio.run(
+        export.write_parquet(objs, tmp_path, batch_size=1, max_open_files=1)
+    )
+
+    assert len(paths) == 6
+    assert len(set(paths)) == 6
+    assert [row["id"] for row in _rows(paths)] == sorted(obj.id for obj in objs)
+
+
+def test_partition_of_uses_zone_id_for_every_model():
+    zone = models.BackcountryZone(id="z1", type="backcountry_zone", slug="aspen")
+    report = models.FieldReport(
+        id="r1",
+        type="observation_report",
+        backcountry_zone=zone,
+        observed_at="2024-01-15T12:00:00Z",
+    )
+
+    assert export.partition_of(report) == export.partition_of(_avy(1))
+    assert export.partition_of(report) == ("2023-2024", "z1")
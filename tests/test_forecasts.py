@@ -0,0 +1,60 @@
+"""Tests for the avy_forecast methods of both clients."""
+
+import asyncio
+import json
+
+from caic_python import client as caic_client
+from caic_python import models
+
+
+def _regional(forecast_id):
+    return {
+        "id": forecast_id,
+        "title": "Regional Discussion",
+        "type": "regionaldiscussionforecast",
+        "polygons": [],
+        "areaId": "area",
+        "forecaster": "someone",
+        "issueDateTime": "2024-01-01T00:00:00Z",
+        "expiryDateTime": "2024-01-02T00:00:00Z",
+        "message": "",
+        "communications": {"headline": "", "sms": ""},
+        "media": {"Images": []},
+    }
+
+
+PAYLOAD = [_regional("f1"), {"type": "avalancheforecast", "id": "bad"}, _regional("f2")]
+
+
+def test_async_client_skips_invalid_forecasts():
+    async def run():
+        client = caic_client.CaicClient()
+
+        async def proxy_get_raw(**_):
+            return json.dumps(PAYLOAD).encode()
+
+        client._proxy_get_raw = proxy_get_raw  # pylint: disable=W0212
+        try:
+            return await client.avy_forecast("2024-01-01")
+        finally:
+            await client.close()
+
+    forecasts = asyncio.run(run())
+
+    assert [forecast.id for forecast in forecasts] == ["f1", "f2"]
+    assert all(
+        isinstance(forecast, models.RegionalDiscussionForecast)
+        for forecast in forecasts
+    )
+
+
+def test_sync_client_matches_async_client():
+    client = caic_client.SyncCaicClient()
+    client._proxy_get = lambda **_: PAYLOAD  # pylint: disable=W0212
+
+    try:
+        forecasts = client.avy_forecast("2024-01-01")
+    finally:
+        client.close()
+
+    assert [forecast.id for forecast in forecasts] == ["f1", "f2"]
@@ -0,0 +1,25 @@
+"""Tests for caic_python.frame."""
+
+import json
+
+import pytest
+
+from caic_python import models
+
+frame = pytest.importorskip("caic_python.frame")
+
+
+def test_from_records_uses_loads():
+    pages = [json.dumps([{"id": "a1", "latitude": 39.5}]).encode()]
+    decoded = []
+
+    def loads(body):
+        decoded.append(body)
+        return json.loads(body)
+
+    obs = frame.ObservationFrame.from_records(
+        pages, models.AvalancheObservation, fields=["latitude"], loads=loads
+    )
+
+    assert decoded == pages
+    assert obs["latitude"].tolist() == [39.5]
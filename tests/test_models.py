@@ -0,0 +1,75 @@
+"""Tests for caic_python.models."""
+
+import pydantic
+import pytest
+
+from caic_python import models
+
+REPORT = {
+    "id": "r1",
+    "type": "observation_report",
+    "avalanche_observations": [{"id": "a1", "area": "Loveland Pass"}],
+    "weather_observations": None,
+}
+
+
+def test_lazy_field_report_matches_field_report():
+    report = models.FieldReport(**REPORT)
+    lazy = models.LazyFieldReport(**REPORT)
+
+    assert lazy.id == report.id
+    assert lazy.avalanche_observations == report.avalanche_observations
+    assert lazy.avalanche_observations[0].area == "Loveland Pass"
+    # Null collections stay None, and missing ones are empty.
+    assert lazy.weather_observations is report.weather_observations is None
+    assert lazy.snowpack_observations == report.snowpack_observations == []
+    assert lazy.assets == report.assets == []
+
+
+def test_lazy_field_report_validates_collections_on_access():
+    lazy = models.LazyFieldReport(
+        **{**REPORT, "avalanche_observations": [{"area": "no id"}]}
+    )
+
+    assert lazy.id == "r1"
+    with pytest.raises(pydantic.ValidationError):
+        lazy.avalanche_observations  # pylint: disable=W0104
+
+
+def test_lazy_field_report_dump_leaves_out_collections():
+    dumped = models.LazyFieldReport(**REPORT).model_dump()
+
+    assert dumped["id"] == "r1"
+    assert not models.LazyFieldReport.lazy_types.keys() & dumped.keys()
+
+
+def test_projection_keeps_only_the_given_fields():
+    projected = models.projection(models.AvalancheObservation, ["area", "aspect"])
+
+    ob = projected(id="a1", area="Loveland Pass", aspect="N", comments="dropped")
+
+    assert set(projected.model_fields) == {"id", "area", "aspect"}
+    assert ob.model_dump(mode="json") == {
+        "id": "a1",
+        "area": "Loveland Pass",
+        "aspect": "N",
+    }
+    assert projected.projected_from is models.AvalancheObservation
+    reordered = models.projection(models.AvalancheObservation, ["aspect", "area"])
+    assert reordered is projected
+
+
+def test_projection_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="not_a_field"):
+        models.projection(models.FieldReport, ["description", "not_a_field"])
+
+
+def test_v1_avy_response_of_a_projection():
+    projected = models.projection(models.AvalancheObservation, ["area"])
+    meta = {"current_page": 1, "page_items": 1, "total_pages": 1, "total_count": 1}
+
+    resp = models.v1_avy_response(projected)(
+        meta=meta, links={}, data=[{"id": "a1", "area": "Vail", "aspect": "N"}]
+    )
+
+    assert [ob.model_dump() for ob in resp.data] == [{"id": "a1", "area": "Vail"}]
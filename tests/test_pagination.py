@@ -0,0 +1,186 @@
+"""Tests for the pagination of CaicClient."""
+
+import asyncio
+import contextlib
+
+import pytest
+
+from caic_python import client as caic_client
+from caic_python import models
+
+_Page = caic_client._Page  # pylint: disable=W0212
+
+
+class _FakePages:
+    """Serves pages to ``CaicClient._api_page``, recording each request.
+
+    ``total`` is the number of pages with items, ``per`` the items of each
+    full page, and ``delay`` how long each page takes, by page number.
+    """
+
+    def __init__(self, total, per=2, total_pages=None, delay=None, fail=()):
+        self.total = total
+        self.per = per
+        self.total_pages = total_pages
+        self.delay = delay or (lambda page: 0)
+        self.fail = set(fail)
+        self.requested = []
+        self.budgets = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.done = []
+        self.done_before = {}
+        self.cancelled = []
+
+    async def __call__(self, page, per, endpoint, resp_model, params, *args):
+        _, budget, *_ = args
+        self.requested.append(page)
+        self.done_before[page] = list(self.done)
+        self.budgets.append(budget)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay(page))
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        finally:
+            self.in_flight -= 1
+            self.done.append(page)
+
+        if page in self.fail:
+            budget.spend()
+            return None
+
+        count = self.per if page < self.total else 0 if page > self.total else 1
+        items = [f"{page}-{i}" for i in range(count)]
+        return _Page(page, items, count, self.total_pages)
+
+
+def _pages(client, fake, resp_model, **kwargs):
+    return client._api_pages(  # pylint: disable=W0212
+        caic_client.CaicApiEndpoints.V1_AVY_OBS,
+        resp_model,
+        None,
+        per=fake.per,
+        **kwargs,
+    )
+
+
+def _paginate(fake, resp_model=models.V1AvyResponse, **kwargs):
+    """Run ``_api_pages`` against ``fake``, returning the yielded page numbers."""
+
+    async def run():
+        client = caic_client.CaicClient()
+        client._api_page = fake  # pylint: disable=W0212
+        try:
+            return [
+                page.number async for page in _pages(client, fake, resp_model, **kwargs)
+            ]
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_v1_pages_stay_in_order_when_completing_out_of_order():
+    fake = _FakePages(5, total_pages=5, delay=lambda page: 0.01 * (6 - page))
+
+    assert _paginate(fake, concurrency=4) == [1, 2, 3, 4, 5]
+    assert fake.max_in_flight == 4
+
+
+def test_v1_window_widens_after_the_first_page():
+    fake = _FakePages(4, total_pages=4, delay=lambda page: 0.01)
+
+    assert _paginate(fake, concurrency=3) == [1, 2, 3, 4]
+    assert fake.done_before[2] == [1]
+    assert fake.done_before[4] == [1]
+    assert fake.max_in_flight == 3
+
+
+def test_v1_stops_at_the_last_page():
+    fake = _FakePages(3, total_pages=3)
+
+    assert _paginate(fake, concurrency=8) == [1, 2, 3]
+    assert sorted(fake.requested) == [1, 2, 3]
+
+
+def test_v1_stops_at_the_page_limit():
+    fake = _FakePages(10, total_pages=10)
+
+    assert _paginate(fake, concurrency=8, page_limit=4) == [1, 2, 3, 4]
+    assert sorted(fake.requested) == [1, 2, 3, 4]
+
+
+def test_pages_share_one_retry_budget():
+    fake = _FakePages(10, total_pages=10, fail=range(2, 11))
+
+    assert _paginate(fake, concurrency=1, total_retries=3) == [1]
+    assert len({id(budget) for budget in fake.budgets}) == 1
+    assert fake.budgets[0].exhausted
+    assert sorted(fake.requested) == [1, 2, 3, 4]
+
+
+def test_short_page_stops_the_read_ahead():
+    fake = _FakePages(3, delay=lambda page: 0.01 * page)
+
+    assert _paginate(fake, models.AvalancheObservation, read_ahead=4) == [1, 2, 3]
+    assert sorted(fake.requested) == [1, 2, 3, 4, 5, 6]
+    assert sorted(fake.cancelled) == [4, 5, 6]
+
+
+def test_empty_page_stops_the_read_ahead():
+    fake = _FakePages(2, per=1, delay=lambda page: 0.01 * page)
+
+    assert _paginate(fake, models.AvalancheObservation, read_ahead=2) == [1, 2, 3]
+    assert sorted(fake.requested) == [1, 2, 3, 4]
+    assert fake.cancelled == [4]
+
+
+def test_closing_early_cancels_pages_in_flight():
+    fake = _FakePages(100, delay=lambda page: 0 if page == 1 else 60)
+
+    async def run():
+        client = caic_client.CaicClient()
+        client._api_page = fake  # pylint: disable=W0212
+        try:
+            pages = _pages(client, fake, models.AvalancheObservation, read_ahead=3)
+            first = await anext(pages)
+            await pages.aclose()
+            return first, asyncio.all_tasks() - {asyncio.current_task()}
+        finally:
+            await client.close()
+
+    first, leftover = asyncio.run(run())
+
+    assert first.number == 1
+    assert fake.done == [1] + fake.cancelled
+    assert sorted(fake.cancelled) == [2, 3]
+    assert not leftover
+
+
+@pytest.mark.parametrize("method", ["iter_avy_obs", "iter_field_reports"])
+def test_iter_streams_pages_and_cancels_on_break(method):
+    fake = _FakePages(100, delay=lambda page: 0 if page == 1 else 60)
+    seen = []
+
+    async def run():
+        client = caic_client.CaicClient()
+        client._api_page = fake  # pylint: disable=W0212
+        try:
+            stream = getattr(client, method)("2024-01-01", "2024-01-02", read_ahead=3)
+            async with contextlib.aclosing(stream) as obs:
+                async for ob in obs:
+                    seen.append((ob, list(fake.done)))
+                    if len(seen) == 2:
+                        break
+            return asyncio.all_tasks() - {asyncio.current_task()}
+        finally:
+            await client.close()
+
+    leftover = asyncio.run(run())
+
+    assert seen == [("1-0", [1]), ("1-1", [1])]
+    assert sorted(fake.cancelled) == [2, 3]
+    assert not leftover
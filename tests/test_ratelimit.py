@@ -0,0 +1,75 @@
+"""Tests for caic_python.ratelimit."""
+
+import asyncio
+
+from caic_python import ratelimit
+
+
+PAGES = "/api/v2/avalanche_observations"
+ZONE = "/api/v2/zones/front-range.json"
+
+
+def test_fast_lookup_does_not_collapse_page_limit():
+    controller = ratelimit.AIMDController(initial=8)
+
+    controller.on_success(0.01, ZONE)
+    for _ in range(50):
+        controller.on_success(0.5, PAGES)
+
+    assert controller.limit > 8
+
+
+def test_rising_latency_on_one_endpoint_lowers_limit():
+    controller = ratelimit.AIMDController(initial=8)
+
+    controller.on_success(0.1, PAGES)
+    for _ in range(10):
+        controller.on_success(1.0, PAGES)
+
+    assert controller.limit < 8
+
+
+def test_baseline_minimum_expires():
+    baseline = ratelimit.LatencyBaseline(window=10, smoothing=0.2)
+
+    baseline.add(0.01, now=0)
+    baseline.add(0.5, now=5)
+    assert baseline.minimum == 0.01
+
+    baseline.add(0.6, now=20)
+    assert baseline.minimum == 0.6
+
+
+def _request(limiter, status, read_time=0.0):
+    async def run():
+        async with limiter.request(f"https://example.com{PAGES}") as outcome:
+            outcome.status = status
+            await asyncio.sleep(read_time)
+
+    asyncio.run(run())
+
+
+def test_client_errors_are_not_latency_samples():
+    limiter = ratelimit.RateLimiter(adaptive=True, initial=8)
+
+    _request(limiter, 404)
+
+    controller = limiter.controllers["example.com"]
+    assert controller.limit == 8
+    assert controller.latency is None
+
+
+def test_throttle_status_lowers_limit():
+    limiter = ratelimit.RateLimiter(adaptive=True, initial=8)
+
+    _request(limiter, 429)
+
+    assert limiter.controllers["example.com"].limit == 4
+
+
+def test_latency_excludes_body_read():
+    limiter = ratelimit.RateLimiter(adaptive=True)
+
+    _request(limiter, 200, read_time=0.05)
+
+    assert limiter.controllers["example.com"].latency < 0.05
@@ -0,0 +1,82 @@
+"""Tests for caic_python.retry and the retries of CaicClient."""
+
+import asyncio
+
+import pytest
+
+from caic_python import client as caic_client
+from caic_python import errors
+from caic_python import models
+from caic_python import retry
+
+
+def _error(status):
+    return errors.CaicRequestException(f"status {status}", status=status)
+
+
+@pytest.mark.parametrize("status", [None, 408, 429, 500, 502, 503, 504])
+def test_retryable(status):
+    policy = retry.RetryPolicy(attempts=3)
+
+    assert policy.should_retry(0, _error(status))
+    assert policy.should_retry(1, _error(status))
+    assert not policy.should_retry(2, _error(status))
+
+
+@pytest.mark.parametrize("status", [400, 401, 403, 404, 501])
+def test_fatal(status):
+    assert not retry.RetryPolicy(attempts=3).should_retry(0, _error(status))
+
+
+def test_retry_after_wins_over_backoff():
+    policy = retry.RetryPolicy(max_retry_after=60)
+
+    assert policy.backoff(0, "7") == 7
+    assert policy.backoff(0, "600") == 60
+    assert 0 <= policy.backoff(3, "not a date") <= policy.base * 2**3
+
+
+def _page_requests(status):
+    """Request one page that always fails with ``status``, counting requests."""
+
+    async def run():
+        client = caic_client.CaicClient(
+            retry_policy=retry.RetryPolicy(attempts=3, base=0)
+        )
+        calls = []
+
+        async def get_once(url, params=None):
+            calls.append(url)
+            raise _error(status)
+
+        client._get_once = get_once  # pylint: disable=W0212
+        try:
+            page = await client._api_page(  # pylint: disable=W0212
+                1,
+                100,
+                caic_client.CaicApiEndpoints.OBS_REPORT,
+                models.FieldReport,
+                None,
+                retries=2,
+                budget=caic_client._RetryBudget(10),  # pylint: disable=W0212
+            )
+        finally:
+            await client.close()
+
+        return page, len(calls)
+
+    return asyncio.run(run())
+
+
+def test_page_retryable_status_uses_policy_attempts_only():
+    page, calls = _page_requests(503)
+
+    assert page is None
+    assert calls == 3
+
+
+def test_page_fatal_status_is_not_retried():
+    page, calls = _page_requests(404)
+
+    assert page is None
+    assert calls == 1
@@ -0,0 +1,169 @@
+"""Tests for the time-range sharding of CaicClient queries."""
+
+import asyncio
+import collections
+import datetime
+
+import dateutil.parser
+import pytest
+
+from caic_python import client as caic_client
+from caic_python import models
+from caic_python import utils
+
+UTC = datetime.timezone.utc
+
+_Page = caic_client._Page  # pylint: disable=W0212
+
+
+def _at(text):
+    return datetime.datetime.fromisoformat(text).replace(tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    "step, expected",
+    [
+        (
+            datetime.timedelta(days=1),
+            [
+                ("2024-01-01T00:00", "2024-01-02T00:00"),
+                ("2024-01-02T00:00", "2024-01-03T00:00"),
+                ("2024-01-03T00:00", "2024-01-03T12:00"),
+            ],
+        ),
+        (
+            datetime.timedelta(weeks=1),
+            [("2024-01-01T00:00", "2024-01-03T12:00")],
+        ),
+        (
+            datetime.timedelta(hours=30),
+            [
+                ("2024-01-01T00:00", "2024-01-02T06:00"),
+                ("2024-01-02T06:00", "2024-01-03T12:00"),
+            ],
+        ),
+    ],
+)
+def test_split_time_range_windows_share_their_boundaries(step, expected):
+    windows = utils.split_time_range(
+        _at("2024-01-01T00:00"), _at("2024-01-03T12:00"), step
+    )
+
+    assert windows == [(_at(start), _at(end)) for start, end in expected]
+
+
+def test_split_time_range_edges():
+    day = datetime.timedelta(days=1)
+
+    assert not utils.split_time_range("2024-01-01", "2024-01-01", day)
+    assert utils.split_time_range("2024-01-01", "2024-01-02", day) == [
+        (datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2))
+    ]
+    with pytest.raises(ValueError):
+        utils.split_time_range("2024-01-01", "2024-01-02", datetime.timedelta(0))
+
+
+def test_dedupe_by_id_keeps_the_first():
+    items = [
+        models.AvalancheObservation(id="a", comments="newer window"),
+        models.AvalancheObservation(id="b"),
+        models.AvalancheObservation(id="a", comments="older window"),
+    ]
+
+    unique = utils.dedupe_by_id(items)
+
+    assert [(item.id, item.comments) for item in unique] == [
+        ("a", "newer window"),
+        ("b", None),
+    ]
+
+
+class _FakeObs:
+    """Serves avalanche observations by ``observed_after``/``observed_before``.
+
+    Both bounds are inclusive, like the API's, and newest come first.
+    """
+
+    def __init__(self, times):
+        self.obs = sorted(
+            (
+                models.AvalancheObservation(id=f"a{i}", observed_at=time)
+                for i, time in enumerate(times)
+            ),
+            key=lambda ob: ob.observed_at,
+            reverse=True,
+        )
+        self.requests = collections.Counter()
+
+    async def __call__(self, page, per, endpoint, resp_model, params, *args):
+        after = dateutil.parser.parse(params["observed_after"])
+        before = dateutil.parser.parse(params["observed_before"])
+        self.requests[(after, before, page)] += 1
+
+        matching = [ob for ob in self.obs if after <= ob.observed_at <= before]
+        items = matching[(page - 1) * per : page * per]
+        return _Page(page, items, len(items), None)
+
+
+def _sharded(fake, shard, per=1000):
+    async def run():
+        client = caic_client.CaicClient()
+        client._api_page = fake  # pylint: disable=W0212
+        try:
+            return await client._api_sharded(  # pylint: disable=W0212
+                caic_client.CaicApiEndpoints.AVY_OBS,
+                models.AvalancheObservation,
+                lambda start, end: {"observed_after": start, "observed_before": end},
+                "2024-01-01T00:00:00+00:00",
+                "2024-01-04T00:00:00+00:00",
+                shard,
+                per=per,
+            )
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("shard", ["day", "week", datetime.timedelta(hours=7)])
+def test_fixed_shards_dedupe_records_on_an_edge(shard):
+    fake = _FakeObs(
+        [
+            _at("2024-01-01T03:00"),
+            _at("2024-01-02T00:00"),  # on the edge of two day windows
+            _at("2024-01-03T00:00"),  # on the edge of two day windows
+            _at("2024-01-03T23:00"),
+        ]
+    )
+
+    obs = _sharded(fake, shard)
+
+    assert [ob.id for ob in obs] == ["a3", "a2", "a1", "a0"]
+
+
+def test_unknown_shard_size():
+    with pytest.raises(ValueError):
+        _sharded(_FakeObs([]), "month")
+
+
+def test_adaptive_stops_splitting_at_the_minimum():
+    start = _at("2024-01-01T00:00")
+    # Dense enough that even the shortest windows need several pages.
+    fake = _FakeObs([start + datetime.timedelta(minutes=10 * i) for i in range(432)])
+
+    obs = _sharded(fake, "adaptive", per=10)
+
+    assert sorted(ob.id for ob in obs) == sorted(ob.id for ob in fake.obs)
+    windows = {(after, before) for after, before, _ in fake.requests}
+    shortest = min(before - after for after, before in windows)
+    assert caic_client.MIN_ADAPTIVE_SHARD / 2 < shortest
+    assert shortest <= caic_client.MIN_ADAPTIVE_SHARD
+
+
+def test_adaptive_reuses_the_first_page_of_a_window():
+    start = _at("2024-01-01T00:00")
+    fake = _FakeObs([start + datetime.timedelta(minutes=10 * i) for i in range(432)])
+
+    _sharded(fake, "adaptive", per=10)
+
+    assert set(fake.requests.values()) == {1}
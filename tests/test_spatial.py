@@ -0,0 +1,141 @@
+"""Tests for caic_python.spatial."""
+
+import random
+import time
+import types
+
+import pytest
+
+from caic_python import spatial
+
+CELL = 0.05
+
+
+def _points(n=300, seed=7):
+    """Random points over Colorado, with some exactly on cell edges."""
+
+    rand = random.Random(seed)
+    points = [
+        types.SimpleNamespace(
+            id=i, latitude=rand.uniform(37.0, 41.0), longitude=rand.uniform(-109, -102)
+        )
+        for i in range(n)
+    ]
+    points += [
+        types.SimpleNamespace(id=n + i, latitude=39.0 + CELL * i, longitude=-106.0)
+        for i in range(5)
+    ]
+
+    return points
+
+
+POINTS = _points()
+INDEX = spatial.SpatialIndex(POINTS, cell_degrees=CELL)
+
+
+def _by_distance(lat, lon, max_km=None):
+    """Every point and its distance, nearest first, by brute force."""
+
+    found = sorted(
+        (spatial.haversine_km(lat, lon, p.latitude, p.longitude), p.id) for p in POINTS
+    )
+
+    return [(pid, km) for km, pid in found if max_km is None or km <= max_km]
+
+
+def _ids(neighbors):
+    return [neighbor.obj.id for neighbor in neighbors]
+
+
+def test_skips_objects_without_a_location():
+    index = spatial.SpatialIndex(
+        [types.SimpleNamespace(latitude=None, longitude=1.0), POINTS[0]]
+    )
+
+    assert len(index) == 1
+    assert index.skipped == 1
+
+
+@pytest.mark.parametrize(
+    "bbox",
+    [
+        (38.5, -107.5, 39.5, -105.5),
+        (39.0, -106.0, 39.1, -106.0),  # edges on cell boundaries
+        (39.0 + CELL, -106.05, 39.0 + 3 * CELL, -105.95),
+        (0.0, -180.0, 89.0, 179.0),  # more cells than are occupied
+        (10.0, 10.0, 11.0, 11.0),  # away from the data
+    ],
+)
+def test_within_bbox_matches_a_scan(bbox):
+    min_lat, min_lon, max_lat, max_lon = bbox
+    expected = [
+        p.id
+        for p in POINTS
+        if min_lat <= p.latitude <= max_lat and min_lon <= p.longitude <= max_lon
+    ]
+
+    assert [p.id for p in INDEX.within_bbox(*bbox)] == expected
+
+
+@pytest.mark.parametrize(
+    "lat, lon, km",
+    [
+        (39.6, -106.1, 25.0),
+        (39.0, -106.0, 6.0),  # centered on a cell corner
+        (39.1, -106.0, 0.0),
+        (37.0, -109.0, 300.0),
+        (45.0, -100.0, 10.0),  # away from the data
+    ],
+)
+def test_within_radius_matches_a_scan(lat, lon, km):
+    neighbors = INDEX.within_radius(lat, lon, km)
+
+    assert _ids(neighbors) == [pid for pid, _ in _by_distance(lat, lon, km)]
+    assert [n.km for n in neighbors] == pytest.approx(
+        [d for _, d in _by_distance(lat, lon, km)]
+    )
+
+
+@pytest.mark.parametrize(
+    "lat, lon",
+    [
+        (39.6, -106.1),
+        (39.05, -106.0),  # on a cell edge
+        (41.5, -101.0),  # just outside the data
+        (0.0, 0.0),  # far outside the data
+        (-45.0, 170.0),
+    ],
+)
+@pytest.mark.parametrize("k", [1, 7, 50])
+def test_nearest_matches_a_scan(lat, lon, k):
+    neighbors = INDEX.nearest(lat, lon, k)
+
+    assert _ids(neighbors) == [pid for pid, _ in _by_distance(lat, lon)[:k]]
+
+
+def test_nearest_with_k_past_the_number_of_points():
+    neighbors = INDEX.nearest(39.6, -106.1, k=len(POINTS) + 10)
+
+    assert _ids(neighbors) == [pid for pid, _ in _by_distance(39.6, -106.1)]
+
+
+@pytest.mark.parametrize("max_km", [0.0, 15.0, 60.0])
+def test_nearest_within_max_km(max_km):
+    neighbors = INDEX.nearest(39.6, -106.1, k=10, max_km=max_km)
+
+    expected = _by_distance(39.6, -106.1, max_km)[:10]
+    assert _ids(neighbors) == [pid for pid, _ in expected]
+    assert all(n.km <= max_km for n in neighbors)
+
+
+def test_nearest_far_from_the_data_is_fast():
+    start = time.perf_counter()
+    neighbors = INDEX.nearest(0.0, 0.0, 1)
+
+    assert time.perf_counter() - start < 0.5
+    assert _ids(neighbors) == [_by_distance(0.0, 0.0)[0][0]]
+
+
+def test_nearest_edge_cases():
+    assert not INDEX.nearest(39.6, -106.1, k=0)
+    assert not spatial.SpatialIndex().nearest(39.6, -106.1)
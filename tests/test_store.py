@@ -0,0 +1,51 @@
+"""Tests for caic_python.store."""
+
+import pytest
+
+from caic_python import models
+from caic_python.store import Store
+
+
+def _report(**kwargs):
+    return {"id": "r1", "type": "observation_report", **kwargs}
+
+
+def test_upsert_keeps_the_newest_version(tmp_path):
+    newer = models.FieldReport(
+        **_report(description="newer", updated_at="2024-01-03T00:00:00Z")
+    )
+    older = models.FieldReport(
+        **_report(description="older", updated_at="2024-01-02T00:00:00Z")
+    )
+
+    with Store(tmp_path / "caic.db") as store:
+        assert store.upsert([newer]) == 1
+        assert store.upsert([older]) == 0
+
+        assert store.get("FieldReport", "r1").description == "newer"
+
+
+def test_upsert_stores_lazy_reports_as_field_reports(tmp_path):
+    report = models.LazyFieldReport.model_validate(
+        _report(
+            updated_at="2024-01-02T00:00:00Z",
+            avalanche_observations=[{"id": "a1", "destructive_size": "D2"}],
+        )
+    )
+
+    with Store(tmp_path / "caic.db") as store:
+        assert store.upsert([report]) == 2
+
+        stored = store.get("FieldReport", "r1")
+        assert [obs.id for obs in stored.avalanche_observations] == ["a1"]
+        assert store.get("AvalancheObservation", "a1").destructive_size.value == "D2"
+
+
+def test_upsert_rejects_projections(tmp_path):
+    model = models.projection(models.AvalancheObservation, ["latitude"])
+
+    with Store(tmp_path / "caic.db") as store:
+        with pytest.raises(TypeError, match="AvalancheObservation"):
+            store.upsert([model(id="a1", latitude=39.5)])
+
+        assert store.count() == 0
@@ -0,0 +1,115 @@
+"""Tests for caic_python.sync."""
+
+import asyncio
+import datetime
+
+import pytest
+
+from caic_python import client as caic_client
+from caic_python import models
+from caic_python import sync
+from caic_python.store import Store
+
+WATERMARK = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _report(report_id, updated_at):
+    return models.FieldReport(
+        id=report_id, type="observation_report", updated_at=updated_at
+    )
+
+
+def _sync(tmp_path, pages, page_limit=1000):
+    """Sync field reports, serving ``pages`` (None for a failed page)."""
+
+    async def run():
+        client = caic_client.CaicClient()
+
+        async def api_page(page, per, *_):
+            if page > len(pages) or pages[page - 1] is None:
+                return None
+            items = pages[page - 1]
+            return caic_client._Page(  # pylint: disable=W0212
+                page, items, per if page < len(pages) else len(items), None
+            )
+
+        client._api_page = api_page  # pylint: disable=W0212
+        try:
+            with Store(tmp_path / "caic.db") as store:
+                store.set_watermark("field-reports", WATERMARK)
+                result = await sync.sync_target(
+                    client,
+                    store,
+                    sync.TARGETS["field-reports"],
+                    page_limit=page_limit,
+                )
+                return result, store.watermark("field-reports")
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_sync_advances_the_watermark(tmp_path):
+    pages = [
+        [_report("r1", "2024-01-02T00:00:00Z")],
+        [_report("r2", "2024-01-03T00:00:00Z")],
+    ]
+
+    result, watermark = _sync(tmp_path, pages)
+
+    assert result.complete
+    assert result.fetched == 2
+    assert watermark == datetime.datetime(2024, 1, 3, tzinfo=datetime.timezone.utc)
+
+
+def test_sync_keeps_the_watermark_after_a_failed_page(tmp_path):
+    pages = [
+        [_report("r1", "2024-01-02T00:00:00Z")],
+        None,
+        [_report("r3", "2024-01-04T00:00:00Z")],
+    ]
+
+    result, watermark = _sync(tmp_path, pages)
+
+    assert not result.complete
+    assert result.fetched == 1
+    assert result.watermark == WATERMARK
+    assert watermark == WATERMARK
+
+
+def test_sync_keeps_the_watermark_at_the_page_limit(tmp_path):
+    pages = [
+        [_report("r1", "2024-01-02T00:00:00Z")],
+        [_report("r2", "2024-01-03T00:00:00Z")],
+    ]
+
+    result, watermark = _sync(tmp_path, pages, page_limit=1)
+
+    assert not result.complete
+    assert result.stored == 1
+    assert watermark == WATERMARK
+
+
+def test_targets_support_change_queries():
+    assert all(
+        target.endpoint in caic_client.CHANGES_ENDPOINTS
+        for target in sync.TARGETS.values()
+    )
+
+
+def test_iter_changes_rejects_endpoints_without_updated_at():
+    async def run():
+        client = caic_client.CaicClient()
+        try:
+            async for _ in client.iter_changes(
+                caic_client.CaicApiEndpoints.AVY_OBS,
+                models.AvalancheObservation,
+                "2024-01-01",
+            ):
+                pass
+        finally:
+            await client.close()
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
@@ -0,0 +1,86 @@
+"""Tests for SyncCaicClient."""
+
+# pylint: disable=W0212
+
+import json
+import logging
+
+from caic_python import client as caic_client
+from caic_python import models
+
+REPORT = {"id": "r1", "type": "observation_report"}
+
+
+def _client(bodies):
+    """A sync client that answers each request with the next body."""
+
+    client = caic_client.SyncCaicClient()
+    requests = []
+
+    def get_raw(url, params=None):
+        requests.append((url, dict(params or {})))
+        return bodies[len(requests) - 1]
+
+    client._get_raw = get_raw
+    return client, requests
+
+
+def test_paginate_get_logs_instead_of_printing(capsys, caplog):
+    client, requests = _client([json.dumps([REPORT]).encode()])
+
+    with caplog.at_level(logging.DEBUG):
+        client._api_paginate_get(2, 10, caic_client.CaicApiEndpoints.OBS_REPORT)
+
+    assert not capsys.readouterr().out
+    assert "Requesting page 2" in caplog.text
+    assert requests[0][1] == {"per": 10, "page": 2}
+
+
+def _counting_loads(decoded):
+    def loads(body):
+        decoded.append(body)
+        return json.loads(body)
+
+    return loads
+
+
+def test_id_get_validates_raw_bytes():
+    decoded = []
+    client, _ = _client([json.dumps(REPORT).encode(), b'{"id": "r2"}'])
+    client.loads = _counting_loads(decoded)
+    endpoint = caic_client.CaicApiEndpoints.OBS_REPORT
+
+    report = client._api_id_get("r1", endpoint, models.FieldReport)
+    invalid = client._api_id_get("r2", endpoint, models.FieldReport)
+
+    assert report.id == "r1"
+    assert invalid is None
+    assert not decoded
+
+
+def test_id_get_can_decode_with_loads():
+    decoded = []
+    client, _ = _client([json.dumps(REPORT).encode()])
+    client.loads = _counting_loads(decoded)
+    client.validate_json = False
+
+    report = client._api_id_get(
+        "r1", caic_client.CaicApiEndpoints.OBS_REPORT, models.FieldReport
+    )
+
+    assert report.id == "r1"
+    assert len(decoded) == 1
+
+
+def test_paginator_retries_invalid_pages_and_stops_at_a_short_page():
+    full = json.dumps([REPORT, {**REPORT, "id": "r2"}]).encode()
+    client, requests = _client(
+        [full, b'[{"id": "bad"}]', json.dumps([{**REPORT, "id": "r3"}]).encode()]
+    )
+
+    reports = client._api_paginator(
+        caic_client.CaicApiEndpoints.OBS_REPORT, models.FieldReport, None, per=2
+    )
+
+    assert [report.id for report in reports] == ["r1", "r2", "r3"]
+    assert [params["page"] for _, params in requests] == [1, 2, 2]
@@ -0,0 +1,53 @@
+"""Tests for caic_python._writers."""
+
+import csv
+import io
+
+import pydantic
+import pytest
+
+from caic_python import _writers
+from caic_python import models
+
+
+class _Stream(io.StringIO):
+    def close(self):
+        pass
+
+
+def test_record_writer_is_abstract():
+    with pytest.raises(TypeError):
+        _writers.RecordWriter(io.StringIO())  # pylint: disable=E0110
+
+
+class _Avalanche(pydantic.BaseModel):
+    id: str
+    danger: int | None = None
+
+
+class _Regional(pydantic.BaseModel):
+    id: str
+    message: str | None = None
+
+
+def test_csv_writer_writes_the_union_of_models():
+    stream = _Stream()
+    writer = _writers.CsvWriter(stream, (_Avalanche, _Regional))
+
+    writer.write(_Avalanche(id="f1", danger=2))
+    writer.write(_Regional(id="f2", message="Windy"))
+    writer.close()
+
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert rows == [
+        {"id": "f1", "danger": "2", "message": ""},
+        {"id": "f2", "danger": "", "message": "Windy"},
+    ]
+
+
+def test_csv_writer_rejects_another_model():
+    writer = _writers.CsvWriter(_Stream())
+    writer.write(models.AvalancheObservation(id="a1"))
+
+    with pytest.raises(ValueError):
+        writer.write(models.FieldReport(id="r1", type="observation_report"))
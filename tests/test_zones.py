@@ -0,0 +1,146 @@
+"""Tests for caic_python.zones."""
+
+import asyncio
+import datetime
+import json
+import os
+import time
+
+import pytest
+
+zones = pytest.importorskip("caic_python.zones")
+
+SQUARE = [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0], [0.0, 0.0]]
+HOLE = [[4.0, 4.0], [6.0, 4.0], [6.0, 6.0], [4.0, 6.0], [4.0, 4.0]]
+# A "U" whose notch reaches down to y=5, so rays at y=5 and y=10 pass through
+# vertices and along horizontal edges.
+U_SHAPE = [
+    [0.0, 0.0],
+    [10.0, 0.0],
+    [10.0, 10.0],
+    [7.0, 10.0],
+    [7.0, 5.0],
+    [3.0, 5.0],
+    [3.0, 10.0],
+    [0.0, 10.0],
+]
+
+
+def _feature(rings, zone_id="z1", zone_type=zones.BC_ZONE, kind="Polygon"):
+    return {
+        "type": "Feature",
+        "properties": {"id": zone_id, "type": zone_type},
+        "geometry": {"type": kind, "coordinates": rings},
+    }
+
+
+def _zone(rings, kind="Polygon"):
+    return zones.zone_of_feature(_feature(rings, kind=kind))
+
+
+def _contains(zone, points):
+    lats = [lat for lat, _ in points]
+    lons = [lon for _, lon in points]
+    return zones.contains(zone, lats, lons).tolist()
+
+
+def test_contains_closed_and_open_rings_agree():
+    points = [(5.0, 5.0), (0.5, 9.5), (11.0, 5.0), (5.0, -1.0)]
+
+    closed = _contains(_zone([SQUARE]), points)
+    opened = _contains(_zone([SQUARE[:-1]]), points)
+
+    assert closed == opened == [True, True, False, False]
+
+
+def test_contains_excludes_holes():
+    zone = _zone([SQUARE, HOLE])
+
+    assert _contains(zone, [(5.0, 5.0), (2.0, 2.0), (5.0, 7.0)]) == [
+        False,
+        True,
+        True,
+    ]
+
+
+def test_contains_multipolygon_parts():
+    far = [[[x + 20.0, y] for x, y in SQUARE]]
+    zone = _zone([[SQUARE], far], kind="MultiPolygon")
+
+    assert _contains(zone, [(5.0, 5.0), (5.0, 25.0), (5.0, 15.0)]) == [
+        True,
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize(
+    "lat, lon, inside",
+    [
+        (5.0, 1.0, True),  # ray through the notch's bottom corners
+        (7.0, 5.0, False),  # in the notch
+        (7.0, 1.0, True),
+        (7.0, 9.0, True),
+        (4.9, 5.0, True),  # just below the notch
+        (9.9, 8.0, True),  # just below a horizontal top edge
+        (10.1, 8.0, False),
+    ],
+)
+def test_contains_concave_edges(lat, lon, inside):
+    assert _contains(_zone([U_SHAPE]), [(lat, lon)]) == [inside]
+
+
+def test_contains_no_points():
+    assert not _contains(_zone([SQUARE]), [])
+
+
+def test_assign_skips_missing_locations_and_filters_types():
+    index = zones.ZoneIndex.from_geojson(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                _feature([SQUARE], "hwy", zones.HWY_ZONE),
+                _feature([SQUARE], "bc", zones.BC_ZONE),
+            ],
+        }
+    )
+
+    assert index.assign([5.0, None, 50.0], [5.0, 5.0, 50.0]).tolist() == [
+        "hwy",
+        None,
+        None,
+    ]
+    assert index.assign([5.0], [5.0], zones.BC_ZONE).tolist() == ["bc"]
+
+
+def test_assign_fails_without_zones_of_the_type():
+    index = zones.ZoneIndex.from_geojson(_feature([SQUARE], zone_type=None))
+
+    assert index.locate(5.0, 5.0).id == "z1"
+    with pytest.raises(ValueError):
+        index.assign([5.0], [5.0], zones.BC_ZONE)
+
+
+class _Client:
+    def __init__(self):
+        self.calls = 0
+
+    async def zones_map(self):
+        self.calls += 1
+        return {"type": "FeatureCollection", "features": [_feature([SQUARE])]}
+
+
+def test_fetch_refetches_an_old_cache_file(tmp_path):
+    path = tmp_path / "zones.json"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": []}))
+    client = _Client()
+
+    assert not asyncio.run(zones.ZoneIndex.fetch(client, path))
+    assert client.calls == 0
+
+    stale = time.time() - datetime.timedelta(days=8).total_seconds()
+    os.utime(path, (stale, stale))
+
+    assert len(asyncio.run(zones.ZoneIndex.fetch(client, path))) == 1
+    assert client.calls == 1
+    assert len(zones.ZoneIndex.load(path)) == 1